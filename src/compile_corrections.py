@@ -0,0 +1,17 @@
+""" Script for compiling the table of known misspellings.
+
+    The table is built from the list of common misspellings and the query
+    log, and consulted by the spelling check before any distance search.
+"""
+
+from config import CORRECTIONS_FILENAME
+from services.spellchecker_service import spellchecker_service
+
+
+def main():
+    count = spellchecker_service.compile_corrections()
+    print(f"Compiled {count} known misspellings into data/{CORRECTIONS_FILENAME}.")
+
+
+if __name__ == "__main__":
+    main()
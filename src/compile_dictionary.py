@@ -0,0 +1,22 @@
+""" Script for compiling the wordlist into a binary dictionary snapshot.
+
+    The snapshot is memory-mapped at startup instead of rebuilding the trie
+    from the wordlist, as long as the wordlist has not been changed and the
+    double-array trie is used (TRIE_TYPE=array).
+"""
+
+from config import SNAPSHOT_FILENAME, TRIE_TYPE, WORDLIST_FILENAME
+from repositories.snapshot_repository import snapshot_repository
+from repositories.wordlist_repository import wordlist_repository
+
+
+def main():
+    checksum = wordlist_repository.get_checksum()
+    snapshot_repository.compile(wordlist_repository.get_wordlist(), checksum)
+    print(f"Compiled {WORDLIST_FILENAME} into data/{SNAPSHOT_FILENAME}.")
+    if TRIE_TYPE != "array":
+        print("The snapshot is only used with TRIE_TYPE=array.")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,3 +14,23 @@ WORDLIST_PATH = os.path.join(dirname, "..", "data", WORDLIST_FILENAME)
 
 SPELLING_ERRORS_FILENAME = os.getenv("SPELLING_ERRORS_FILENAME") or "wikipedia-spelling-errors.txt"
 SPELLING_ERRORS_PATH = os.path.join(dirname, "..", "data", SPELLING_ERRORS_FILENAME)
+
+SNAPSHOT_FILENAME = os.getenv("SNAPSHOT_FILENAME") or "dictionary.snapshot"
+SNAPSHOT_PATH = os.path.join(dirname, "..", "data", SNAPSHOT_FILENAME)
+
+TRIE_TYPE = os.getenv("TRIE_TYPE") or "dense"
+
+BASELINE_BACKEND = os.getenv("BASELINE_BACKEND") or "python"
+
+BASELINE_PREFILTER = os.getenv("BASELINE_PREFILTER") or "none"
+
+SYMSPELL_MAX_EDIT = int(os.getenv("SYMSPELL_MAX_EDIT") or 2)
+
+CACHE_SIZE = int(os.getenv("CACHE_SIZE") or 1024)
+
+CORRECTIONS_FILENAME = os.getenv("CORRECTIONS_FILENAME") or "corrections.txt"
+CORRECTIONS_PATH = os.path.join(dirname, "..", "data", CORRECTIONS_FILENAME)
+
+QUERY_LOG_FILENAME = os.getenv("QUERY_LOG_FILENAME")
+QUERY_LOG_PATH = (os.path.join(dirname, "..", "data", QUERY_LOG_FILENAME)
+                  if QUERY_LOG_FILENAME else None)
@@ -0,0 +1,306 @@
+from array import array
+from entities.length_bounds import KeyLengthsMixin, TraversalMixin
+from services.alphabet_utils import(
+    CHAR_COUNT,
+    calc_index
+)
+
+FREE = -1
+ROOT = 0
+
+
+class ArrayTrie(KeyLengthsMixin, TraversalMixin):
+    """Class describing a trie stored as a double-array.
+
+    The whole trie is kept in three contiguous arrays instead of
+    separate node objects. The nodes of the trie are called states
+    and are represented by integers (indices in the arrays).
+    A state t is the child of state s for the character with code c,
+    if base[s] + c == t and check[t] == s. Character codes start from 1,
+    so that the code of a character is its ordinal number in the used
+    alphabet + 1. Unused cells are marked with FREE in the check array.
+    A fourth array holds the lengths of the shortest and the longest key
+    suffix below every state (at indices 2s and 2s + 1), which the searches
+    use for pruning.
+
+    Based on Jun-ichi Aoe's paper "An Efficient Digital Search Algorithm
+    by Using a Double-Array Structure" (1989).
+    """
+
+    def __init__(self, buffers=None, max_keylength=0, size=None):
+        """The class constructor.
+
+        The buffers can also be read-only memoryviews, for example of a
+        memory-mapped file. They are copied into arrays the first time
+        the trie is modified.
+
+        Args:
+            buffers: An optional tuple of buffers in the order returned by
+                     get_buffers: the base values of the states, the parent
+                     states of the states (integers), the lengths of the
+                     shortest and the longest key suffix below the states
+                     (short integers, two per state), and whether the states
+                     are valid endings for a key (bytes).
+            max_keylength: The length of the longest key in the given buffers
+                           as an integer. Defaults to 0.
+            size: The number of keys in the given buffers as an integer.
+                  Counted from the terminal buffer if not given.
+        """
+
+        if buffers is None:
+            buffers = (array("i", [0] * CHAR_COUNT * 2), array("i", [FREE] * CHAR_COUNT * 2),
+                       array("h", [0] * CHAR_COUNT * 4), array("b", bytes(CHAR_COUNT * 2)))
+            buffers[1][ROOT] = ROOT
+
+        self._base, self._check, self._length_bounds, self._terminal = buffers
+        self._max_keylength = max_keylength
+        self._size = sum(self._terminal) if size is None else size
+        self._keys_per_length = {} if self._size == 0 else None
+        self._used = None
+
+    def add(self, key: str):
+        """Adds keys to the trie.
+
+        Args:
+            key: The key to be added as a string.
+        """
+
+        self._make_writable()
+
+        state = ROOT
+        length = len(key)
+        if not self._size:
+            self._length_bounds[2 * ROOT] = length
+        self._extend_length_bounds(state, length)
+
+        for char in key.lower():
+            length -= 1
+            code = calc_index(char) + 1
+            child = self._get_child(state, code)
+            if child is None:
+                child = self._add_child(state, code)
+                self._length_bounds[2 * child] = length
+            state = child
+            self._extend_length_bounds(state, length)
+
+        if not self._terminal[state]:
+            self._terminal[state] = 1
+            self._add_length(len(key))
+
+    def remove(self, key: str):
+        """Removes keys from the trie.
+
+        States that are left without children and do not end another key
+        are freed as well, and the length bounds of the remaining states
+        on the path of the key are recalculated.
+
+        Args:
+            key: The key to be removed as a string.
+
+        Returns:
+            True if the key was removed, False if it was not found in the trie.
+        """
+
+        path = []
+        state = ROOT
+
+        for char in key.lower():
+            state = self._get_child(state, calc_index(char) + 1)
+            if state is None:
+                return False
+            path.append(state)
+
+        if not self._terminal[state]:
+            return False
+
+        self._make_writable()
+        self._terminal[state] = 0
+        self._remove_length(len(key))
+
+        for state in reversed(path):
+            if self._terminal[state] or self.get_children(state):
+                self._update_length_bounds(state)
+            else:
+                self._free(state)
+        self._update_length_bounds(ROOT)
+
+        return True
+
+    def find(self, key: str):
+        """Searches for the given key in the trie
+
+        Args:
+            key: The string to be searched for.
+
+        Returns:
+            True if the key was found, otherwise False.
+        """
+
+        state = ROOT
+
+        for char in key.lower():
+            state = self._get_child(state, calc_index(char) + 1)
+            if state is None:
+                return False
+
+        return self._terminal[state] == 1
+
+    def get_root(self):
+        """Returns the root state of the trie.
+
+        Returns:
+            The root state as an integer.
+        """
+
+        return ROOT
+
+    def get_children(self, state: int):
+        """Returns the existing children of a state.
+
+        Args:
+            state: The state as an integer.
+
+        Returns:
+            A list of (index, child state) tuples in alphabetical order. The index
+            is the ordinal number of the character in the used alphabet.
+        """
+
+        base = self._base[state]
+        check = self._check
+        end = min(base + CHAR_COUNT + 1, len(check))
+        return [(child - base - 1, child) for child in range(base + 1, end)
+                if check[child] == state]
+
+    def is_valid_end(self, state: int):
+        """Checks whether a state is a valid ending for a key.
+
+        Args:
+            state: The state as an integer.
+
+        Returns:
+            True if the state ends a key, otherwise False.
+        """
+
+        return self._terminal[state] == 1
+
+    def get_length_bounds(self, state: int):
+        """Returns the lengths of the shortest and the longest key suffix
+        below a state.
+
+        Args:
+            state: The state as an integer.
+
+        Returns:
+            A tuple containing the minimum and the maximum number of characters
+            following the state in any key.
+        """
+
+        return self._length_bounds[2 * state], self._length_bounds[2 * state + 1]
+
+    def get_buffers(self):
+        """Returns the arrays holding the trie.
+
+        Returns:
+            A tuple containing the base, check, length bounds and terminal arrays.
+        """
+
+        return self._base, self._check, self._length_bounds, self._terminal
+
+    def _make_writable(self):
+        if self._used is not None:
+            return
+        if not isinstance(self._base, array):
+            self._base = array("i", self._base)
+            self._check = array("i", self._check)
+            self._length_bounds = array("h", self._length_bounds)
+            self._terminal = array("b", self._terminal)
+        self._used = bytearray(state != FREE for state in self._check)
+        if self._keys_per_length is None:
+            self._keys_per_length = {}
+            for key in self.get_all():
+                self._keys_per_length[len(key)] = self._keys_per_length.get(len(key), 0) + 1
+
+    def _get_child(self, state: int, code: int):
+        child = self._base[state] + code
+        if child < len(self._check) and self._check[child] == state:
+            return child
+        return None
+
+    def _add_child(self, state: int, code: int):
+        codes = [index + 1 for index, _ in self.get_children(state)]
+        child = self._base[state] + code
+        while child >= len(self._check):
+            self._grow()
+
+        if not codes:
+            self._base[state] = self._find_base([code])
+        elif self._check[child] != FREE:
+            self._relocate(state, codes, self._find_base(codes + [code]))
+
+        child = self._base[state] + code
+        self._used[child] = 1
+        self._check[child] = state
+        self._base[child] = 0
+        self._terminal[child] = 0
+        self._length_bounds[2 * child:2 * child + 2] = array("h", [0, 0])
+        return child
+
+    def _relocate(self, state: int, codes: list, new_base: int):
+        old_base = self._base[state]
+        for code in codes:
+            old_child = old_base + code
+            new_child = new_base + code
+            self._used[new_child] = 1
+            self._base[new_child] = self._base[old_child]
+            self._terminal[new_child] = self._terminal[old_child]
+            self._length_bounds[2 * new_child:2 * new_child + 2] = \
+                self._length_bounds[2 * old_child:2 * old_child + 2]
+            self._check[new_child] = state
+            for _, grandchild in self.get_children(old_child):
+                self._check[grandchild] = new_child
+            self._free(old_child)
+        self._base[state] = new_base
+
+    def _free(self, state: int):
+        self._check[state] = FREE
+        self._base[state] = 0
+        self._terminal[state] = 0
+        self._length_bounds[2 * state:2 * state + 2] = array("h", [0, 0])
+        self._used[state] = 0
+
+    def _find_base(self, codes: list):
+        codes = sorted(codes)
+        check = self._check
+        position = codes[0]
+        while True:
+            position = self._used.find(0, position)
+            if position == -1 or position + CHAR_COUNT >= len(check):
+                position = max(position, len(check) - CHAR_COUNT)
+                self._grow()
+                continue
+            base = position - codes[0]
+            if all(check[base + code] == FREE for code in codes):
+                return base
+            position += 1
+
+    def _grow(self):
+        extension = len(self._check)
+        self._base.extend(array("i", [0] * extension))
+        self._check.extend(array("i", [FREE] * extension))
+        self._length_bounds.extend(array("h", [0] * extension * 2))
+        self._terminal.extend(array("b", bytes(extension)))
+        self._used.extend(bytes(extension))
+
+    def _extend_length_bounds(self, state: int, length: int):
+        bounds = self._length_bounds
+        bounds[2 * state] = min(bounds[2 * state], length)
+        bounds[2 * state + 1] = max(bounds[2 * state + 1], length)
+
+    def _update_length_bounds(self, state: int):
+        bounds = self._length_bounds
+        lengths = [0] if self._terminal[state] else []
+        children = [child for _, child in self.get_children(state)]
+        bounds[2 * state] = min([bounds[2 * child] + 1 for child in children] + lengths,
+                                default=0)
+        bounds[2 * state + 1] = max([bounds[2 * child + 1] + 1 for child in children]
+                                    + lengths, default=0)
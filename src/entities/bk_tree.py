@@ -0,0 +1,207 @@
+from heapq import heappop, heappush
+from itertools import count
+from services.distance_service import calculate_dl_distance
+
+
+class BKNode:
+    """A class representing a node in a BKTree data structure
+
+    Attributes:
+        word: The word stored in the node.
+        children: A dict where the keys are distances to the word and the
+                  values child nodes with words at that distance.
+        deleted: A boolean describing if the word has been removed from the tree.
+    """
+
+    __slots__ = ("word", "children", "deleted")
+
+    def __init__(self, word: str):
+        """ The class constructor.
+
+        Args:
+            word: The word stored in the node.
+        """
+
+        self.word = word
+        self.children = {}
+        self.deleted = False
+
+
+class BKTree:
+    """Class describing a BK-tree (Burkhard-Keller tree).
+
+    Every word below a node is stored in the subtree of the child whose key
+    is the distance between the word and the word of the node. Because the
+    distance is a metric, the triangle inequality gives a lower bound for the
+    distances to all words in a subtree, so whole subtrees can be skipped
+    without calculating any distances.
+
+    Removed keys are only marked as deleted (tombstones), as the keys below
+    a node are placed by their distances to the key of the node. A deleted key
+    is still used for navigating the tree, but it is never returned.
+    """
+
+    def __init__(self, distance=calculate_dl_distance):
+        """The class constructor.
+
+        Args:
+            distance: A function taking two words and returning the distance
+                      between them. Must be a metric. Defaults to the
+                      Damerau-Levenshtein distance.
+        """
+
+        self._root = None
+        self._size = 0
+        self._distance = distance
+
+    def add(self, key: str):
+        """Adds keys to the BK-tree.
+
+        Args:
+            key: The key to be added as a string.
+        """
+
+        key = key.lower()
+        if not self._root:
+            self._root = BKNode(key)
+            self._size = 1
+            return
+
+        node = self._root
+        while True:
+            dist = self._distance(key, node.word)
+            if dist == 0:
+                if node.deleted:
+                    node.deleted = False
+                    self._size += 1
+                return
+            if dist not in node.children:
+                node.children[dist] = BKNode(key)
+                self._size += 1
+                return
+            node = node.children[dist]
+
+    def remove(self, key: str):
+        """Removes keys from the BK-tree by marking them as deleted.
+
+        Args:
+            key: The key to be removed as a string.
+
+        Returns:
+            True if the key was removed, False if it was not found in the tree.
+        """
+
+        key = key.lower()
+        node = self._root
+        while node:
+            dist = self._distance(key, node.word)
+            if dist == 0:
+                if node.deleted:
+                    return False
+                node.deleted = True
+                self._size -= 1
+                return True
+            node = node.children.get(dist)
+        return False
+
+    def find(self, key: str):
+        """Searches for keys in the BK-tree.
+
+        Args:
+            key: The key to search for as a string.
+
+        Returns:
+            True if the key was found, False otherwise.
+        """
+
+        return bool(self.search(key.lower(), 0))
+
+    def search(self, key: str, max_dist):
+        """Finds all keys within the given distance (a range query).
+
+        Args:
+            key: The word to be matched as a string.
+            max_dist: The maximum distance allowed.
+
+        Returns:
+            A list of (distance, key) tuples, ordered by distance and
+            alphabetically within the same distance.
+        """
+
+        results = []
+        stack = [self._root] if self._root else []
+        while stack:
+            node = stack.pop()
+            dist = self._distance(key, node.word)
+            if dist <= max_dist and not node.deleted:
+                results.append((dist, node.word))
+            stack.extend(child for edge, child in node.children.items()
+                         if dist - max_dist <= edge <= dist + max_dist)
+        return sorted(results)
+
+    def find_nearest(self, key: str, max_dist=None):
+        """Finds the keys closest to the given word.
+
+        Subtrees are visited in order of the lower bound for their distances,
+        and skipped when the bound exceeds the smallest distance found so far.
+
+        Args:
+            key: The word to be matched as a string.
+            max_dist: The maximum distance allowed. Defaults to None.
+
+        Returns:
+            A (distance, keys) tuple with the smallest distance and a list of the
+            keys with that distance in alphabetical order, or (None, []) if no
+            keys were found within the maximum distance.
+        """
+
+        best_dist = max_dist if max_dist else float("inf")
+        best_words = []
+        sequence = count()
+        queue = [(0, next(sequence), self._root)] if self._root else []
+
+        while queue:
+            bound, _, node = heappop(queue)
+            if bound > best_dist:
+                break
+
+            dist = self._distance(key, node.word)
+            if not node.deleted and dist <= best_dist:
+                if dist < best_dist:
+                    best_dist = dist
+                    best_words = []
+                best_words.append(node.word)
+
+            for edge, child in node.children.items():
+                child_bound = abs(dist - edge)
+                if child_bound <= best_dist:
+                    heappush(queue, (child_bound, next(sequence), child))
+
+        if not best_words:
+            return None, []
+        return best_dist, sorted(best_words)
+
+    def get_all(self):
+        """Returns all keys in the BK-tree.
+
+        Returns:
+            A list of all keys in alphabetical order.
+        """
+
+        words = []
+        stack = [self._root] if self._root else []
+        while stack:
+            node = stack.pop()
+            if not node.deleted:
+                words.append(node.word)
+            stack.extend(node.children.values())
+        return sorted(words)
+
+    def get_size(self):
+        """Returns the number of keys in the BK-tree.
+
+        Returns:
+            The number of keys as an integer.
+        """
+
+        return self._size
@@ -0,0 +1,86 @@
+from entities.length_bounds import LengthBoundsMixin
+
+
+class CompactNode(LengthBoundsMixin):
+    """A memory efficient alternative to the Node class.
+
+    Instead of reserving a cell for every character in the alphabet,
+    the node only stores the children that actually exist. A bitmap
+    tells which characters have a child, and the children themselves
+    are packed into a tuple in alphabetical order. The position of a
+    child in the tuple is the number of set bits below the bit of its
+    character.
+
+    Attributes:
+        is_valid_end: A boolean describing if the node is a valid ending
+                      for a word.
+        min_length: The length of the shortest key suffix below the node.
+        max_length: The length of the longest key suffix below the node.
+    """
+
+    __slots__ = ("_bitmap", "_children")
+
+    def __init__(self):
+        """ The class constructor.
+        """
+
+        self.is_valid_end = False
+        self._bitmap = 0
+        self._children = ()
+        self.min_length = 0
+        self.max_length = 0
+
+    def get_child(self, index: int):
+        """Returns the child node for the character with the given index.
+
+        Args:
+            index: The ordinal number of the character in the used alphabet.
+
+        Returns:
+            The child node, or None if there is no child for the character.
+        """
+
+        bit = 1 << index
+        if not self._bitmap & bit:
+            return None
+        return self._children[self._position(bit)]
+
+    def set_child(self, index: int, child):
+        """Sets the child node for the character with the given index.
+
+        Args:
+            index: The ordinal number of the character in the used alphabet.
+            child: The child node. None removes the existing child.
+        """
+
+        bit = 1 << index
+        position = self._position(bit)
+
+        if self._bitmap & bit:
+            if child:
+                self._children = (self._children[:position] + (child,)
+                                  + self._children[position+1:])
+            else:
+                self._children = self._children[:position] + self._children[position+1:]
+                self._bitmap &= ~bit
+        elif child:
+            self._children = self._children[:position] + (child,) + self._children[position:]
+            self._bitmap |= bit
+
+    def get_children(self):
+        """Returns the existing children of the node.
+
+        Returns:
+            A list of (index, child node) tuples in alphabetical order.
+        """
+
+        children = []
+        bitmap = self._bitmap
+        for child in self._children:
+            lowest_bit = bitmap & -bitmap
+            children.append((lowest_bit.bit_length() - 1, child))
+            bitmap ^= lowest_bit
+        return children
+
+    def _position(self, bit: int):
+        return bin(self._bitmap & (bit - 1)).count("1")
@@ -0,0 +1,176 @@
+from entities.compact_node import CompactNode
+from entities.length_bounds import NodeTrieMixin
+from services.alphabet_utils import calc_index
+
+
+class Dawg(NodeTrieMixin):
+    """Class describing a directed acyclic word graph (DAWG).
+
+    A DAWG is a trie where nodes with identical sets of suffixes are merged,
+    so that common endings (for example -ing, -tion, -ed) are only stored once.
+    The graph is built with the incremental algorithm for sorted input
+    described by Daciuk, Mihov, Watson and Watson in "Incremental
+    Construction of Minimal Acyclic Finite-State Automata" (2000).
+
+    Keys added in alphabetical order are inserted directly. Keys added out
+    of order, as well as removed keys, are collected and the graph is rebuilt
+    from all keys the next time it is read, which means that loading an
+    unsorted wordlist only triggers one rebuild. Once the graph has been read,
+    its nodes are shared and cannot be modified, so every later change (such
+    as a word added by the user) makes the next read rebuild the whole graph
+    in O(n) time, where n is the total length of the keys.
+    """
+
+    def __init__(self):
+        """The class constructor.
+        """
+
+        self._root = CompactNode()
+        self._max_keylength = 0
+        self._size = 0
+        self._previous_key = ""
+        self._unchecked = []
+        # The minimized nodes by signature, or None once the graph is finished.
+        self._register = {}
+        self._pending = []
+        self._removed = set()
+
+    def add(self, key: str):
+        """Adds keys to the DAWG.
+
+        If the DAWG has already been read, or the key is not greater than the
+        previously added key, the key is only inserted when the graph is
+        rebuilt on the next read.
+
+        Args:
+            key: The key to be added as a string.
+        """
+
+        key = key.lower()
+        self._removed.discard(key)
+        if self._register is None or key <= self._previous_key or self._pending:
+            self._pending.append(key)
+            return
+
+        self._insert(key)
+
+    def remove(self, key: str):
+        """Removes keys from the DAWG.
+
+        Args:
+            key: The key to be removed as a string.
+
+        Returns:
+            True if the key was removed, False if it was not found in the DAWG.
+        """
+
+        key = key.lower()
+        if not self.find(key):
+            return False
+
+        self._removed.add(key)
+        return True
+
+    def get_root(self):
+        """Returns the root node of the DAWG.
+
+        Pending keys are added and the graph is minimized before the root
+        is returned.
+
+        Returns:
+            The root node as a CompactNode-object.
+        """
+
+        if self._pending or self._removed:
+            self._rebuild()
+        if self._register is not None:
+            self._minimize(0)
+            self._root.update_length_bounds()
+            self._register = None
+        return self._root
+
+    def get_size(self):
+        """ Returns the number of keys in the DAWG.
+
+        Returns:
+            The key count as an integer.
+        """
+
+        self.get_root()
+        return self._size
+
+    def get_max_keylength(self):
+        """Returns the length of the longest key in the DAWG.
+
+        Returns:
+            The length of the longest key as an integer.
+        """
+
+        self.get_root()
+        return self._max_keylength
+
+    def get_node_count(self):
+        """Returns the number of distinct nodes in the DAWG.
+
+        Returns:
+            The node count as an integer.
+        """
+
+        nodes = set()
+        stack = [self.get_root()]
+        while stack:
+            node = stack.pop()
+            if id(node) not in nodes:
+                nodes.add(id(node))
+                stack.extend(child for _, child in node.get_children())
+        return len(nodes)
+
+    def _insert(self, key: str):
+        common = 0
+        for char_a, char_b in zip(key, self._previous_key):
+            if char_a != char_b:
+                break
+            common += 1
+
+        self._minimize(common)
+
+        node = self._unchecked[-1][2] if self._unchecked else self._root
+        for char in key[common:]:
+            child = CompactNode()
+            self._unchecked.append((node, calc_index(char), child))
+            node.set_child(calc_index(char), child)
+            node = child
+
+        node.is_valid_end = True
+        self._previous_key = key
+        self._size += 1
+        self._max_keylength = max(self._max_keylength, len(key))
+
+    def _minimize(self, down_to: int):
+        while len(self._unchecked) > down_to:
+            parent, index, child = self._unchecked.pop()
+            child.update_length_bounds()
+            signature = self._signature(child)
+            if signature in self._register:
+                parent.set_child(index, self._register[signature])
+            else:
+                self._register[signature] = child
+
+    def _signature(self, node):
+        return (node.is_valid_end,
+                tuple((i, id(child)) for i, child in node.get_children()))
+
+    def _rebuild(self):
+        keys = []
+        self._traverse(self._root, "", keys)
+        keys = sorted(set(keys).union(self._pending).difference(self._removed))
+        self._root = CompactNode()
+        self._max_keylength = 0
+        self._size = 0
+        self._previous_key = ""
+        self._unchecked = []
+        self._register = {}
+        self._pending = []
+        self._removed = set()
+        for key in keys:
+            self._insert(key)
@@ -0,0 +1,134 @@
+class DLAutomaton:
+    """Class describing a deterministic automaton accepting the words within
+    a given Damerau-Levenshtein distance of a word.
+
+    A state of the automaton corresponds to the latest rows of the
+    Damerau-Levenshtein matrix of the word and the input read so far, with
+    values capped at max_dist + 1. In the unrestricted Damerau-Levenshtein
+    distance, two transposed characters may have other characters between
+    them, which are deleted or inserted at a cost of 1 each. Within max_dist,
+    at most max_dist - 1 characters can be between them, so a state holds the
+    latest max_dist + 1 rows and the positions in the word of the latest
+    max_dist input characters.
+
+    The states are created lazily, and the transitions are memoized, so
+    the rows are only calculated the first time a state is left with a new
+    character. A transition only depends on where the input character occurs
+    in the word, so all characters not in the word share the same transitions.
+    """
+
+    def __init__(self, word: str, max_dist: int):
+        """The class constructor.
+
+        Args:
+            word: The word to be matched as a string.
+            max_dist: The maximum Damerau-Levenshtein distance accepted as an integer.
+        """
+
+        self._length = len(word)
+        self._max_dist = max_dist
+        self._masks = {}
+        for position, char in enumerate(word):
+            self._masks[char] = self._masks.get(char, 0) | 1 << position
+
+        cap = max_dist + 1
+        self._capped_row = (cap,) * (self._length + 1)
+        first_row = tuple(min(col, cap) for col in range(self._length + 1))
+        start_state = ((first_row,) + (self._capped_row,) * max_dist, (0,) * max_dist)
+        self._states = [start_state]
+        self._state_ids = {start_state: 0}
+        self._transitions = {}
+
+    def get_start_state(self):
+        """Returns the start state of the automaton.
+
+        Returns:
+            The start state as an integer.
+        """
+
+        return 0
+
+    def step(self, state: int, char: str):
+        """Moves the automaton to the next state.
+
+        Args:
+            state: The current state as an integer.
+            char: The input character as a string.
+
+        Returns:
+            The next state as an integer, or None if no word starting with the
+            input read so far is accepted.
+        """
+
+        key = (state, self._masks.get(char, 0))
+        if key not in self._transitions:
+            self._transitions[key] = self._calculate_state(*key)
+        return self._transitions[key]
+
+    def get_distance(self, state: int):
+        """Returns the distance of the input read so far, if it is accepted.
+
+        Args:
+            state: The state as an integer.
+
+        Returns:
+            The Damerau-Levenshtein distance between the word and the input
+            as an integer, or None if the distance exceeds the maximum distance.
+        """
+
+        dist = self._states[state][0][0][-1]
+        return dist if dist <= self._max_dist else None
+
+    def get_state_count(self):
+        """Returns the number of states created so far.
+
+        Returns:
+            The number of states as an integer.
+        """
+
+        return len(self._states)
+
+    def _calculate_state(self, state: int, mask: int):
+        rows, masks = self._states[state]
+        row = rows[0]
+        cap = self._max_dist + 1
+        new_row = [min(row[0] + 1, cap)]
+
+        for col in range(1, self._length + 1):
+            dist = min(
+                row[col-1] + (0 if mask >> (col-1) & 1 else 1),
+                new_row[col-1] + 1,
+                row[col] + 1
+            )
+            if mask:
+                dist = min(dist, self._calculate_transposition(rows, masks, mask, col))
+            new_row.append(min(dist, cap))
+
+        # Older rows are only needed as the start of a transposition whose
+        # first character is the input character read right after the row.
+        new_masks = ((mask,) + masks[:-1]) if masks else ()
+        new_rows = (tuple(new_row),) + tuple(
+            old_row if new_masks[position] else self._capped_row
+            for position, old_row in enumerate(rows[:-1])
+        )
+        if min(new_row) > self._max_dist and all(
+                min(old_row) >= self._max_dist for old_row in new_rows[1:]):
+            return None
+
+        new_state = (new_rows, new_masks)
+        if new_state not in self._state_ids:
+            self._state_ids[new_state] = len(self._states)
+            self._states.append(new_state)
+        return self._state_ids[new_state]
+
+    def _calculate_transposition(self, rows: tuple, masks: tuple, mask: int, col: int):
+        # A transposition with gap_rows characters of the input deleted and
+        # gap_cols characters of the word inserted between the transposed ones.
+        dist = self._max_dist + 1
+        for gap_rows in range(self._max_dist):
+            if not masks[gap_rows] >> (col-1) & 1:
+                continue
+            for gap_cols in range(min(self._max_dist - gap_rows, col - 1)):
+                if mask >> (col-2-gap_cols) & 1:
+                    dist = min(dist, rows[gap_rows+1][col-2-gap_cols] + 1 + gap_rows + gap_cols)
+        return dist
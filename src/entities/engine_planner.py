@@ -0,0 +1,135 @@
+class EnginePlanner:
+    """Class describing a planner choosing the fastest search engine for a query.
+
+    The queries are divided into classes by the length of the word, the
+    maximum edit distance and whether neighbouring keys are prioritised. For
+    every class, the planner keeps an exponentially weighted moving average
+    of the search times of every engine, and chooses the engine with the
+    lowest average. Engines without any measurements for a class are chosen
+    first. As the averages of the engines that are not chosen are not
+    updated, every exploration_interval:th query of a class is searched with
+    the engine whose latest measurement is the oldest, among the engines
+    at most exploration_factor times slower than the fastest one.
+    """
+
+    def __init__(self, engines: list, dictionary_size: int, smoothing=0.3,
+                 exploration_interval=50, exploration_factor=4):
+        """The class constructor.
+
+        Args:
+            engines: A list of the names of the engines as strings.
+            dictionary_size: The number of words in the dictionary the search
+                             times are measured with, as an integer.
+            smoothing: The weight of the latest search time in the averages,
+                       as a float between 0 and 1. Defaults to 0.3.
+            exploration_interval: The interval of the queries searched with
+                                  the engine measured least recently, as an
+                                  integer. Defaults to 50.
+            exploration_factor: How many times slower than the fastest engine
+                                an engine can be to still be measured again,
+                                as a number. Defaults to 4.
+        """
+
+        self._engines = engines
+        self._dictionary_size = dictionary_size
+        self._smoothing = smoothing
+        self._exploration_interval = exploration_interval
+        self._exploration_factor = exploration_factor
+        self._latencies = {}
+        self._measured_at = {}
+        self._query_counts = {}
+
+    def get_query_class(self, word: str, max_edit=None, neighbour_check=False):
+        """Returns the class of a query.
+
+        Args:
+            word: The word to be matched as a string.
+            max_edit: The maximum edit distance allowed as an integer, or None.
+            neighbour_check: A boolean indicating whether neighbouring keys
+                             are prioritised.
+
+        Returns:
+            A tuple of the length class of the word (0 for words shorter
+            than 4 characters, 1 for 4-7 characters, 2 for longer words), the
+            maximum edit distance capped at 3 (0 for None) and neighbour_check.
+        """
+
+        return (min(len(word) // 4, 2), min(max_edit, 3) if max_edit else 0,
+                bool(neighbour_check))
+
+    def choose(self, query_class: tuple):
+        """Chooses the engine for a query.
+
+        Args:
+            query_class: The class of the query (see get_query_class).
+
+        Returns:
+            The name of the engine as a string.
+        """
+
+        latencies = self._latencies.get(query_class, {})
+        for engine in self._engines:
+            if engine not in latencies:
+                return engine
+
+        count = self._query_counts.get(query_class, 0) + 1
+        self._query_counts[query_class] = count
+        fastest = min(self._engines, key=latencies.get)
+        if count % self._exploration_interval == 0:
+            measured_at = self._measured_at[query_class]
+            return min((engine for engine in self._engines
+                        if latencies[engine] <= self._exploration_factor * latencies[fastest]),
+                       key=measured_at.get)
+        return fastest
+
+    def record(self, query_class: tuple, engine: str, seconds: float):
+        """Records the search time of an engine.
+
+        Args:
+            query_class: The class of the query (see get_query_class).
+            engine: The name of the engine as a string.
+            seconds: The search time in seconds as a float.
+        """
+
+        latencies = self._latencies.setdefault(query_class, {})
+        if engine in latencies:
+            latencies[engine] += self._smoothing * (seconds - latencies[engine])
+        else:
+            latencies[engine] = seconds
+        self._measured_at.setdefault(query_class, {})[engine] = \
+            self._query_counts.get(query_class, 0)
+
+    def is_calibrated(self, query_class: tuple):
+        """Checks if all engines have been measured for a class of queries.
+
+        Args:
+            query_class: The class of the query (see get_query_class).
+
+        Returns:
+            True if there are search times for every engine, False otherwise.
+        """
+
+        return len(self._latencies.get(query_class, {})) == len(self._engines)
+
+    def get_latency(self, query_class: tuple, engine: str):
+        """Returns the average search time of an engine.
+
+        Args:
+            query_class: The class of the query (see get_query_class).
+            engine: The name of the engine as a string.
+
+        Returns:
+            The average search time in seconds as a float, or None if the
+            engine has not been measured for the class.
+        """
+
+        return self._latencies.get(query_class, {}).get(engine)
+
+    def get_dictionary_size(self):
+        """Returns the size of the dictionary the search times are measured with.
+
+        Returns:
+            The number of words as an integer.
+        """
+
+        return self._dictionary_size
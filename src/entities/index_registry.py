@@ -0,0 +1,152 @@
+from entities.lru_cache import LRUCache
+
+
+class IndexRegistry:
+    """Class describing the indexes built from the words of a dictionary and
+    the cache of search results for the dictionary.
+
+    Every index is registered under a name with a function creating it, and
+    built from the words of the dictionary when it is first requested. When
+    a word is added to or removed from the dictionary, the incremental
+    indexes that have been built are updated with their add and remove
+    methods, and the other indexes are dropped, to be rebuilt when they are
+    requested again. Every change of the dictionary increments its version,
+    which is a part of the keys of the cached results, so a result cached
+    for an older version of the dictionary is never returned. Indexes holding
+    resources, such as worker processes, are closed with their close method
+    when they are dropped.
+    """
+
+    def __init__(self, get_words, cache_size: int):
+        """The class constructor.
+
+        Args:
+            get_words: A function returning a list of all words in the dictionary.
+            cache_size: The maximum number of cached results as an integer.
+        """
+
+        self._get_words = get_words
+        self._factories = {}
+        self._indexes = {}
+        self._cache = LRUCache(cache_size)
+        self._version = 0
+
+    def register(self, name: str, create, key=None, incremental=True):
+        """Registers an index.
+
+        Args:
+            name: The name of the index as a string.
+            create: A function creating the index. An incremental index is created
+                    empty, and the words are added to it one by one. Other indexes
+                    are created from the list of all words given as the argument.
+            key: A function transforming a word into the key stored in the index.
+                 Defaults to None, in which case the word itself is stored.
+            incremental: A boolean indicating whether the index is kept up to date
+                         with its add and remove methods. Defaults to True.
+        """
+
+        self._factories[name] = (create, key or (lambda word: word), incremental)
+        self._drop(name)
+
+    def get(self, name: str):
+        """Returns an index, building it if it has not been built yet.
+
+        Args:
+            name: The name of the index as a string.
+
+        Returns:
+            The index.
+        """
+
+        if name not in self._indexes:
+            create, key, incremental = self._factories[name]
+            if incremental:
+                index = create()
+                for word in self._get_words():
+                    index.add(key(word))
+            else:
+                index = create(self._get_words())
+            self._indexes[name] = index
+        return self._indexes[name]
+
+    def add(self, word: str):
+        """Updates the indexes after a word has been added to the dictionary.
+
+        Args:
+            word: The added word as a string.
+        """
+
+        self._update(word, "add")
+
+    def remove(self, word: str):
+        """Updates the indexes after a word has been removed from the dictionary.
+
+        Args:
+            word: The removed word as a string.
+        """
+
+        self._update(word, "remove")
+
+    def clear(self):
+        """Drops all indexes and cached results, e.g. after the whole dictionary
+        has been replaced.
+        """
+
+        self._version += 1
+        for name in list(self._indexes):
+            self._drop(name)
+        self._cache.clear()
+
+    def get_cached(self, key):
+        """Looks up a cached result for the current version of the dictionary.
+
+        Args:
+            key: The key of the result (any hashable value).
+
+        Returns:
+            The cached result, or None if it was not found.
+        """
+
+        return self._cache.get((key, self._version))
+
+    def put_cached(self, key, result):
+        """Caches a result for the current version of the dictionary.
+
+        Args:
+            key: The key of the result (any hashable value).
+            result: The result to be cached (not None).
+        """
+
+        self._cache.put((key, self._version), result)
+
+    def get_cache_stats(self):
+        """Returns the statistics of the cache (see LRUCache.get_stats).
+
+        Returns:
+            A dict with the number of hits, misses, evictions and cached results.
+        """
+
+        return self._cache.get_stats()
+
+    def get_version(self):
+        """Returns the version of the dictionary.
+
+        Returns:
+            The number of changes of the dictionary as an integer.
+        """
+
+        return self._version
+
+    def _update(self, word: str, method: str):
+        self._version += 1
+        for name in list(self._indexes):
+            _, key, incremental = self._factories[name]
+            if incremental:
+                getattr(self._indexes[name], method)(key(word))
+            else:
+                self._drop(name)
+
+    def _drop(self, name: str):
+        index = self._indexes.pop(name, None)
+        if hasattr(index, "close"):
+            index.close()
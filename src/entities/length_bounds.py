@@ -0,0 +1,180 @@
+from services.alphabet_utils import(
+    calc_char,
+    calc_index
+)
+
+
+class LengthBoundsMixin:
+    """Mixin class for trie nodes storing the lengths of the shortest and the
+    longest key suffix below them.
+
+    The classes using the mixin set the attributes in their constructors, and
+    have a get_children method returning (index, child node) tuples.
+
+    Attributes:
+        is_valid_end: A boolean describing if the node is a valid ending
+                      for a word.
+        min_length: The length of the shortest key suffix below the node.
+        max_length: The length of the longest key suffix below the node.
+    """
+
+    __slots__ = ("is_valid_end", "min_length", "max_length")
+
+    def update_length_bounds(self):
+        """Recalculates the length bounds of the node from its children.
+        """
+
+        lengths = [0] if self.is_valid_end else []
+        children = [child for _, child in self.get_children()]
+        self.min_length = min([child.min_length + 1 for child in children] + lengths,
+                              default=0)
+        self.max_length = max([child.max_length + 1 for child in children] + lengths,
+                              default=0)
+
+
+class KeyLengthsMixin:
+    """Mixin class for tries keeping track of the number of keys and the length
+    of the longest key.
+
+    The number of keys of every length is kept in a dict, so that the length of
+    the longest key can be updated when a key is removed without traversing
+    the trie. The classes using the mixin set the attributes in their
+    constructors (the ArrayTrie of a snapshot only counts the keys per length
+    when it is first modified).
+    """
+
+    _size = 0
+    _keys_per_length = None
+    _max_keylength = 0
+
+    def get_size(self):
+        """ Returns the number of keys in the trie.
+
+        Returns:
+            The key count as an integer.
+        """
+
+        return self._size
+
+    def get_max_keylength(self):
+        """Returns the length of the longest key in the trie.
+
+        Returns:
+            The length of the longest key as an integer.
+        """
+
+        return self._max_keylength
+
+    def _add_length(self, length: int):
+        self._size += 1
+        self._keys_per_length[length] = self._keys_per_length.get(length, 0) + 1
+        self._max_keylength = max(self._max_keylength, length)
+
+    def _remove_length(self, length: int):
+        self._size -= 1
+        self._keys_per_length[length] -= 1
+        if not self._keys_per_length[length]:
+            del self._keys_per_length[length]
+            if length == self._max_keylength:
+                self._max_keylength = max(self._keys_per_length, default=0)
+
+
+class TraversalMixin:
+    """Mixin class for tries listing their keys with a depth-first traversal.
+
+    The classes using the mixin have get_children and is_valid_end methods,
+    and either set the root node as the attribute _root in their constructors
+    or override get_root.
+    """
+
+    _root = None
+
+    def get_all(self):
+        """Returns all keys in the trie
+
+        Returns:
+            A list containing all keys in alphabetical order.
+        """
+
+        keys = []
+        self._traverse(self.get_root(), "", keys)
+        return keys
+
+    def get_root(self):
+        """Returns the root node of the trie.
+
+        Returns:
+            The root node.
+        """
+
+        return self._root
+
+    def _traverse(self, node, key: str, result: list):
+        if self.is_valid_end(node):
+            result.append(key)
+        for index, child in self.get_children(node):
+            self._traverse(child, key+calc_char(index), result)
+
+
+class NodeTrieMixin(TraversalMixin):
+    """Mixin class for tries built from node objects using LengthBoundsMixin,
+    which have get_child and get_children methods (see Node and CompactNode).
+    """
+
+    def find(self, key: str):
+        """Searches for the given key in the trie
+
+        Args:
+            key: The string to be searched for.
+
+        Returns:
+            True if the key was found, otherwise False.
+        """
+
+        node = self.get_root()
+
+        for char in key.lower():
+            node = node.get_child(calc_index(char))
+            if not node:
+                return False
+
+        return node.is_valid_end
+
+    def get_children(self, node):
+        """Returns the existing children of a node.
+
+        Args:
+            node: The node as a Node- or CompactNode-object.
+
+        Returns:
+            A list of (index, child node) tuples in alphabetical order. The index
+            is the ordinal number of the character in the used alphabet.
+        """
+
+        return node.get_children()
+
+    def is_valid_end(self, node):
+        """Checks whether a node is a valid ending for a key.
+
+        Args:
+            node: The node as a Node- or CompactNode-object.
+
+        Returns:
+            True if the node ends a key, otherwise False.
+        """
+
+        return node.is_valid_end
+
+    def get_length_bounds(self, node):
+        """Returns the lengths of the shortest and the longest key suffix
+        below a node.
+
+        Args:
+            node: The node as a Node- or CompactNode-object.
+
+        Returns:
+            A tuple containing the minimum and the maximum number of characters
+            following the node in any key.
+        """
+
+        return node.min_length, node.max_length
@@ -0,0 +1,88 @@
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Class describing a bounded cache evicting the least recently used entry.
+
+    The entries are kept in an ordered dict in the order of their latest use,
+    so both looking up and adding entries take constant time.
+    """
+
+    def __init__(self, capacity: int):
+        """The class constructor.
+
+        Args:
+            capacity: The maximum number of entries as an integer. With
+                      a capacity of 0 nothing is cached.
+        """
+
+        self._capacity = capacity
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key):
+        """Looks up an entry and marks it as the most recently used one.
+
+        Args:
+            key: The key of the entry (any hashable value).
+
+        Returns:
+            The cached value, or None if the key was not found.
+        """
+
+        if key not in self._entries:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key, value):
+        """Adds an entry to the cache, evicting the least recently used entry
+        if the cache is full.
+
+        Args:
+            key: The key of the entry (any hashable value).
+            value: The value to be cached (not None).
+        """
+
+        if self._capacity <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self):
+        """Removes all entries from the cache. The counters are not reset.
+        """
+
+        self._entries.clear()
+
+    def get_size(self):
+        """Returns the number of entries in the cache.
+
+        Returns:
+            The number of entries as an integer.
+        """
+
+        return len(self._entries)
+
+    def get_stats(self):
+        """Returns the hit, miss and eviction counters of the cache.
+
+        Returns:
+            A dict with the number of hits, misses and evictions so far and
+            the current number of entries (under the keys "hits", "misses",
+            "evictions" and "size").
+        """
+
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "size": len(self._entries)
+        }
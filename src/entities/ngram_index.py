@@ -0,0 +1,118 @@
+class NGramIndex:
+    """Class describing an inverted index of character n-grams.
+
+    Every key is split into n-grams, after padding it with n-1 special
+    characters at both ends, and the index maps every n-gram to the keys
+    containing it. An edit operation changes at most n of the n-grams of
+    a word (n+1 for a transposition), so a word within k edits of another word
+    shares at least max(length) + n - 1 - k*(n+1) n-grams with it. Counting
+    the shared n-grams with the posting lists discards most words without
+    calculating any distances.
+    """
+
+    def __init__(self, n=2):
+        """The class constructor.
+
+        Args:
+            n: The length of the n-grams as an integer. Defaults to 2 (bigrams).
+        """
+
+        self._n = n
+        self._postings = {}
+        self._keys_per_length = {}
+
+    def add(self, key: str):
+        """Adds keys to the index.
+
+        Args:
+            key: The key to be added as a string.
+        """
+
+        key = key.lower()
+        keys = self._keys_per_length.setdefault(len(key), set())
+        if key in keys:
+            return
+
+        keys.add(key)
+        for gram, gram_count in self._calculate_grams(key).items():
+            self._postings.setdefault(gram, {})[key] = gram_count
+
+    def remove(self, key: str):
+        """Removes keys from the index.
+
+        Args:
+            key: The key to be removed as a string.
+
+        Returns:
+            True if the key was found and removed, False otherwise.
+        """
+
+        key = key.lower()
+        if not self.find(key):
+            return False
+
+        self._keys_per_length[len(key)].remove(key)
+        for gram in self._calculate_grams(key):
+            del self._postings[gram][key]
+            if not self._postings[gram]:
+                del self._postings[gram]
+        return True
+
+    def find(self, key: str):
+        """Searches for keys in the index.
+
+        Args:
+            key: The key to search for as a string.
+
+        Returns:
+            True if the key was found, False otherwise.
+        """
+
+        return key.lower() in self._keys_per_length.get(len(key), ())
+
+    def lookup(self, key: str, max_dist: int):
+        """Finds the candidate keys for a misspelling.
+
+        Args:
+            key: The misspelled word as a string.
+            max_dist: The maximum Damerau-Levenshtein distance allowed as an integer.
+
+        Returns:
+            A list of all keys in the index that may be within the maximum
+            distance from the given key, in alphabetical order.
+        """
+
+        key = key.lower()
+        shared = {}
+        for gram, gram_count in self._calculate_grams(key).items():
+            for candidate, candidate_count in self._postings.get(gram, {}).items():
+                shared[candidate] = shared.get(candidate, 0) + min(gram_count, candidate_count)
+
+        candidates = []
+        for length in range(max(0, len(key) - max_dist), len(key) + max_dist + 1):
+            min_shared = max(len(key), length) + self._n - 1 - max_dist * (self._n + 1)
+            keys = self._keys_per_length.get(length, ())
+            if min_shared <= 0:
+                candidates.extend(keys)
+            else:
+                candidates.extend(candidate for candidate in keys
+                                  if shared.get(candidate, 0) >= min_shared)
+        return sorted(candidates)
+
+    def get_size(self):
+        """Returns the number of keys in the index.
+
+        Returns:
+            The number of keys as an integer.
+        """
+
+        return sum(len(keys) for keys in self._keys_per_length.values())
+
+    def _calculate_grams(self, key: str):
+        padding = "#" * (self._n - 1)
+        padded = padding + key + padding
+        grams = {}
+        for i in range(len(padded) - self._n + 1):
+            gram = padded[i:i+self._n]
+            grams[gram] = grams.get(gram, 0) + 1
+        return grams
@@ -1,7 +1,8 @@
+from entities.length_bounds import LengthBoundsMixin
 from services.alphabet_utils import CHAR_COUNT
 
 
-class Node:
+class Node(LengthBoundsMixin):
     """A class representing a node in a Trie data structure
 
     Attributes:
@@ -12,11 +13,48 @@ class Node:
                   correspond to the running order of the characters
                   in the used alphabet, where the first character in the alphabet
                   has the index 0.
+        min_length: The length of the shortest key suffix below the node.
+        max_length: The length of the longest key suffix below the node.
     """
 
+    __slots__ = ("children",)
+
     def __init__(self):
         """ The class constructor.
         """
 
         self.is_valid_end = False
         self.children = [None] * CHAR_COUNT
+        self.min_length = 0
+        self.max_length = 0
+
+    def get_child(self, index: int):
+        """Returns the child node for the character with the given index.
+
+        Args:
+            index: The ordinal number of the character in the used alphabet.
+
+        Returns:
+            The child node, or None if there is no child for the character.
+        """
+
+        return self.children[index]
+
+    def set_child(self, index: int, child):
+        """Sets the child node for the character with the given index.
+
+        Args:
+            index: The ordinal number of the character in the used alphabet.
+            child: The child node.
+        """
+
+        self.children[index] = child
+
+    def get_children(self):
+        """Returns the existing children of the node.
+
+        Returns:
+            A list of (index, child node) tuples in alphabetical order.
+        """
+
+        return [(i, child) for i, child in enumerate(self.children) if child]
@@ -0,0 +1,100 @@
+from services.phonetic_utils import calculate_phonetic_key
+
+
+class PhoneticIndex:
+    """Class describing an index of words by their phonetic keys.
+
+    Every key is stored under its phonetic key (see calculate_phonetic_key),
+    so the words that sound like a misspelling are found with a single
+    dictionary lookup, however many edits apart from it they are.
+    """
+
+    def __init__(self, key_function=calculate_phonetic_key):
+        """The class constructor.
+
+        Args:
+            key_function: A function taking a word and returning its phonetic
+                          key as a string. Defaults to calculate_phonetic_key.
+        """
+
+        self._key_function = key_function
+        self._keys_per_code = {}
+        self._size = 0
+
+    def add(self, key: str):
+        """Adds keys to the index.
+
+        Args:
+            key: The key to be added as a string.
+        """
+
+        key = key.lower()
+        keys = self._keys_per_code.setdefault(self._key_function(key), set())
+        if key not in keys:
+            keys.add(key)
+            self._size += 1
+
+    def remove(self, key: str):
+        """Removes keys from the index.
+
+        Args:
+            key: The key to be removed as a string.
+
+        Returns:
+            True if the key was found and removed, False otherwise.
+        """
+
+        key = key.lower()
+        if not self.find(key):
+            return False
+
+        code = self._key_function(key)
+        self._keys_per_code[code].remove(key)
+        if not self._keys_per_code[code]:
+            del self._keys_per_code[code]
+        self._size -= 1
+        return True
+
+    def find(self, key: str):
+        """Searches for keys in the index.
+
+        Args:
+            key: The key to search for as a string.
+
+        Returns:
+            True if the key was found, False otherwise.
+        """
+
+        key = key.lower()
+        return key in self._keys_per_code.get(self._key_function(key), ())
+
+    def lookup(self, key: str):
+        """Finds the keys that sound like the given word.
+
+        Args:
+            key: The misspelled word as a string.
+
+        Returns:
+            A list of all keys in the index with the same phonetic key as
+            the given word, in alphabetical order.
+        """
+
+        return sorted(self._keys_per_code.get(self._key_function(key.lower()), ()))
+
+    def get_size(self):
+        """Returns the number of keys in the index.
+
+        Returns:
+            The number of keys as an integer.
+        """
+
+        return self._size
+
+    def get_code_count(self):
+        """Returns the number of different phonetic keys in the index.
+
+        Returns:
+            The number of phonetic keys as an integer.
+        """
+
+        return len(self._keys_per_code)
@@ -0,0 +1,261 @@
+from entities.length_bounds import KeyLengthsMixin, TraversalMixin
+from services.alphabet_utils import calc_index
+
+
+class RadixNode:
+    """A class representing a node in a RadixTrie data structure
+
+    Attributes:
+        label: The substring on the edge leading to the node.
+        is_valid_end: A boolean describing if the node is a valid ending
+                      for a word.
+        children: A list of child nodes in alphabetical order. No two
+                  children have labels starting with the same character.
+        min_length: The length of the shortest key suffix following the label.
+        max_length: The length of the longest key suffix following the label.
+    """
+
+    __slots__ = ("label", "is_valid_end", "children", "min_length", "max_length")
+
+    def __init__(self, label="", is_valid_end=False):
+        """ The class constructor.
+
+        Args:
+            label: The substring on the edge leading to the node. Defaults to
+                   an empty string (used for the root).
+            is_valid_end: A boolean describing if the node is a valid ending
+                          for a word. Defaults to False.
+        """
+
+        self.label = label
+        self.is_valid_end = is_valid_end
+        self.children = []
+        self.min_length = 0
+        self.max_length = 0
+
+    def update_length_bounds(self):
+        """Recalculates the length bounds of the node from its children.
+        """
+
+        lengths = [0] if self.is_valid_end else []
+        self.min_length = min([len(child.label) + child.min_length for child in self.children]
+                              + lengths, default=0)
+        self.max_length = max([len(child.label) + child.max_length for child in self.children]
+                              + lengths, default=0)
+
+
+class RadixTrie(KeyLengthsMixin, TraversalMixin):
+    """Class describing a radix tree (path-compressed trie).
+
+    Chains of nodes with only one child are merged into a single edge
+    holding a substring, which makes the tree much shallower than a trie.
+
+    The tree can also be searched one character at a time like a trie
+    (see get_children): a position in the middle of an edge is represented
+    by a (node, offset) tuple, where offset is the number of characters of
+    the label already passed, and a position at the end of an edge by the
+    node itself.
+    """
+
+    def __init__(self):
+        """The class constructor.
+        """
+
+        self._root = RadixNode()
+        self._max_keylength = 0
+        self._size = 0
+        self._keys_per_length = {}
+
+    def add(self, key: str):
+        """Adds keys to the radix trie.
+
+        Args:
+            key: The key to be added as a string.
+        """
+
+        node = self._root
+        rest = key.lower()
+        if not self._size:
+            node.min_length = len(rest)
+        self._extend_length_bounds(node, len(rest))
+
+        while rest:
+            position, child = self._find_child(node, rest[0])
+            if not child:
+                node.children.insert(position, RadixNode(rest))
+                node = node.children[position]
+                break
+
+            common = self._common_prefix_length(child.label, rest)
+            if common < len(child.label):
+                child = self._split_child(node, position, common)
+
+            node = child
+            rest = rest[common:]
+            self._extend_length_bounds(node, len(rest))
+
+        if not node.is_valid_end:
+            node.is_valid_end = True
+            self._add_length(len(key))
+
+    def remove(self, key: str):
+        """Removes keys from the radix trie.
+
+        Nodes left without children are removed, and nodes left with only one
+        child are merged with the child, so that the tree stays path-compressed.
+        The length bounds of the nodes on the path of the key are recalculated.
+
+        Args:
+            key: The key to be removed as a string.
+
+        Returns:
+            True if the key was removed, False if it was not found in the trie.
+        """
+
+        parent = None
+        node = self._root
+        path = [node]
+        rest = key.lower()
+
+        while rest:
+            parent = node
+            position, node = self._find_child(parent, rest[0])
+            if not node or not rest.startswith(node.label):
+                return False
+            path.append(node)
+            rest = rest[len(node.label):]
+
+        if not node.is_valid_end:
+            return False
+
+        node.is_valid_end = False
+        self._remove_length(len(key))
+
+        if parent:
+            if not node.children:
+                del parent.children[position]
+                self._merge_with_child(parent)
+            else:
+                self._merge_with_child(node)
+        for path_node in reversed(path):
+            path_node.update_length_bounds()
+
+        return True
+
+    def find(self, key: str):
+        """Searches for the given key in the radix trie
+
+        Args:
+            key: The string to be searched for.
+
+        Returns:
+            True if the key was found, otherwise False.
+        """
+
+        node = self._root
+        rest = key.lower()
+
+        while rest:
+            _, node = self._find_child(node, rest[0])
+            if not node or not rest.startswith(node.label):
+                return False
+            rest = rest[len(node.label):]
+
+        return node.is_valid_end
+
+    def get_children(self, node):
+        """Returns the positions one character further down from a position
+        in the radix trie.
+
+        Args:
+            node: The position as a RadixNode-object (at the end of its label)
+                  or a (RadixNode-object, offset) tuple.
+
+        Returns:
+            A list of (index, position) tuples in alphabetical order. The index
+            is the ordinal number of the character in the used alphabet.
+        """
+
+        if isinstance(node, tuple):
+            node, offset = node
+            return [(calc_index(node.label[offset]), self._get_position(node, offset + 1))]
+        return [(calc_index(child.label[0]), self._get_position(child, 1))
+                for child in node.children]
+
+    def is_valid_end(self, node):
+        """Checks whether a position is a valid ending for a key.
+
+        Args:
+            node: The position as a RadixNode-object or a (RadixNode-object,
+                  offset) tuple.
+
+        Returns:
+            True if the position ends a key, otherwise False.
+        """
+
+        return not isinstance(node, tuple) and node.is_valid_end
+
+    def get_length_bounds(self, node):
+        """Returns the lengths of the shortest and the longest key suffix
+        following a position.
+
+        Args:
+            node: The position as a RadixNode-object or a (RadixNode-object,
+                  offset) tuple.
+
+        Returns:
+            A tuple containing the minimum and the maximum number of characters
+            following the position in any key.
+        """
+
+        if isinstance(node, tuple):
+            node, offset = node
+            rest = len(node.label) - offset
+            return rest + node.min_length, rest + node.max_length
+        return node.min_length, node.max_length
+
+    def _get_position(self, node, offset: int):
+        return node if offset == len(node.label) else (node, offset)
+
+    def _split_child(self, node, position: int, length: int):
+        child = node.children[position]
+        parent = RadixNode(child.label[:length])
+        child.label = child.label[length:]
+        parent.children.append(child)
+        node.children[position] = parent
+        parent.update_length_bounds()
+        return parent
+
+    def _extend_length_bounds(self, node, length: int):
+        node.min_length = min(node.min_length, length)
+        node.max_length = max(node.max_length, length)
+
+    def _merge_with_child(self, node):
+        if node is self._root or node.is_valid_end or len(node.children) != 1:
+            return
+        child = node.children[0]
+        node.label += child.label
+        node.is_valid_end = child.is_valid_end
+        node.children = child.children
+
+    def _find_child(self, node, char: str):
+        for position, child in enumerate(node.children):
+            if child.label[0] == char:
+                return position, child
+            if child.label[0] > char:
+                return position, None
+        return len(node.children), None
+
+    def _common_prefix_length(self, label: str, key: str):
+        length = 0
+        for char_a, char_b in zip(label, key):
+            if char_a != char_b:
+                break
+            length += 1
+        return length
+
+    def _traverse(self, node, key: str, result: list):
+        if node.is_valid_end:
+            result.append(key)
+        for child in node.children:
+            self._traverse(child, key+child.label, result)
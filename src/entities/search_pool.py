@@ -0,0 +1,82 @@
+import os
+from multiprocessing import get_all_start_methods, get_context
+from threading import Lock
+from services.distance_service_parallel import init_worker, search_subtrie
+
+
+class SearchPool:
+    """Class describing a pool of worker processes searching the words of
+    a dictionary in parallel.
+
+    The workers are started once, with the words of the dictionary, and
+    every worker builds a trie for every first character of the words (see
+    distance_service_parallel). A search sends every worker only the first
+    characters to be searched and the search parameters, so several searches
+    can use the same pool. The workers share the smallest distance found
+    during a search, so a close word found in one subtrie prunes the
+    subtries searched after it; searches using the same pool therefore run
+    one at a time. The pool is not updated when the dictionary
+    changes: a new pool has to be started, which takes about as long as
+    building the dictionary trie in every worker.
+    """
+
+    def __init__(self, words: list, processes=None):
+        """The class constructor.
+
+        Args:
+            words: A list containing the words in the dictionary.
+            processes: The number of worker processes as an integer. Defaults
+                       to None, in which case the number of CPUs is used. No
+                       processes are started if fewer than two would be used.
+        """
+
+        self._first_chars = sorted({word[0] for word in words})
+        self._processes = min(processes or os.cpu_count() or 1, len(self._first_chars))
+        self._pool = None
+        self._bound = None
+        self._lock = Lock()
+        if self._processes >= 2:
+            method = "forkserver" if "forkserver" in get_all_start_methods() else "spawn"
+            context = get_context(method)
+            self._bound = context.Value("d", 0)
+            self._pool = context.Pool(self._processes, init_worker, (words, self._bound))
+
+    def search(self, word_target: str, max_dist, neighbour_check=False):
+        """Searches the subtries of all first characters in the worker processes.
+
+        Args:
+            word_target: The word to be matched as a string.
+            max_dist: The maximum Damerau-Levenshtein distance allowed.
+            neighbour_check: A boolean indicating whether substitutions by
+                             neighbouring keys are prioritised. Defaults to False.
+
+        Returns:
+            A list with the results of the subtries in alphabetical order of their
+            first characters (see distance_service_parallel.search_subtrie).
+        """
+
+        with self._lock:
+            self._bound.value = max_dist
+            return self._pool.starmap(
+                search_subtrie,
+                [(char, word_target, neighbour_check) for char in self._first_chars],
+                chunksize=1
+            )
+
+    def get_process_count(self):
+        """Returns the number of worker processes.
+
+        Returns:
+            The number of processes as an integer, or 0 if the pool has been closed.
+        """
+
+        return self._processes if self._pool else 0
+
+    def close(self):
+        """Stops the worker processes.
+        """
+
+        if self._pool:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
@@ -0,0 +1,135 @@
+class SymSpellIndex:
+    """Class describing a symmetric delete index (as used by SymSpell).
+
+    Every key is stored under all strings that can be created by deleting
+    at most max_edit characters from it (including the key itself). Two
+    words within max_edit edits of each other always share at least one
+    such string, so the candidates for a misspelling are found by generating
+    the deletions of the misspelling and looking them up in the index. The
+    candidates still have to be verified by calculating their distances.
+
+    The number of deletions grows quickly with the key length and max_edit,
+    so the index trades memory and build time for fast lookups.
+    """
+
+    def __init__(self, max_edit=2):
+        """The class constructor.
+
+        Args:
+            max_edit: The maximum edit distance supported by the index as an
+                      integer. Defaults to 2.
+        """
+
+        self._max_edit = max_edit
+        self._index = {}
+        self._keys = set()
+
+    def add(self, key: str):
+        """Adds keys to the index.
+
+        Args:
+            key: The key to be added as a string.
+        """
+
+        key = key.lower()
+        if key in self._keys:
+            return
+
+        self._keys.add(key)
+        for deletion in self._calculate_deletions(key):
+            self._index.setdefault(deletion, []).append(key)
+
+    def remove(self, key: str):
+        """Removes keys from the index.
+
+        Args:
+            key: The key to be removed as a string.
+
+        Returns:
+            True if the key was found and removed, False otherwise.
+        """
+
+        key = key.lower()
+        if key not in self._keys:
+            return False
+
+        self._keys.remove(key)
+        for deletion in self._calculate_deletions(key):
+            keys = self._index[deletion]
+            keys.remove(key)
+            if not keys:
+                del self._index[deletion]
+        return True
+
+    def find(self, key: str):
+        """Searches for keys in the index.
+
+        Args:
+            key: The key to search for as a string.
+
+        Returns:
+            True if the key was found, False otherwise.
+        """
+
+        return key.lower() in self._keys
+
+    def lookup(self, key: str):
+        """Finds the candidate keys for a misspelling.
+
+        Args:
+            key: The misspelled word as a string.
+
+        Returns:
+            A list of all keys in the index sharing a deletion with the given
+            key, in alphabetical order. The list contains every key within
+            max_edit edits of the given key, but also keys further away.
+        """
+
+        candidates = set()
+        for deletion in self._calculate_deletions(key.lower()):
+            candidates.update(self._index.get(deletion, ()))
+        return sorted(candidates)
+
+    def get_all(self):
+        """Returns all keys in the index.
+
+        Returns:
+            A list of all keys in alphabetical order.
+        """
+
+        return sorted(self._keys)
+
+    def get_size(self):
+        """Returns the number of keys in the index.
+
+        Returns:
+            The number of keys as an integer.
+        """
+
+        return len(self._keys)
+
+    def get_max_edit(self):
+        """Returns the maximum edit distance supported by the index.
+
+        Returns:
+            The maximum edit distance as an integer.
+        """
+
+        return self._max_edit
+
+    def get_entry_count(self):
+        """Returns the number of deletions stored in the index.
+
+        Returns:
+            The number of distinct deletions as an integer.
+        """
+
+        return len(self._index)
+
+    def _calculate_deletions(self, key: str):
+        deletions = {key}
+        latest = {key}
+        for _ in range(self._max_edit):
+            latest = {word[:i] + word[i+1:] for word in latest for i in range(len(word))}
+            deletions.update(latest)
+        return deletions
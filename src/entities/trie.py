@@ -1,21 +1,27 @@
 from entities.node import Node
-from services.alphabet_utils import(
-    CHAR_COUNT,
-    calc_char,
-    calc_index
-)
+from entities.compact_node import CompactNode
+from entities.length_bounds import KeyLengthsMixin, NodeTrieMixin
+from services.alphabet_utils import calc_index
 
 
-class Trie:
+class Trie(KeyLengthsMixin, NodeTrieMixin):
     """Class describing a trie data structure
     """
 
-    def __init__(self):
+    def __init__(self, compact=False):
         """The class constructor.
+
+        Args:
+            compact: A boolean describing whether the trie should be built
+                     from CompactNode-objects, which only store existing children,
+                     instead of Node-objects. Defaults to False.
         """
 
-        self._root = Node()
+        self._node_class = CompactNode if compact else Node
+        self._root = self._node_class()
         self._max_keylength = 0
+        self._size = 0
+        self._keys_per_length = {}
 
     def add(self, key: str):
         """Adds keys to the trie.
@@ -24,93 +30,67 @@ class Trie:
             key: The key to be added as a string.
         """
 
-        if len(key) > self._max_keylength:
-            self._max_keylength = len(key)
-
         node = self._root
+        length = len(key)
+        if not self._size:
+            node.min_length = length
+        self._extend_length_bounds(node, length)
 
         for char in key.lower():
+            length -= 1
             index = calc_index(char)
-            if not node.children[index]:
-                child = Node()
-                node.children[index] = child
-            node = node.children[index]
+            child = node.get_child(index)
+            if not child:
+                child = self._node_class()
+                child.min_length = length
+                node.set_child(index, child)
+            node = child
+            self._extend_length_bounds(node, length)
 
-        node.is_valid_end = True
+        if not node.is_valid_end:
+            node.is_valid_end = True
+            self._add_length(len(key))
 
-    def find(self, key: str):
-        """Searches for the given key in the trie
+    def remove(self, key: str):
+        """Removes keys from the trie.
+
+        Nodes that are left without children and do not end another key
+        are removed as well, and the length bounds of the remaining nodes
+        on the path of the key are recalculated.
 
         Args:
-            key: The string to be searched for.
+            key: The key to be removed as a string.
 
         Returns:
-            True if the key was found, otherwise False.
+            True if the key was removed, False if it was not found in the trie.
         """
 
+        path = []
         node = self._root
 
         for char in key.lower():
             index = calc_index(char)
-            if node.children[index]:
-                node = node.children[index]
-            else:
+            path.append((node, index))
+            node = node.get_child(index)
+            if not node:
                 return False
 
-        return node.is_valid_end
-
-    def get_all(self):
-        """Returns all keys in the trie
-
-        Returns:
-            A list containing all keys
-        """
-
-        keys = []
-        self._traverse(self._root, "", keys)
-        return keys
-
-    def get_root(self):
-        """Returns the root node of the trie.
+        if not node.is_valid_end:
+            return False
 
-        Returns:
-            The root node as a Node-object.
-        """
-
-        return self._root
+        node.is_valid_end = False
+        self._remove_length(len(key))
 
-    def get_size(self):
-        """ Returns the number of keys in the trie.
-
-        Returns:
-            The key count as an integer.
-        """
-
-        count = self._count(self._root)
-        return count
-
-    def get_max_keylength(self):
-        """Returns the length of the longest key in the trie.
+        for parent, index in reversed(path):
+            if node.is_valid_end or node.get_children():
+                node.update_length_bounds()
+            else:
+                parent.set_child(index, None)
+            node = parent
+        node.update_length_bounds()
 
-        Returns:
-            The length of the longest key as an integer.
-        """
+        return True
 
-        return self._max_keylength
-
-    def _traverse(self, node, key: str, result: list):
-        if node.is_valid_end:
-            result.append(key)
-        for i in range(CHAR_COUNT):
-            child = node.children[i]
-            if child:
-                self._traverse(child, key+calc_char(i), result)
-
-    def _count(self, node):
-        count = 0
-        if node.is_valid_end:
-            count += 1
-        for i in range(CHAR_COUNT):
-            if node.children[i]:
-                count += self._count(node.children[i])
-        return count
+    def _extend_length_bounds(self, node, length: int):
+        node.min_length = min(node.min_length, length)
+        node.max_length = max(node.max_length, length)
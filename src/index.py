@@ -1,6 +1,7 @@
 """ Module for the command line user interface.
 """
 
+from functools import partial
 from services.spellchecker_service import spellchecker_service
 from services.alphabet_utils import check_allowed_chars, get_allowed_chars
 
@@ -13,6 +14,13 @@ def show_commands():
     print("4 - Calculate Damerau-Levensthein distance")
     print("5 - Check spelling (baseline for-loop)")
     print("6 - Check spelling (recursive)")
+    print("7 - Delete a word from the dictionary")
+    print("8 - Suggest spellings (ranked)")
+    print("9 - Check spelling (symmetric delete index)")
+    print("10 - Check spelling (BK-tree)")
+    print("11 - Check spelling (forward and reversed trie)")
+    print("12 - Check spelling (phonetic index)")
+    print("13 - Check spelling (fastest engine)")
     print("0 - Quit")
     print()
 
@@ -35,6 +43,13 @@ def add_word():
     else:
         print(f"\n'{word}' is already in the dictionary.")
 
+def delete_word():
+    word = input_word("Type a word: ")
+    if spellchecker_service.delete_word(word):
+        print(f"\n'{word}' was deleted.")
+    else:
+        print(f"\n'{word}' is not in the dictionary.")
+
 def find_word():
     word = input_word("Type word to search for: ")
     if spellchecker_service.find_word(word):
@@ -57,7 +72,7 @@ def calculate_distance():
     print_matrix(matrix)
     print(f"\nThe Demerau-Levenshtein distance between the words is {matrix[-1][-1]}.")
 
-def check_spelling(method: str):
+def check_spelling(find_closest_match):
     word = input_word("Type word to be spell checked: ")
     try:
         max_edit = int(input(
@@ -68,13 +83,7 @@ def check_spelling(method: str):
 
     neighbour_check = input_yes_no("Prioritise words with neighbouring keys? (y/n): ")
 
-    result = []
-    if method == "recursive":
-        result = spellchecker_service.find_closest_match_recursively(
-                 word, max_edit, neighbour_check
-        )
-    else:
-        result = spellchecker_service.find_closest_match(word, max_edit, neighbour_check)
+    result = find_closest_match(word, max_edit, neighbour_check)
 
     if len(result) == 0:
         print("No suggestions for correct spelling were found.")
@@ -84,6 +93,22 @@ def check_spelling(method: str):
         print(f"Did you mean {', ' .join(result)}?")
         print(spellchecker_service.get_info())
 
+def suggest():
+    word = input_word("Type word to get suggestions for: ")
+    try:
+        suggestion_count = int(input("Enter number of suggestions (empty for 5): "))
+    except ValueError:
+        suggestion_count = 5
+
+    neighbour_check = input_yes_no("Prioritise words with neighbouring keys? (y/n): ")
+
+    result = spellchecker_service.suggest(word, suggestion_count, None, neighbour_check)
+    if len(result) == 0:
+        print("No suggestions were found.")
+    else:
+        print(f"Suggestions: {', '.join(result)}")
+        print(spellchecker_service.get_info())
+
 def print_matrix(matrix):
     print()
     rows = len(matrix)
@@ -99,8 +124,18 @@ def main():
         2: find_word,
         3: get_all,
         4: calculate_distance,
-        5: lambda: check_spelling(None),
-        6: lambda: check_spelling("recursive")
+        5: lambda: check_spelling(spellchecker_service.find_closest_match),
+        6: lambda: check_spelling(spellchecker_service.find_closest_match_recursively),
+        7: delete_word,
+        8: suggest,
+        9: lambda: check_spelling(partial(spellchecker_service.find_closest_match_indexed,
+                                          index="symspell")),
+        10: lambda: check_spelling(partial(spellchecker_service.find_closest_match_indexed,
+                                           index="bk_tree")),
+        11: lambda: check_spelling(spellchecker_service.find_closest_match_partition),
+        12: lambda: check_spelling(partial(spellchecker_service.find_closest_match_indexed,
+                                           index="phonetic")),
+        13: lambda: check_spelling(spellchecker_service.correct)
     }
 
     while True:
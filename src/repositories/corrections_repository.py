@@ -0,0 +1,80 @@
+import os
+from time import monotonic
+from config import CORRECTIONS_PATH
+from services.alphabet_utils import check_allowed_chars
+
+
+class CorrectionsRepository:
+    """Class responsible for the table of known misspellings and their corrections.
+
+    The table is stored in the format of the Wikipedia list of common
+    misspellings: one misspelling per row, separated from the intended
+    word(s) by '->', with several intended words separated by a comma and
+    a single space. The table is read on the first lookup, and read again
+    if the file has been modified since, so a table compiled while the
+    program is running is taken into use without restarting it. The
+    modification time of the file is checked at most once every
+    check_interval seconds, so most lookups do not touch the file system.
+    """
+
+    def __init__(self, file_path, check_interval=1.0):
+        self._file_path = file_path
+        self._check_interval = check_interval
+        self._corrections = None
+        self._modified = None
+        self._checked_at = None
+
+    def get_corrections(self):
+        now = monotonic()
+        if self._corrections is not None and now - self._checked_at < self._check_interval:
+            return self._corrections
+
+        modified = self._get_modified()
+        if self._corrections is None or modified != self._modified:
+            self._corrections = self._read() if modified else {}
+            self._modified = modified
+        self._checked_at = now
+        return self._corrections
+
+    def find(self, misspelling: str):
+        return self.get_corrections().get(misspelling, [])
+
+    def save(self, corrections: dict):
+        tmp_path = self._file_path + ".tmp"
+
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            for misspelling in sorted(corrections):
+                file.write(f"{misspelling}->{', '.join(corrections[misspelling])}\n")
+
+        os.replace(tmp_path, self._file_path)
+        self._corrections = None
+
+    def delete(self):
+        if os.path.isfile(self._file_path):
+            os.remove(self._file_path)
+        self._corrections = None
+
+    def _get_modified(self):
+        try:
+            stat = os.stat(self._file_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _read(self):
+        corrections = {}
+
+        with open(self._file_path, encoding="utf-8") as file:
+            for row in file:
+                parts = row.replace("\n", "").split("->")
+                if len(parts) != 2 or not parts[0] or not check_allowed_chars(parts[0]):
+                    continue
+                words = [word for word in parts[1].split(", ")
+                         if word and check_allowed_chars(word)]
+                if words:
+                    known = corrections.get(parts[0], [])
+                    corrections[parts[0]] = list(dict.fromkeys(known + words))
+        return corrections
+
+
+corrections_repository = CorrectionsRepository(CORRECTIONS_PATH)
@@ -0,0 +1,56 @@
+import atexit
+import os
+from config import QUERY_LOG_PATH
+
+
+class QueryLogRepository:
+    """Class responsible for the log of misspelled words checked by the users.
+
+    The log has one word per row. If no file path is given, nothing is logged.
+    The words are buffered in memory and appended to the file buffer_size words
+    at a time, when the log is read, and when the program exits, so logging
+    a query does not open the file.
+    """
+
+    def __init__(self, file_path, buffer_size=100):
+        self._file_path = file_path
+        self._buffer_size = buffer_size
+        self._buffer = []
+
+    def add(self, word: str):
+        if not self._file_path:
+            return
+
+        self._buffer.append(word)
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+
+        with open(self._file_path, "a", encoding="utf-8") as file:
+            file.write("".join(f"{word}\n" for word in self._buffer))
+        self._buffer.clear()
+
+    def get_counts(self):
+        self.flush()
+        if not self._file_path or not os.path.isfile(self._file_path):
+            return {}
+
+        counts = {}
+        with open(self._file_path, encoding="utf-8") as file:
+            for row in file:
+                word = row.replace("\n", "")
+                if word:
+                    counts[word] = counts.get(word, 0) + 1
+        return counts
+
+    def delete(self):
+        self._buffer.clear()
+        if self._file_path and os.path.isfile(self._file_path):
+            os.remove(self._file_path)
+
+
+query_log_repository = QueryLogRepository(QUERY_LOG_PATH)
+atexit.register(query_log_repository.flush)
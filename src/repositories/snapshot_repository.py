@@ -0,0 +1,86 @@
+import mmap
+import os
+import struct
+from array import array
+from config import SNAPSHOT_PATH
+from entities.array_trie import ArrayTrie
+
+MAGIC = b"SPCKDAT"
+VERSION = 2
+BYTE_ORDER_MARK = 0x01020304
+HEADER = struct.Struct("=7sBI32sIII")
+INT_SIZE = array("i").itemsize
+SHORT_SIZE = array("h").itemsize
+
+
+class SnapshotRepository:
+    """Class responsible for storing the dictionary as a binary snapshot.
+
+    The snapshot contains the buffers of an ArrayTrie (including the length
+    bounds of the states, so the searches prune a loaded trie like any other)
+    preceded by a header with a format version and the SHA-256 checksum of
+    the wordlist the trie was compiled from. A snapshot is loaded by memory-mapping the file, so
+    the trie can be searched without creating any Python objects per node,
+    and processes using the same snapshot share the pages.
+    """
+
+    def __init__(self, file_path):
+        self._file_path = file_path
+
+    def compile(self, wordlist: list, checksum: bytes):
+        trie = ArrayTrie()
+        for word in sorted(wordlist):
+            trie.add(word)
+        self.save(trie, checksum)
+
+    def save(self, trie: ArrayTrie, checksum: bytes):
+        base, check, length_bounds, terminal = trie.get_buffers()
+        header = HEADER.pack(MAGIC, VERSION, BYTE_ORDER_MARK, checksum,
+                             trie.get_max_keylength(), trie.get_size(), len(check))
+        tmp_path = self._file_path + ".tmp"
+
+        with open(tmp_path, "wb") as file:
+            file.write(header)
+            file.write(base.tobytes())
+            file.write(check.tobytes())
+            file.write(length_bounds.tobytes())
+            file.write(terminal.tobytes())
+
+        os.replace(tmp_path, self._file_path)
+
+    def load(self, checksum: bytes):
+        if not os.path.isfile(self._file_path):
+            return None
+
+        with open(self._file_path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < HEADER.size:
+                return None
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, byte_order_mark, stored_checksum, max_keylength, size, states = \
+            HEADER.unpack_from(buffer)
+        if (magic != MAGIC or version != VERSION or byte_order_mark != BYTE_ORDER_MARK
+                or stored_checksum != checksum
+                or len(buffer) != HEADER.size + states * (2 * INT_SIZE + 2 * SHORT_SIZE + 1)):
+            buffer.close()
+            return None
+
+        view = memoryview(buffer)
+        base_end = HEADER.size + states * INT_SIZE
+        check_end = base_end + states * INT_SIZE
+        bounds_end = check_end + states * 2 * SHORT_SIZE
+        return ArrayTrie(
+            (view[HEADER.size:base_end].cast("i"),
+             view[base_end:check_end].cast("i"),
+             view[check_end:bounds_end].cast("h"),
+             view[bounds_end:].cast("b")),
+            max_keylength,
+            size
+        )
+
+    def delete(self):
+        if os.path.isfile(self._file_path):
+            os.remove(self._file_path)
+
+
+snapshot_repository = SnapshotRepository(SNAPSHOT_PATH)
@@ -1,3 +1,5 @@
+import hashlib
+import os
 from pathlib import Path
 from config import WORDLIST_PATH
 from services.alphabet_utils import check_allowed_chars
@@ -9,10 +11,31 @@ class WordlistRepository:
     def get_wordlist(self):
         return self._read()
 
+    def get_checksum(self):
+        self._check_for_file()
+
+        with open(self._file_path, "rb") as file:
+            return hashlib.sha256(file.read()).digest()
+
     def add(self, word: str):
         self._write(word)
         return word
 
+    def delete(self, word: str):
+        self._check_for_file()
+        tmp_path = self._file_path + ".tmp"
+
+        with open(self._file_path, encoding="utf-8") as file:
+            rows = [row.replace("\n", "") for row in file]
+
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            for row in rows:
+                if row != word:
+                    file.write(f"{row}\n")
+
+        os.replace(tmp_path, self._file_path)
+        return word
+
     def delete_all(self):
         with open(self._file_path, "w", encoding="utf-8") as file:
             file.close()
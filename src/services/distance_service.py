@@ -14,6 +14,7 @@
 from services.alphabet_utils import(
     CHAR_COUNT,
     NEIGHBOURING_KEYS,
+    calc_char,
     calc_index
 )
 
@@ -38,42 +39,149 @@ def calculate_dl_distance(word_a: str, word_b:str, neighbour_check=False, debug_
 
     rows_per_char = [1] * CHAR_COUNT
     maxdist = len(word_a) + len(word_b)
+    target_indexes = [calc_index(char_b) for char_b in word_b]
 
     matrix = init_matrix(len(word_a) + 2, len(word_b) + 2, maxdist)
 
     for row in range(2, len(word_a) + 2):
         char_a = word_a[row-2]
-        col_per_char = 0
+        neighbours = {calc_index(char_b) for char_b in word_b
+                      if char_a in NEIGHBOURING_KEYS[char_b]} if neighbour_check else set()
+        calculate_row(matrix, row, calc_index(char_a), rows_per_char, target_indexes, neighbours)
+        rows_per_char[calc_index(char_a)] = row
+
+    if debug_flag:
+        return matrix
+    return matrix[-1][-1]
 
-        for col in range(2, len(word_b) + 2):
-            char_b = word_b[col-2]
-            row_w_match = rows_per_char[calc_index(char_b)]
-            col_w_match = col_per_char
+def calculate_dl_distance_bounded(word_a: str, word_b: str, max_dist, neighbour_check=False):
+    """Calculates the Damerau-Levenshtein distance between two words, if it does not
+    exceed the given maximum distance.
 
-            if char_a == char_b:
-                cost = 0
-                col_per_char = col
-            elif neighbour_check and char_a in NEIGHBOURING_KEYS[char_b]:
-                cost = 0.5
-            else:
-                cost = 1
-
-            matrix[row][col] = min(
-                matrix[row-1][col-1] + cost, # substitution
-                matrix[row][col-1] + 1, # insertion
-                matrix[row-1][col] + 1, # deletion
-                # transposition
-                matrix[row_w_match-1][col_w_match-1]
-                      + (row-row_w_match-1) + 1
-                      + (col-col_w_match-1)
-            )
+    Only the cells on the diagonal band of width 2 * max_dist + 1 are filled in,
+    since the value of a cell is at least the distance of the cell from the diagonal.
+    Cells outside the band are set to a value exceeding the maximum distance.
+    The calculation ends as soon as all cells in a row exceed the maximum distance.
 
+    Args:
+        word_a: The source word as a string.
+        word_b: The target word as a string.
+        max_dist: The maximum Damerau-Levenshtein distance of interest.
+        neighbour_check: A boolean indicating whether substitutions by neighbouring
+                         keys on the keyboard should be assigned a slightly lower
+                         edit cost (0.5 instead of 1). Defaults to False.
+    Returns:
+        The Damerau-Levenshtein distance between the two words, or None if
+        the distance exceeds max_dist.
+    """
+
+    if abs(len(word_a) - len(word_b)) > max_dist:
+        return None
+
+    rows_per_char = [1] * CHAR_COUNT
+    target_indexes = [calc_index(char_b) for char_b in word_b]
+    over = max_dist + 1
+
+    matrix = [[over] * (len(word_b) + 2),
+              [over] + [col if col <= max_dist else over for col in range(len(word_b) + 1)]]
+
+    for row in range(2, len(word_a) + 2):
+        char_a = word_a[row-2]
+        neighbours = {calc_index(char_b) for char_b in word_b
+                      if char_a in NEIGHBOURING_KEYS[char_b]} if neighbour_check else set()
+        matrix.append([over] * len(matrix[0]))
+        curr_row = calculate_row(matrix, row, calc_index(char_a), rows_per_char,
+                                 target_indexes, neighbours, int(max_dist))
+        if min(curr_row) > max_dist:
+            return None
         rows_per_char[calc_index(char_a)] = row
 
-    if debug_flag:
-        return matrix
+    if matrix[-1][-1] > max_dist:
+        return None
     return matrix[-1][-1]
 
+def calculate_row(matrix, row: int, index: int, rows_per_char, target_indexes, neighbours,
+                  band=None):
+    """ Fills in one row of the matrix, given the rows above it.
+
+    Used by the distance calculation between two words above as well as by
+    the searches in the trie data structures, which add one row for every
+    character on the path from the root to the current node.
+
+    Args:
+        matrix: The matrix used for calculating the Damerau-Levenshtein distance.
+                The row to be filled in must already exist, with its first
+                cell set to a value large enough never to be chosen.
+        row: The index of the row to be filled in as an integer.
+        index: The index of the character of the row in the used alphabet.
+        rows_per_char: A list containing the indexes of rows where letters
+                       were last seen. The list is indexed by the ordinal number
+                       of the letters in the used alphabet.
+        target_indexes: A list containing the indexes of the characters of the
+                        target word (the columns of the matrix) in the alphabet.
+        neighbours: A set containing the indexes of the characters whose
+                    substitution with the character of the row costs 0.5.
+        band: The number of columns on both sides of the diagonal to be filled
+              in as an integer. The other cells keep their values. Defaults to
+              None, in which case the whole row is filled in.
+
+    Returns:
+        The filled in row as a list.
+    """
+
+    prev_row = matrix[row-1]
+    curr_row = matrix[row]
+    curr_row[1] = prev_row[1] + 1
+    col_per_char = 1
+    first_col = 2 if band is None else max(2, row - band)
+
+    if band is not None:
+        for col in range(2, first_col):
+            if target_indexes[col-2] == index:
+                col_per_char = col
+        target_indexes = target_indexes[first_col-2:row+band-1]
+
+    for col, target_index in enumerate(target_indexes, first_col):
+        row_w_match = rows_per_char[target_index]
+
+        if index == target_index:
+            cost = 0
+        elif target_index in neighbours:
+            cost = 0.5
+        else:
+            cost = 1
+
+        curr_row[col] = min(
+            prev_row[col-1] + cost, # substitution
+            curr_row[col-1] + 1, # insertion
+            prev_row[col] + 1, # deletion
+            # transposition
+            matrix[row_w_match-1][col_per_char-1]
+                  + (row-row_w_match-1) + 1
+                  + (col-col_per_char-1)
+        )
+
+        if not cost:
+            col_per_char = col
+
+    return curr_row
+
+def create_neighbour_sets(neighbour_check: bool):
+    """ Helper function for looking up neighbouring keys by their indexes.
+
+    Args:
+        neighbour_check: A boolean indicating whether substitutions by
+                         neighbouring keys should be prioritised.
+
+    Returns:
+        A list indexed by the ordinal number of the letters in the used
+        alphabet, containing the indexes of the neighbouring keys of every
+        letter as a set (or empty sets, if neighbour_check is False).
+    """
+
+    return [{calc_index(key) for key in NEIGHBOURING_KEYS[calc_char(index)]}
+            if neighbour_check else set() for index in range(CHAR_COUNT)]
+
 def calculate_min(matrix, row, col, cost, row_w_match, col_w_match):
     """ Helper function for debugging purposes.
 
@@ -0,0 +1,102 @@
+""" Function that finds the words in a trie data structure within a given
+    Damerau-Levenshtein distance of a given word, by walking the trie together
+    with an automaton built for the word.
+
+    The automaton (see DLAutomaton) accepts the words within a given
+    Damerau-Levenshtein distance of the word. Instead of calculating a new
+    matrix row for every node, the search moves the automaton from the state
+    of the parent node to the state of the child, which is a dictionary lookup
+    once the transition has been calculated for the first time. Branches are
+    pruned when the automaton reaches a state from which no word is accepted.
+    The results are the same as those of distance_service_recursive.
+"""
+
+
+from functools import partial
+from entities.dl_automaton import DLAutomaton
+from services.alphabet_utils import calc_char
+from services.distance_service_iterative import(
+    calculate_dl_distance_iterative,
+    search_deepening
+)
+from services.distance_service_recursive import(
+    add_word_as_candidate,
+    calculate_length_difference
+)
+
+
+def calculate_dl_distance_automaton(word_target: str, trie, max_dist=None, neighbour_check=False):
+    """ Calculates the Damerau-Lewenshtein distance between the given word
+        and all words in the given trie.
+
+    Automatons for the maximum distances 1, 2, 3 and so on (up to the given
+    maximum distance, or the length of the longest word in the trie) are used
+    until candidates are found, as a smaller maximum distance prunes more
+    branches (see search_deepening for the worst case). With neighbouring key
+    priority the edit costs are not integers, and the iterative search is
+    used instead.
+
+    Args:
+        word_target: A string representing the word to be matched
+                     with the words in the trie (used as the target word).
+        trie: A Trie-, ArrayTrie- or Dawg-object containing the words in the wordlist.
+        max_dist: The maximum Damerau-Lewenshtein distance allowed.
+                  Defaults to None.
+        neighbour_check: A boolean indicating whether a substitution with a neighbouring
+                         key on the keyboard should be prioritised (i. e. assigned a
+                         slightly lower edit cost). Defaults to False.
+
+    Returns:
+        A list containing the word(s) from the trie with the lowest
+        Damerau-Levenshtein distance to the given word.
+    """
+
+    if neighbour_check:
+        return calculate_dl_distance_iterative(word_target, trie, max_dist, neighbour_check)
+
+    return search_deepening(partial(search_with_automaton, word_target, trie), trie, max_dist)
+
+def search_with_automaton(word_target: str, trie, max_dist: int):
+    """ Finds the words in the trie closest to the given word within the
+        given distance.
+
+    Args:
+        word_target: The word we are trying to find close matches for.
+        trie: A Trie-, ArrayTrie- or Dawg-object containing the words in the wordlist.
+        max_dist: The maximum Damerau-Levenshtein distance allowed as an integer.
+
+    Returns:
+        A list containing the word(s) from the trie with the lowest
+        Damerau-Levenshtein distance to the given word.
+    """
+
+    candidates = {}
+    automaton = DLAutomaton(word_target, max_dist)
+    target_length = len(word_target)
+    chars = [""] * (trie.get_max_keylength() + 1)
+
+    stack = [(child, index, 1, automaton.get_start_state()) for index, child in
+             reversed(trie.get_children(trie.get_root()))]
+
+    while stack:
+        node, index, depth, parent_state = stack.pop()
+        if calculate_length_difference(trie, node, depth, target_length) > max_dist:
+            continue
+
+        char = calc_char(index)
+        state = automaton.step(parent_state, char)
+        if state is None:
+            continue
+        chars[depth] = char
+
+        if trie.is_valid_end(node):
+            dist = automaton.get_distance(state)
+            if dist is not None:
+                add_word_as_candidate(candidates, "".join(chars[1:depth+1]), dist)
+
+        stack.extend((child, child_index, depth+1, state) for child_index, child in
+                     reversed(trie.get_children(node)))
+
+    if candidates.keys():
+        return candidates[min(candidates.keys())]
+    return []
@@ -0,0 +1,118 @@
+""" Function that finds the words in a trie with the smallest
+    Damerau-Levenshtein distances to a given word, in order of distance.
+
+    The trie is searched best-first: nodes waiting to be visited are kept
+    in a priority queue ordered by a lower bound for the distance of all words
+    below the node. The bound is the smallest value in the latest matrix row
+    of the node (the same value the recursive search uses for pruning), or the
+    length difference to the target word if that is larger. The requested
+    number of best words found so far is kept in a bounded list, and the
+    search ends as soon as the bound of the next node in the queue is larger
+    than the distance of the worst word in the list.
+
+    Every node in the queue holds the matrix rows on its path, so nodes can be
+    visited in any order. Rows are shared between a node and its children.
+"""
+
+
+from bisect import insort
+from heapq import heappop, heappush
+from itertools import count
+from services.alphabet_utils import(
+    CHAR_COUNT,
+    calc_char,
+    calc_index
+)
+from services.distance_service import(
+    calculate_row,
+    create_neighbour_sets,
+    init_matrix
+)
+from services.distance_service_recursive import calculate_length_difference
+
+
+def calculate_suggestions(word_target: str, trie, suggestion_count: int,
+                          max_dist=None, neighbour_check=False):
+    """ Finds the words in the trie with the smallest Damerau-Levenshtein
+        distances to the given word.
+
+    Args:
+        word_target: A string representing the word to be matched
+                     with the words in the trie (used as the target word).
+        trie: A Trie-, ArrayTrie- or Dawg-object containing the words in the wordlist.
+        suggestion_count: The maximum number of words returned as an integer.
+        max_dist: The maximum Damerau-Lewenshtein distance allowed.
+                  Defaults to None.
+        neighbour_check: A boolean indicating whether a substitution with a neighbouring
+                         key on the keyboard should be prioritised (i. e. assigned a
+                         slightly lower edit cost). Defaults to False.
+
+    Returns:
+        A list of (Damerau-Levenshtein distance, word) tuples, ordered by distance
+        and alphabetically within the same distance.
+    """
+
+    curr_max_dist = max_dist if max_dist else trie.get_max_keylength()
+    suggestions = []
+    queue = []
+    sequence = count()
+    target_indexes = [calc_index(char) for char in word_target]
+    neighbours = create_neighbour_sets(neighbour_check)
+
+    add_children_to_queue(trie, trie.get_root(), "",
+                          init_matrix(2, len(word_target) + 2,
+                                      len(word_target) + trie.get_max_keylength() + 1),
+                          target_indexes, curr_max_dist, neighbours, queue, sequence)
+
+    while queue:
+        bound, _, node, prefix, rows = heappop(queue)
+        if len(suggestions) == suggestion_count and bound > suggestions[-1][0]:
+            break
+
+        if trie.is_valid_end(node) and rows[-1][-1] <= curr_max_dist:
+            insort(suggestions, (rows[-1][-1], prefix))
+            if len(suggestions) > suggestion_count:
+                suggestions.pop()
+            if len(suggestions) == suggestion_count:
+                curr_max_dist = suggestions[-1][0]
+
+        add_children_to_queue(trie, node, prefix, rows, target_indexes,
+                              curr_max_dist, neighbours, queue, sequence)
+
+    return suggestions
+
+def add_children_to_queue(trie, node, prefix, rows, target_indexes,
+                          max_dist, neighbours, queue, sequence):
+    """ Calculates the matrix rows for the children of a node and adds the
+        children to the priority queue.
+
+    Args:
+        trie: The Trie-, ArrayTrie- or Dawg-object being searched.
+        node: The node whose children are added.
+        prefix: The characters on the path to the node as a string.
+        rows: A list containing the matrix rows on the path to the node.
+        target_indexes: A list containing the indexes of the characters of the
+                        word we are trying to find close matches for.
+        max_dist: The maximum Damerau-Levenshtein distance allowed. Children
+                  with a larger lower bound are not added.
+        neighbours: A list containing the indexes of the neighbouring keys of
+                    every letter as sets (empty, if substitutions with neighbouring
+                    keys are not prioritised).
+        queue: The priority queue as a list used as a heap.
+        sequence: An iterator providing increasing numbers used for keeping the
+                  order of nodes with the same bound stable.
+    """
+
+    rows_per_char = [1] * CHAR_COUNT
+    for row, index in enumerate(map(calc_index, prefix), 2):
+        rows_per_char[index] = row
+
+    for index, child in trie.get_children(node):
+        matrix = rows + [[rows[0][0]] * len(rows[0])]
+        calculate_row(matrix, len(rows), index, rows_per_char, target_indexes,
+                      neighbours[index])
+        bound = max(min(matrix[-1]), calculate_length_difference(
+            trie, child, len(prefix) + 1, len(target_indexes)))
+        if bound <= max_dist:
+            heappush(queue, (bound, next(sequence), child, prefix + calc_char(index),
+                             matrix))
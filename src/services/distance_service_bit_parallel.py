@@ -0,0 +1,121 @@
+""" Functions that calculate the Damerau-Levenshtein distance between two
+    words using bit vectors.
+
+    Based on the bit-parallel algorithm by Gene Myers ("A fast bit-vector
+    algorithm for approximate string matching based on dynamic programming",
+    1999), extended for transpositions by Heikki Hyyrö ("A bit-vector algorithm
+    for computing Levenshtein and Damerau edit distances", 2003).
+
+    Instead of filling in a matrix cell by cell, a whole column of the matrix
+    is handled at once: the vertical and horizontal differences between
+    neighbouring cells (always -1, 0 or +1) are stored as bits in Python
+    integers, one bit per character of the first word. The character masks
+    of the first word only need to be calculated once per query.
+
+    Hyyrö's algorithm calculates the optimal string alignment distance, where
+    no character may be edited more than once. The distance is never smaller
+    than the (unrestricted) Damerau-Levenshtein distance calculated by
+    distance_service, and at most one and a half times as large:
+    a transposition with k edits between the characters costs 1 + k, while
+    deleting and reinserting one of the characters instead costs 2 + k.
+    With a distance of at most 2 the two distances are always equal, since
+    a Damerau-Levenshtein distance of 1 is a single edit. For larger distances
+    the exact value is calculated with calculate_dl_distance, or with
+    calculate_dl_distance_bounded when a maximum distance is given.
+"""
+
+from services.distance_service import(
+    calculate_dl_distance,
+    calculate_dl_distance_bounded
+)
+
+
+def calculate_char_masks(word: str):
+    """ Calculates the bit masks for the characters of a word.
+
+    Args:
+        word: The word as a string.
+
+    Returns:
+        A dict where the keys are the characters of the word, and the values
+        integers with the bits set at the positions where the character occurs.
+    """
+
+    char_masks = {}
+    for position, char in enumerate(word):
+        char_masks[char] = char_masks.get(char, 0) | 1 << position
+    return char_masks
+
+def calculate_osa_distance(word_a: str, word_b: str, char_masks=None):
+    """ Calculates the optimal string alignment distance between two words.
+
+    Args:
+        word_a: The source word as a string.
+        word_b: The target word as a string.
+        char_masks: The character masks of the source word as returned by
+                    calculate_char_masks. Calculated if not given.
+
+    Returns:
+        The optimal string alignment distance as an integer.
+    """
+
+    if not word_a:
+        return len(word_b)
+    char_masks = char_masks or calculate_char_masks(word_a)
+
+    all_bits = (1 << len(word_a)) - 1
+    last_bit = 1 << (len(word_a) - 1)
+    vertical_pos = all_bits
+    vertical_neg = 0
+    diagonal_zero = 0
+    prev_char_mask = 0
+    distance = len(word_a)
+
+    for char in word_b:
+        char_mask = char_masks.get(char, 0)
+        transp = ((~diagonal_zero & char_mask) << 1) & prev_char_mask
+        diagonal_zero = (((((char_mask & vertical_pos) + vertical_pos) ^ vertical_pos)
+                          | char_mask | vertical_neg | transp) & all_bits)
+        horizontal_pos = (vertical_neg | ~(diagonal_zero | vertical_pos)) & all_bits
+        horizontal_neg = diagonal_zero & vertical_pos
+
+        distance += bool(horizontal_pos & last_bit) - bool(horizontal_neg & last_bit)
+
+        horizontal_pos = (horizontal_pos << 1) | 1
+        vertical_pos = ((horizontal_neg << 1) | ~(diagonal_zero | horizontal_pos)) & all_bits
+        vertical_neg = horizontal_pos & diagonal_zero
+        prev_char_mask = char_mask
+
+    return distance
+
+def calculate_dl_distance_bit_parallel(word_a: str, word_b: str, char_masks=None,
+                                       max_dist=None):
+    """ Calculates the Damerau-Levenshtein distance between two words.
+
+    The result is the same as for calculate_dl_distance without neighbouring
+    key priority.
+
+    Args:
+        word_a: The source word as a string.
+        word_b: The target word as a string.
+        char_masks: The character masks of the source word as returned by
+                    calculate_char_masks. Calculated if not given.
+        max_dist: The maximum Damerau-Levenshtein distance of interest.
+                  Defaults to None.
+
+    Returns:
+        The Damerau-Levenshtein distance as an integer, or None if the distance
+        exceeds max_dist.
+    """
+
+    osa_distance = calculate_osa_distance(word_a, word_b, char_masks)
+    if max_dist is None:
+        if osa_distance <= 2:
+            return osa_distance
+        return calculate_dl_distance(word_a, word_b)
+
+    if osa_distance <= 2:
+        return osa_distance if osa_distance <= max_dist else None
+    if -(-2 * osa_distance // 3) > max_dist:
+        return None
+    return calculate_dl_distance_bounded(word_a, word_b, max_dist)
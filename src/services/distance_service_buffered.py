@@ -0,0 +1,112 @@
+""" Function that recursively calculates the Damerau-Levenshtein distance
+    between a given word and all keys in a trie data structure, without
+    allocating new objects for every node visited.
+
+    Works like the recursive search in distance_service_recursive, but the
+    matrix is allocated once, with one row for every possible key length,
+    and the row for a node is written over the row of the previously visited
+    node of the same depth. The characters on the path to the current node
+    are kept in a preallocated list, and a string is only built from them
+    when a word is accepted as a candidate.
+"""
+
+
+from services.alphabet_utils import(
+    CHAR_COUNT,
+    calc_char,
+    calc_index
+)
+from services.distance_service import(
+    calculate_row,
+    create_neighbour_sets,
+    init_matrix
+)
+from services.distance_service_recursive import(
+    add_word_as_candidate,
+    calculate_length_difference
+)
+
+
+def calculate_dl_distance_buffered(word_target: str, trie, max_dist=None, neighbour_check=False):
+    """ Calculates the Damerau-Lewenshtein distance between the given word
+        and all words in the given trie.
+
+    Args:
+        word_target: A string representing the word to be matched
+                     with the words in the trie (used as the target word).
+        trie: A Trie-, ArrayTrie- or Dawg-object containing the words in the wordlist.
+        max_dist: The maximum Damerau-Lewenshtein distance allowed.
+                  Defaults to None.
+        neighbour_check: A boolean indicating whether a substitution with a neighbouring
+                         key on the keyboard should be prioritised (i. e. assigned a
+                         slightly lower edit cost). Defaults to False.
+
+    Returns:
+        A list containing the word(s) from the trie with the lowest
+        Damerau-Levenshtein distance to the given word.
+    """
+
+    candidates = {}
+    search(word_target, trie, max_dist if max_dist else trie.get_max_keylength(),
+           neighbour_check, lambda word, dist: add_word_as_candidate(candidates, word, dist))
+
+    if candidates.keys():
+        return candidates[min(candidates.keys())]
+    return []
+
+def search(word_target: str, trie, max_dist, neighbour_check, add_candidate,
+           early_depth=0, early_dist=0):
+    """ Searches a trie for the words within the given distance, using
+        a preallocated matrix.
+
+    Args:
+        word_target: The word we are trying to find close matches for.
+        trie: The Trie-, ArrayTrie- or Dawg-object being searched.
+        max_dist: The maximum Damerau-Levenshtein distance allowed. Lowered to
+                  the distance of every word found.
+        neighbour_check: A boolean indicating whether substitutions by
+                         neighbouring keys should be prioritised.
+        add_candidate: A function called with every word found and its
+                       Damerau-Levenshtein distance.
+        early_depth: The depth of the trie up to which the smaller maximum
+                     distance is used for pruning. Defaults to 0.
+        early_dist: The smaller maximum distance. Defaults to 0.
+
+    Returns:
+        The smallest distance found, or max_dist if no words were found.
+    """
+
+    target_indexes = [calc_index(char) for char in word_target]
+    neighbours = create_neighbour_sets(neighbour_check)
+
+    matrix = init_matrix(trie.get_max_keylength() + 2, len(word_target) + 2,
+                         len(word_target) + trie.get_max_keylength() + 1)
+    rows_per_char = [1] * CHAR_COUNT
+    chars = [""] * len(matrix)
+
+    def calculate(node, index, row, max_dist):
+        curr_row = calculate_row(matrix, row, index, rows_per_char, target_indexes,
+                                 neighbours[index])
+
+        chars[row] = calc_char(index)
+        prev_row_w_char = rows_per_char[index]
+        rows_per_char[index] = row
+
+        if trie.is_valid_end(node) and curr_row[-1] <= max_dist:
+            add_candidate("".join(chars[2:row+1]), curr_row[-1])
+            max_dist = curr_row[-1]
+
+        row_min = min(curr_row)
+        if row > early_depth or row_min <= early_dist:
+            for child_index, child in trie.get_children(node):
+                if row_min <= max_dist and calculate_length_difference(
+                        trie, child, row, len(target_indexes)) <= max_dist:
+                    max_dist = calculate(child, child_index, row+1, max_dist)
+
+        rows_per_char[index] = prev_row_w_char
+        return max_dist
+
+    for index, node in trie.get_children(trie.get_root()):
+        if calculate_length_difference(trie, node, 1, len(target_indexes)) <= max_dist:
+            max_dist = calculate(node, index, 2, max_dist)
+    return max_dist
@@ -0,0 +1,219 @@
+""" Function that calculates the Damerau-Levenshtein distance between a given
+    word and all keys in a trie data structure, traversing the trie with an
+    explicit stack instead of recursion.
+
+    The rows of the matrix are calculated in the same order and in the same
+    way as in distance_service_recursive, so the results are identical. Like
+    in distance_service_buffered, the matrix rows are preallocated and
+    overwritten in place. Below the children of a node, an entry restoring
+    the value in rows_per_char replaced by the row of the node is pushed to
+    the stack, so that the value is restored once the subtree of the node has
+    been searched, which is what returning from the recursive calls does in
+    the recursive search.
+
+    Optionally the children of a node are visited in order of how well their
+    character fits the next characters of the target word, instead of in
+    alphabetical order. A close candidate is then usually found early, which
+    lowers the maximum distance allowed, so that more of the remaining
+    branches can be pruned. The candidates are sorted alphabetically in the
+    end, so the results are the same in both cases.
+
+    The iterative deepening search runs the iterative search with the maximum
+    distances 1, 2, 3 and so on, and stops at the first distance where
+    candidates are found. As most misspellings are within one or two edits
+    of a correct word, the first searches are usually tightly pruned and the
+    whole trie never has to be searched with a loose maximum distance.
+"""
+
+
+from functools import partial
+from services.alphabet_utils import(
+    CHAR_COUNT,
+    NEIGHBOURING_KEYS,
+    calc_char,
+    calc_index
+)
+from services.distance_service import(
+    calculate_row,
+    create_neighbour_sets,
+    init_matrix
+)
+from services.distance_service_recursive import(
+    add_word_as_candidate,
+    calculate_length_difference
+)
+
+
+def calculate_dl_distance_iterative(word_target: str, trie, max_dist=None, neighbour_check=False,
+                                    ordered=False):
+    """ Calculates the Damerau-Lewenshtein distance between the given word
+        and all words in the given trie.
+
+    Args:
+        word_target: A string representing the word to be matched
+                     with the words in the trie (used as the target word).
+        trie: A Trie-, ArrayTrie- or Dawg-object containing the words in the wordlist.
+        max_dist: The maximum Damerau-Lewenshtein distance allowed.
+                  Defaults to None.
+        neighbour_check: A boolean indicating whether a substitution with a neighbouring
+                         key on the keyboard should be prioritised (i. e. assigned a
+                         slightly lower edit cost). Defaults to False.
+        ordered: A boolean indicating whether children fitting the next characters
+                 of the target word should be visited first. Defaults to False.
+
+    Returns:
+        A list containing the word(s) from the trie with the lowest
+        Damerau-Levenshtein distance to the given word.
+    """
+
+    candidates = {}
+    key_length = trie.get_max_keylength()
+    target_indexes = [calc_index(char) for char in word_target]
+    neighbours = create_neighbour_sets(neighbour_check)
+
+    matrix = init_matrix(key_length + 2, len(word_target) + 2, len(word_target) + key_length + 1)
+    rows_per_char = [1] * CHAR_COUNT
+    chars = [""] * (key_length + 2)
+
+    max_dist = max_dist if max_dist else key_length
+    stack = []
+    push_children(stack, trie, trie.get_root(), 1, word_target, ordered)
+
+    while stack:
+        node, index, row = stack.pop()
+        if node is None:
+            # The subtree of a node has been searched: restore the row where the
+            # character of the node was seen before it.
+            rows_per_char[index] = row
+        elif calculate_length_difference(trie, node, row-1, len(word_target)) <= max_dist:
+            curr_row = calculate_row(matrix, row, index, rows_per_char, target_indexes,
+                                     neighbours[index])
+
+            chars[row] = calc_char(index)
+            stack.append((None, index, rows_per_char[index]))
+            rows_per_char[index] = row
+
+            if trie.is_valid_end(node) and curr_row[-1] <= max_dist:
+                add_word_as_candidate(candidates, "".join(chars[2:row+1]), curr_row[-1])
+                max_dist = curr_row[-1]
+
+            if min(curr_row) <= max_dist:
+                push_children(stack, trie, node, row, word_target, ordered)
+
+    closest = candidates[min(candidates.keys())] if candidates.keys() else []
+    return sorted(closest) if ordered else closest
+
+def push_children(stack, trie, node, row: int, word_target: str, ordered: bool):
+    """ Pushes the children of a node to the stack of the iterative search, so
+        that the first child to be visited is on the top of the stack.
+
+    Args:
+        stack: The stack as a list of (node, index, row) tuples.
+        trie: The Trie-, ArrayTrie- or Dawg-object being searched.
+        node: The node whose children are pushed.
+        row: The row of the node in the matrix as an integer.
+        word_target: The word we are trying to find close matches for.
+        ordered: A boolean indicating whether the children are visited in the order
+                 given by order_children instead of in alphabetical order.
+    """
+
+    children = trie.get_children(node)
+    if ordered:
+        children = order_children(children, word_target, row-1)
+    stack.extend((child, index, row+1) for index, child in reversed(children))
+
+def calculate_dl_distance_deepening(word_target: str, trie, max_dist=None, neighbour_check=False):
+    """ Calculates the Damerau-Lewenshtein distance between the given word
+        and all words in the given trie, increasing the maximum distance
+        one step at a time.
+
+    Args:
+        word_target: A string representing the word to be matched
+                     with the words in the trie (used as the target word).
+        trie: A Trie-, ArrayTrie- or Dawg-object containing the words in the wordlist.
+        max_dist: The maximum Damerau-Lewenshtein distance allowed.
+                  Defaults to None.
+        neighbour_check: A boolean indicating whether a substitution with a neighbouring
+                         key on the keyboard should be prioritised (i. e. assigned a
+                         slightly lower edit cost). Defaults to False.
+
+    Returns:
+        A list containing the word(s) from the trie with the lowest
+        Damerau-Levenshtein distance to the given word.
+    """
+
+    return search_deepening(
+        partial(calculate_dl_distance_iterative, word_target, trie,
+                neighbour_check=neighbour_check),
+        trie, max_dist
+    )
+
+def search_deepening(search, trie, max_dist=None):
+    """ Runs a search with the maximum distances 1, 2, 3 and so on, until
+        candidates are found.
+
+    Nothing is reused between the searches: every one of them starts from the
+    root of the trie. In the worst case, when there are no words within
+    max_dist - 1 edits, the trie is searched max_dist times, which without a
+    given maximum distance means up to the length of the longest word in the
+    trie.
+
+    Args:
+        search: A function taking the maximum distance as its only argument and
+                returning a list of candidates.
+        trie: The Trie-, ArrayTrie- or Dawg-object being searched.
+        max_dist: The maximum Damerau-Lewenshtein distance allowed.
+                  Defaults to None, in which case the length of the longest
+                  word in the trie is used.
+
+    Returns:
+        The candidates found by the first search that found any, or the
+        candidates of the search with the largest maximum distance.
+    """
+
+    limit = max_dist if max_dist else trie.get_max_keylength()
+    dist = 1
+    while dist < limit:
+        candidates = search(dist)
+        if candidates:
+            return candidates
+        dist += 1
+    return search(limit)
+
+def order_children(children, word_target: str, position: int):
+    """ Orders the children of a node by how well they fit the target word.
+
+    Children with the character at the same position in the target word come
+    first, then children with the characters right before or after it
+    (possible insertions, deletions and transpositions), then children with
+    a neighbouring key of the character, and finally the rest in alphabetical
+    order.
+
+    Args:
+        children: A list of (index, child node) tuples in alphabetical order.
+        word_target: The word we are trying to find close matches for.
+        position: The position of the characters of the children in the words
+                  of the trie.
+
+    Returns:
+        The children as a new list of (index, child node) tuples.
+    """
+
+    if position >= len(word_target):
+        return children
+
+    next_char = word_target[position]
+    close_chars = word_target[max(0, position-1):position+2]
+    neighbouring_keys = NEIGHBOURING_KEYS[next_char]
+
+    def rank(child):
+        char = calc_char(child[0])
+        if char == next_char:
+            return 0
+        if char in close_chars:
+            return 1
+        if char in neighbouring_keys:
+            return 2
+        return 3
+
+    return sorted(children, key=rank)
@@ -0,0 +1,156 @@
+""" Functions that calculate the Damerau-Levenshtein distances between a given
+    word and all words in a wordlist using NumPy.
+
+    The words in the wordlist are grouped by length into integer arrays, so
+    that the matrices for all words in a group have the same dimensions and
+    can be stored in one three-dimensional array. The matrices are filled in
+    along their anti-diagonals: all cells on an anti-diagonal only depend on
+    cells on earlier anti-diagonals, which means a whole anti-diagonal of
+    every matrix in a group is calculated with a handful of array operations.
+
+    The calculation follows calculate_dl_distance in distance_service without
+    neighbouring key priority, including the bookkeeping of the rows and
+    columns where characters were last seen, so the results are the same.
+
+    NumPy is an optional dependency. If it is not installed, NUMPY_AVAILABLE
+    is False and the functions in this module cannot be used.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from services.alphabet_utils import(
+    CHAR_COUNT,
+    calc_index
+)
+
+NUMPY_AVAILABLE = np is not None
+
+
+def create_length_buckets(wordlist: list):
+    """ Groups the words in a wordlist by length.
+
+    Args:
+        wordlist: The dictionary used as a list of words.
+
+    Returns:
+        A dict where the keys are word lengths and the values tuples containing
+        the positions of the words in the wordlist and the characters of the
+        words as a two-dimensional array of alphabet indexes (one byte each).
+    """
+
+    positions_per_length = {}
+    for position, word in enumerate(wordlist):
+        positions_per_length.setdefault(len(word), []).append(position)
+
+    buckets = {}
+    for length, positions in positions_per_length.items():
+        codes = np.array([[calc_index(char) for char in wordlist[position]]
+                          for position in positions], dtype=np.uint8)
+        buckets[length] = (np.array(positions), codes.reshape(len(positions), length))
+    return buckets
+
+def calculate_lines_per_char(codes, chars):
+    """ Calculates where the given characters were last seen before each line
+        of the matrix.
+
+    Only the characters needed for a query are handled, so that the arrays stay
+    small enough to be calculated for every query instead of being stored with
+    the buckets.
+
+    Args:
+        codes: A two-dimensional array with the characters of one or more words
+               of the same length as alphabet indexes.
+        chars: An array containing the alphabet indexes of the characters.
+
+    Returns:
+        A three-dimensional array of 16-bit integers where the element
+        [k, i, line] is the index of the latest line before the given line,
+        where the character chars[k] was seen in the word i (1 if the character
+        was not seen).
+    """
+
+    count, length = codes.shape
+    lines_per_char = np.ones((len(chars), count, length + 2), dtype=np.int16)
+    if length > 1:
+        seen = codes[None, :, :length-1] == chars[:, None, None]
+        lines = np.where(seen, np.arange(2, length + 1, dtype=np.int16), np.int16(1))
+        lines_per_char[:, :, 3:] = np.maximum.accumulate(lines, axis=2)
+    return lines_per_char
+
+def calculate_dl_distances_numpy(word: str, buckets: dict, max_dist):
+    """ Calculates the Damerau-Levenshtein distances between the given word
+        and all words in the given length buckets.
+
+    Args:
+        word: The word to be matched as a string (used as the source word).
+        buckets: The wordlist grouped by length as returned by create_length_buckets.
+        max_dist: The maximum Damerau-Levenshtein distance allowed.
+
+    Returns:
+        A list of (position in wordlist, distance) tuples for all words within
+        the maximum distance, sorted by position.
+    """
+
+    word_codes = np.array([calc_index(char) for char in word], dtype=np.intp)
+    rows_per_char = calculate_lines_per_char(word_codes.reshape(1, len(word)),
+                                             np.arange(CHAR_COUNT))[:, 0].T
+
+    results = []
+    for length, (positions, codes) in buckets.items():
+        if abs(len(word) - length) > max_dist:
+            continue
+        distances = calculate_bucket(word_codes, rows_per_char, codes)
+        within = distances <= max_dist
+        results.extend(zip(positions[within].tolist(), distances[within].tolist()))
+
+    results.sort()
+    return results
+
+def calculate_bucket(word_codes, rows_per_char, codes):
+    """ Calculates the Damerau-Levenshtein distances between a word and all words
+        of the same length, one anti-diagonal at a time.
+
+    Args:
+        word_codes: The characters of the source word as an array of alphabet indexes.
+        rows_per_char: The rows where the characters of the source word were last seen.
+        codes: The characters of the target words as a two-dimensional array.
+
+    Returns:
+        An array containing the Damerau-Levenshtein distance to every target word.
+    """
+
+    rows = len(word_codes) + 2
+    cols = codes.shape[1] + 2
+    words = np.arange(len(codes))[:, None]
+    cols_per_char = calculate_lines_per_char(codes, word_codes)
+
+    matrix = np.full((len(codes), rows, cols), rows + cols, dtype=np.intp)
+    matrix[:, 1, 1:] = np.arange(cols - 1)
+    matrix[:, 1:, 1] = np.arange(rows - 1)
+
+    for diagonal in range(4, rows + cols - 1):
+        row = np.arange(max(2, diagonal - cols + 1), min(rows - 1, diagonal - 2) + 1)
+        col = diagonal - row
+        char_b = codes[:, col-2]
+
+        row_w_match = rows_per_char[row, char_b]
+        col_w_match = cols_per_char[row-2, words, col]
+
+        matrix[:, row, col] = np.minimum(
+            np.minimum(
+                matrix[:, row-1, col-1] + (word_codes[row-2] != char_b), # substitution
+                matrix[:, row, col-1] + 1 # insertion
+            ),
+            np.minimum(
+                matrix[:, row-1, col] + 1, # deletion
+                # transposition
+                matrix[words, row_w_match-1, col_w_match-1]
+                    + (row-row_w_match-1) + 1
+                    + (col-col_w_match-1)
+            )
+        )
+
+    return matrix[:, -1, -1]
@@ -0,0 +1,115 @@
+""" Function that calculates the Damerau-Levenshtein distance between a given
+    word and all keys in a trie data structure, searching the subtries of the
+    first characters in parallel processes.
+
+    The subtries below the first characters of the words are independent of
+    each other, so they can be searched in separate processes. The worker
+    processes are started once for every version of the dictionary (see
+    SearchPool): every worker builds a trie of its own for every first
+    character when it is started, and a search only sends the misspelling
+    and the search parameters to the workers. Every subtrie is searched with
+    the buffered search, and the results of the subtries are combined in
+    alphabetical order, so they are the same as the results of the recursive
+    search.
+
+    The workers share the smallest distance found so far in a shared value,
+    which is passed to them once when they are started. A worker reads it
+    before searching a subtrie and lowers it whenever it finds a closer word,
+    so the subtries searched later are pruned with the closest word found in
+    any of the workers.
+
+    The workers are started with the forkserver or spawn method instead of
+    being forked from the main process, which may be running other threads.
+    Without a pool of at least two processes, the trie is searched with the
+    iterative search instead.
+"""
+
+
+from entities.trie import Trie
+from services.distance_service_buffered import search
+from services.distance_service_iterative import calculate_dl_distance_iterative
+from services.distance_service_recursive import add_word_as_candidate
+
+# The tries of the worker process by first character ("tries"), and the
+# smallest distance shared by the workers ("bound"). Only set in the workers.
+_worker = {}
+
+
+def calculate_dl_distance_parallel(word_target: str, trie, max_dist=None, neighbour_check=False,
+                                   pool=None):
+    """ Calculates the Damerau-Lewenshtein distance between the given word
+        and all words in the given trie.
+
+    Args:
+        word_target: A string representing the word to be matched
+                     with the words in the trie (used as the target word).
+        trie: A Trie-, ArrayTrie- or Dawg-object containing the words in the wordlist.
+        max_dist: The maximum Damerau-Lewenshtein distance allowed.
+                  Defaults to None.
+        neighbour_check: A boolean indicating whether a substitution with a neighbouring
+                         key on the keyboard should be prioritised (i. e. assigned a
+                         slightly lower edit cost). Defaults to False.
+        pool: A SearchPool-object started with the words in the trie. Defaults to
+              None, in which case the trie is searched with the iterative search.
+
+    Returns:
+        A list containing the word(s) from the trie with the lowest
+        Damerau-Levenshtein distance to the given word.
+    """
+
+    if pool is None or pool.get_process_count() < 2:
+        return calculate_dl_distance_iterative(word_target, trie, max_dist, neighbour_check)
+
+    limit = max_dist if max_dist else trie.get_max_keylength()
+    results = [result for result in pool.search(word_target, limit, neighbour_check) if result]
+    if not results:
+        return []
+    min_dist = min(dist for dist, _ in results)
+    return [word for dist, words in results if dist == min_dist for word in words]
+
+def init_worker(words: list, bound):
+    """ Builds the tries of a worker process, one for every first character.
+
+    Args:
+        words: A list containing the words in the wordlist.
+        bound: A shared multiprocessing Value holding the maximum distance
+               allowed in the current search.
+    """
+
+    tries = {}
+    for word in words:
+        if word[0] not in tries:
+            tries[word[0]] = Trie()
+        tries[word[0]].add(word)
+    _worker["tries"] = tries
+    _worker["bound"] = bound
+
+def search_subtrie(first_char: str, word_target: str, neighbour_check: bool):
+    """ Searches the subtrie of one first character in a worker process,
+        within the smallest distance found so far by any worker.
+
+    Args:
+        first_char: The first character of the words in the subtrie as a string.
+        word_target: The word we are trying to find close matches for.
+        neighbour_check: A boolean indicating whether substitutions by
+                         neighbouring keys should be prioritised.
+
+    Returns:
+        A (distance, candidates) tuple with the lowest distance found in the
+        subtrie and the words with that distance, or None if no words within
+        the maximum distance were found.
+    """
+
+    bound = _worker["bound"]
+    candidates = {}
+
+    def add_candidate(word, dist):
+        add_word_as_candidate(candidates, word, dist)
+        with bound.get_lock():
+            bound.value = min(bound.value, dist)
+
+    min_dist = search(word_target, _worker["tries"][first_char], bound.value,
+                      neighbour_check, add_candidate)
+    if not candidates:
+        return None
+    return min_dist, candidates[min_dist]
@@ -0,0 +1,95 @@
+""" Function that calculates the Damerau-Levenshtein distance between a given
+    word and all keys in a trie data structure, using a forward trie and a trie
+    of reversed keys.
+
+    A misspelled word is split into two halves. If a word is within k edits of
+    the misspelled word, then either the first half contains at most k // 2 of
+    the edits, or the second half contains at most k - k // 2 - 1 of them.
+    In the first case the word is found by searching the forward trie, where
+    branches are pruned as soon as the first half of the word cannot be matched
+    within k // 2 edits. In the second case it is found by searching the trie
+    of reversed words with the reversed misspelling, pruning in the same way
+    with the smaller maximum distance. For k = 1 this means that either the
+    beginning or the end of the word matches the misspelling exactly.
+
+    The search can therefore prune branches close to the root, no matter
+    where in the word the edits are. Within the half with more edits, the
+    search is continued by the search in the other direction.
+"""
+
+
+from services.distance_service_buffered import search
+from services.distance_service_iterative import search_deepening
+
+
+def calculate_dl_distance_partition(word_target: str, trie, reversed_trie, max_dist=None,
+                                    neighbour_check=False):
+    """ Calculates the Damerau-Lewenshtein distance between the given word
+        and all words in the given trie.
+
+    Searches with the maximum distances 1, 2, 3 and so on (up to the given
+    maximum distance, or the length of the longest word in the trie) until
+    candidates are found (see search_deepening for the worst case).
+
+    Args:
+        word_target: A string representing the word to be matched
+                     with the words in the trie (used as the target word).
+        trie: A Trie-, ArrayTrie- or Dawg-object containing the words in the wordlist.
+        reversed_trie: A Trie-, ArrayTrie- or Dawg-object containing the words in
+                       the wordlist reversed.
+        max_dist: The maximum Damerau-Lewenshtein distance allowed.
+                  Defaults to None.
+        neighbour_check: A boolean indicating whether a substitution with a neighbouring
+                         key on the keyboard should be prioritised (i. e. assigned a
+                         slightly lower edit cost). Defaults to False.
+
+    Returns:
+        A list containing the word(s) from the trie with the lowest
+        Damerau-Levenshtein distance to the given word.
+    """
+
+    return search_deepening(
+        lambda dist: search_partitioned(word_target, trie, reversed_trie, dist, neighbour_check),
+        trie, max_dist
+    )
+
+def search_partitioned(word_target: str, trie, reversed_trie, max_dist, neighbour_check):
+    """ Finds the words closest to the given word within the given distance
+        by searching both tries.
+
+    Args:
+        word_target: The word we are trying to find close matches for.
+        trie: The trie containing the words in the wordlist.
+        reversed_trie: The trie containing the reversed words in the wordlist.
+        max_dist: The maximum Damerau-Levenshtein distance allowed.
+        neighbour_check: A boolean indicating whether substitutions by
+                         neighbouring keys should be prioritised.
+
+    Returns:
+        A list containing the word(s) from the trie with the lowest
+        Damerau-Levenshtein distance to the given word, in alphabetical order.
+    """
+
+    # The smallest possible difference between two distances.
+    step = 0.5 if neighbour_check else 1
+    half = len(word_target) // 2
+    forward_dist = max_dist // 2
+    backward_dist = max_dist - forward_dist - step
+
+    candidates = {}
+    curr_max_dist = search(word_target, trie, max_dist, neighbour_check,
+                           lambda word, dist: candidates.setdefault(dist, {}).setdefault(
+                               word, dist),
+                           half - forward_dist, forward_dist)
+    reversed_candidates = {}
+    search(word_target[::-1], reversed_trie, curr_max_dist, neighbour_check,
+           lambda word, dist: reversed_candidates.setdefault(dist, {}).setdefault(
+               word[::-1], dist),
+           len(word_target) - half - backward_dist, backward_dist)
+
+    for dist, words in reversed_candidates.items():
+        candidates[dist] = {**words, **candidates.get(dist, {})}
+    if candidates.keys():
+        return [f"{word}({dist})" for word, dist
+                in sorted(candidates[min(candidates.keys())].items())]
+    return []
@@ -0,0 +1,118 @@
+""" Function that recursively calculates the Damerau-Levenshtein distance
+    between a given word and all keys in a radix trie.
+
+    Works like the recursive search in distance_service_recursive, but
+    every edge of the radix trie holds a substring instead of a single
+    character. All matrix rows for the characters on an edge are
+    calculated in one loop, and the search only recurses (and builds
+    a new prefix string) once per edge. A branch is pruned as soon as
+    the smallest value in a row exceeds the maximum distance allowed,
+    even in the middle of an edge.
+"""
+
+
+from services.alphabet_utils import(
+    CHAR_COUNT,
+    calc_index
+)
+from services.distance_service import calculate_row, create_neighbour_sets
+from services.distance_service_recursive import add_word_as_candidate
+
+
+def calculate_dl_distance_radix(word_target: str, trie, max_dist=None, neighbour_check=False):
+    """ Calculates the Damerau-Lewenshtein distance between the given word
+        and all words in the given radix trie.
+
+    Args:
+        word_target: A string representing the word to be matched
+                     with the words in the trie (used as the target word).
+        trie: A RadixTrie-object containing the words in the wordlist.
+        max_dist: The maximum Damerau-Lewenshtein distance allowed.
+                  Defaults to None.
+        neighbour_check: A boolean indicating whether a substitution with a neighbouring
+                         key on the keyboard should be prioritised (i. e. assigned a
+                         slightly lower edit cost). Defaults to False.
+
+    Returns:
+        A list containing the word(s) from the trie with the lowest
+        Damerau-Levenshtein distance to the given word.
+    """
+
+    candidates = {}
+    big_cost = len(word_target) + trie.get_max_keylength() + 1
+    curr_max_dist = max_dist if max_dist else trie.get_max_keylength()
+    target_indexes = [calc_index(char) for char in word_target]
+    neighbours = create_neighbour_sets(neighbour_check)
+
+    rows_per_char = [1] * CHAR_COUNT
+    matrix = [[big_cost for j in range (len(word_target) + 2)]]
+    matrix += [[big_cost] + list(range(len(word_target) + 1))]
+
+    for node in trie.get_root().children:
+        curr_max_dist = calculate_edge(
+                            node, "", target_indexes, matrix, rows_per_char,
+                            curr_max_dist, candidates, neighbours
+                        )
+
+    if candidates.keys():
+        return candidates[min(candidates.keys())]
+    return []
+
+def calculate_edge(node, word_source, target_indexes, matrix, rows_per_char,
+                   max_dist, candidates, neighbours):
+    """ A recursive function for filling in the rows for all characters
+        on the edge leading to the given node.
+
+    Args:
+        node: The node at the end of the edge as a RadixNode-object.
+        word_source: A string holding the prefix handled so far.
+        target_indexes: A list containing the indexes of the characters of the
+                        word we are trying to find a close match for in the trie.
+        matrix: The matrix used for the Damerau-Levenshtein algorithm. The cells
+                of its first row are large enough never to be chosen.
+        rows_per_char: A list containing the indexes of rows where letters
+                       were last seen. The list is indexed by the ordinal number
+                       of the letters in the used alphabet.
+        max_dist: The maximum Damerau-Levenshtein distance allowed.
+        candidates: A dict containing candidate words for the correct spelling of
+                    the given word. Keys are the Damerau-Levenshtein distances,
+                    values lists containing words from the trie with that particular
+                    Damerau-Levenshtein distance to the given word.
+        neighbours: A list containing the indexes of the neighbouring keys of
+                    every letter as sets (empty, if substitutions with neighbouring
+                    keys are not prioritised).
+
+    Returns:
+        The maximum distance allowed after handling the subtree.
+    """
+
+    replaced = []
+
+    for char_source in node.label:
+        row = len(matrix)
+        index = calc_index(char_source)
+        matrix.append([matrix[0][0]] * len(matrix[0]))
+        curr_row = calculate_row(matrix, row, index, rows_per_char,
+                                 target_indexes, neighbours[index])
+        replaced.append((index, rows_per_char[index]))
+        rows_per_char[index] = row
+
+        if min(curr_row) > max_dist:
+            break
+    else:
+        word_source += node.label
+        if node.is_valid_end and curr_row[-1] <= max_dist:
+            add_word_as_candidate(candidates, word_source, curr_row[-1])
+            max_dist = curr_row[-1]
+
+        for child in node.children:
+            if min(curr_row) <= max_dist:
+                max_dist = calculate_edge(
+                    child, word_source, target_indexes, matrix, rows_per_char,
+                    max_dist, candidates, neighbours
+                )
+
+    for index, saved_row in reversed(replaced):
+        rows_per_char[index] = saved_row
+    del matrix[-len(replaced):]
+    return max_dist
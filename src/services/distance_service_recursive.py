@@ -13,15 +13,21 @@
 
     The following implementation also takes the possibility of the transposition
     of two characters into account.
+
+    In addition to pruning branches where the smallest value in the latest row
+    exceeds the current maximum distance, whole subtrees are skipped when the
+    difference between the length of the target word and the lengths of all keys
+    below a node (known from the length bounds stored in the trie) already
+    exceeds the maximum distance.
 """
 
 
 from services.alphabet_utils import(
     CHAR_COUNT,
-    NEIGHBOURING_KEYS,
     calc_index,
     calc_char
 )
+from services.distance_service import calculate_row, create_neighbour_sets
 
 
 def calculate_dl_distance_recursive(word_target: str, trie, max_dist=None, neighbour_check=False):
@@ -31,7 +37,7 @@ def calculate_dl_distance_recursive(word_target: str, trie, max_dist=None, neigh
     Args:
         word_target: A string representing the word to be matched
                      with the words in the trie (used as the target word).
-        trie: A Trie-object containing the words in the wordlist.
+        trie: A Trie- or ArrayTrie-object containing the words in the wordlist.
         max_dist: The maximum Damerau-Lewenshtein distance allowed.
                   Defaults to None.
         neighbour_check: A boolean indicating whether a substitution with a neighbouring
@@ -43,135 +49,108 @@ def calculate_dl_distance_recursive(word_target: str, trie, max_dist=None, neigh
         Damerau-Levenshtein distance to the given word.
     """
 
-    first_char_nodes = trie.get_root().children
+    first_char_nodes = trie.get_children(trie.get_root())
     candidates = {}
-    big_cost = trie.get_max_keylength()
+    big_cost = len(word_target) + trie.get_max_keylength() + 1
+    target_indexes = [calc_index(char) for char in word_target]
+    neighbours = create_neighbour_sets(neighbour_check)
 
-    curr_max_dist = max_dist if max_dist else big_cost
+    curr_max_dist = max_dist if max_dist else trie.get_max_keylength()
 
-    for i, node in enumerate(first_char_nodes):
-        if node:
-            rows_per_char = [1] * CHAR_COUNT
-            matrix = [[big_cost for j in range (len(word_target) + 2)]]
-            matrix += [[big_cost] + list(range(len(word_target) + 1))]
-            letter = calc_char(i)
+    for i, node in first_char_nodes:
+        if calculate_length_difference(trie, node, 1, len(word_target)) > curr_max_dist:
+            continue
+        rows_per_char = [1] * CHAR_COUNT
+        matrix = [[big_cost for j in range (len(word_target) + 2)]]
+        matrix += [[big_cost] + list(range(len(word_target) + 1))]
 
-            curr_max_dist = calculate(
-                                node, letter, "", word_target,
-                                1, matrix, rows_per_char, curr_max_dist,
-                                big_cost, candidates, neighbour_check
-                            )
+        curr_max_dist = calculate(
+                            trie, node, calc_char(i), target_indexes,
+                            1, matrix, rows_per_char, curr_max_dist,
+                            candidates, neighbours
+                        )
 
     if candidates.keys():
         return candidates[min(candidates.keys())]
     return []
 
-def calculate(node, char_source, word_source, word_target,
+def calculate(trie, node, word_source, target_indexes,
               prev_row_idx, matrix, rows_per_char, max_dist,
-              big_cost, candidates, neighbour_check):
+              candidates, neighbours):
     """ A recursive function for filling in the next row
         in the matrix.
 
     Args:
-        node: The current node in the trie as a Node-object.
-        char_source: A string representing the letter in the word from the
-                     trie being currently handled.
-        word_source: A string holding the prefix handled so far.
-        word_target: A string representing he word we are trying to find
-                     a close match for in the trie.
+        trie: The Trie- or ArrayTrie-object being traversed.
+        node: The current node in the trie (a Node- or CompactNode-object, or
+              a state of an ArrayTrie).
+        word_source: A string holding the prefix handled so far, ending with
+                     the letter in the word from the trie being currently handled.
+        target_indexes: A list containing the indexes of the characters of the
+                        word we are trying to find a close match for in the trie.
         prev_row_idx: The index of the previous row in the matrix as
                       an integer.
-        matrix: The matrix used for the Damerau-Levenshtein algorithm.
+        matrix: The matrix used for the Damerau-Levenshtein algorithm. The cells
+                of its first row are large enough never to be chosen.
         rows_per_char: A list containing the indexes of rows where letters
                        were last seen. The list is indexed by the ordinal number
                        of the letters in the used alphabet.
         max_dist: The maximum Damerau-Levenshtein distance allowed as an integer.
-        big_cost: An integer representing a DL-distance large enough never to
-                  be chosen.
         candidates: A dict containing candidate words for the correct spelling of
                     the given word. Keys are the Damerau-Levenshtein distances,
                     values lists containing words from the trie with that particular
                     Damerau-Levenshtein distance to the given word.
-        neighbour_check: A boolean indicating whether a substitution with a neighbouring
-                  key on the keyboard should be prioritised (i. e., assigned a
-                  slightly lower edit cost).
+        neighbours: A list containing the indexes of the neighbouring keys of
+                    every letter as sets (empty, if substitutions with neighbouring
+                    keys are not prioritised).
     """
 
-    cols = len(word_target) + 2
-    col_per_char = 0
-    curr_row = [big_cost, matrix[prev_row_idx][1] + 1]
-
-    for col in range(2, cols):
-        char_target = word_target[col-2]
-
-        row_w_match = rows_per_char[calc_index(char_target)]
-        col_w_match = col_per_char
-
-        if char_source == char_target:
-            cost = 0
-            col_per_char = col
-        elif neighbour_check and char_target in NEIGHBOURING_KEYS[char_source]:
-            cost = 0.5
-        else:
-            cost = 1
+    index = calc_index(word_source[-1])
+    matrix.append([matrix[0][0]] * len(matrix[0]))
+    curr_row = calculate_row(matrix, prev_row_idx + 1, index, rows_per_char,
+                             target_indexes, neighbours[index])
 
-        smallest_cost = calculate_min(matrix, curr_row, prev_row_idx,
-                                      col, cost, row_w_match,
-                                      col_w_match)
-        curr_row.append(smallest_cost)
+    tmp = rows_per_char[index]
+    rows_per_char[index] = prev_row_idx + 1
 
-    matrix.append(curr_row)
+    if trie.is_valid_end(node) and curr_row[-1] <= max_dist:
+        add_word_as_candidate(candidates, word_source, curr_row[-1])
+        max_dist = curr_row[-1]
 
-    tmp = rows_per_char[calc_index(char_source)]
-    rows_per_char[calc_index(char_source)] = prev_row_idx + 1
-
-    curr_max_dist = max_dist if max_dist else big_cost
-
-    if node.is_valid_end and curr_row[-1] <= curr_max_dist:
-        add_word_as_candidate(candidates, word_source+char_source, curr_row[-1])
-        curr_max_dist = curr_row[-1]
-
-    for i, child in enumerate(node.children):
-        if child and min(curr_row) <= curr_max_dist:
-            curr_max_dist = calculate(child, calc_char(i), word_source+char_source, word_target,
-                prev_row_idx+1, matrix, rows_per_char, curr_max_dist,
-                big_cost, candidates, neighbour_check
+    for i, child in trie.get_children(node):
+        if (min(curr_row) <= max_dist and calculate_length_difference(
+                trie, child, prev_row_idx+1, len(target_indexes)) <= max_dist):
+            max_dist = calculate(trie, child, word_source+calc_char(i),
+                target_indexes, prev_row_idx+1, matrix, rows_per_char, max_dist,
+                candidates, neighbours
             )
 
-    rows_per_char[calc_index(char_source)] = tmp
+    rows_per_char[index] = tmp
     matrix.pop()
-    return curr_max_dist
+    return max_dist
+
 
+def calculate_length_difference(trie, node, prefix_length, target_length):
+    """ A helper function for calculating a lower bound for the Damerau-Levenshtein
+        distance between the target word and all keys below a node.
 
-def calculate_min(matrix, curr_row, prev_row_idx, col, cost, row_w_match, col_w_match):
-    """ A helper function for calculating the smallest Damerau-Levenshtein-distance
-        value for the current cell in the matrix.
+    The distance between two words is at least the difference of their lengths.
 
     Args:
-        matrix: The matrix used for calculating the Damerau-Levenshtein distance.
-        curr_row: A list containing the edit costs in the current row so far.
-        prev_row_idx: An integer representing the index number of the previous row.
-        col: The index number of the current column as an integer.
-        cost: The cost of a substitution edit (0 or 1). Neighbouring key substitutions
-              are assigned a cost of 0.5, if prioritising substitutions by neighbouring
-              keys is activated.
-        row_w_match: The latest row where the character in the current column
-                     was seen.
-        col_w_match: The latest column where the character in the current
-                     row was seen.
+        trie: The Trie- or ArrayTrie-object being traversed.
+        node: The node in the trie.
+        prefix_length: The number of characters on the path to the node
+                       (including the character of the node itself).
+        target_length: The length of the target word as an integer.
 
     Returns:
-        An integer representing the smallest edit distance value.
+        The smallest length difference between the target word and any key
+        below the node as an integer.
     """
 
-    subst = matrix[prev_row_idx][col-1] + cost
-    insert = curr_row[col-1] + 1
-    delete = matrix[prev_row_idx][col] + 1
-    transp = (matrix[row_w_match-1][col_w_match-1]
-                + (prev_row_idx-row_w_match) + 1
-                + (col-col_w_match-1)
-    )
-    return min(subst, insert, delete, transp)
+    min_length, max_length = trie.get_length_bounds(node)
+    return max(0, prefix_length + min_length - target_length,
+               target_length - prefix_length - max_length)
 
 def add_word_as_candidate(candidates, word, dl_distance):
     """ Adds word as candidate for correct spelling
@@ -0,0 +1,75 @@
+import re
+
+VOWELS = "aeiou"
+
+# Replacements of the first letters of a word, tried in order.
+INITIALS = (("ae", "e"), ("gn", "n"), ("kn", "n"), ("pn", "n"), ("wr", "r"),
+            ("wh", "w"), ("x", "s"))
+
+# The codes of the letters: for every letter, a list of (pattern, code) rules
+# tried in order, and the code used if no pattern matches the word at the
+# position of the letter. The patterns look at the letters around the letter,
+# e.g. "(?<=s)c[eiy]" matches a "c" after an "s" and before a front vowel.
+# Letters not in the table are their own codes.
+RULES = {
+    **{vowel: ([("(?<=.)[aeiou]", "")], vowel) for vowel in VOWELS},
+    "b": ([("(?<=m)b$", "")], "b"),
+    "c": ([("(?<=s)c(h|ia)", "k"), ("c(h|ia)", "x"), ("(?<=s)c[eiy]", ""),
+           ("c[eiy]", "s")], "k"),
+    "d": ([("dg[eiy]", "j")], "t"),
+    "g": ([("gh(?![aeiou])", ""), ("gn(ed)?$", ""), ("(?<=d)g[eiy]", ""),
+           ("g[eiy]", "j")], "k"),
+    "h": ([("(?<=[^cgpst])h[aeiou]", "h")], ""),
+    "k": ([("(?<=c)k", "")], "k"),
+    "p": ([("ph", "f")], "p"),
+    "q": ([], "k"),
+    "s": ([("s(h|i[ao])", "x")], "s"),
+    "t": ([("ti[ao]", "x"), ("th", "0"), ("tch", "")], "t"),
+    "v": ([], "f"),
+    "w": ([("w[aeiou]", "w")], ""),
+    "x": ([], "ks"),
+    "y": ([("y[aeiou]", "y")], ""),
+    "z": ([], "s")
+}
+COMPILED_RULES = {char: ([(re.compile(pattern), code) for pattern, code in rules], default)
+                  for char, (rules, default) in RULES.items()}
+
+
+def calculate_phonetic_key(word: str):
+    """Calculates a phonetic key for the given word.
+
+    The key is a simplified version of Metaphone: letters and letter
+    combinations that sound alike are replaced by the same code (see RULES),
+    and vowels other than an initial one are dropped. Words that sound alike,
+    such as "recieve" and "receive" or "definately" and "definitely",
+    therefore often get the same key even if their Damerau-Levenshtein
+    distance is large.
+
+    Args:
+        word: The word as a string.
+
+    Returns:
+        The phonetic key as a string (empty for an empty word).
+    """
+
+    word = word.lower()
+    for initial, replacement in INITIALS:
+        if word.startswith(initial):
+            word = replacement + word[len(initial):]
+            break
+    word = "".join(char for position, char in enumerate(word)
+                   if position == 0 or char != word[position-1])
+
+    key = []
+    for position, char in enumerate(word):
+        rules, code = COMPILED_RULES.get(char, ((), char))
+        for pattern, rule_code in rules:
+            if pattern.match(word, position):
+                code = rule_code
+                break
+
+        for code_char in code:
+            if not key or key[-1] != code_char:
+                key.append(code_char)
+
+    return "".join(key)
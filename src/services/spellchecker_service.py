@@ -1,8 +1,70 @@
+from functools import partial
 from time import perf_counter
+from config import(
+    BASELINE_BACKEND,
+    BASELINE_PREFILTER,
+    CACHE_SIZE,
+    SPELLING_ERRORS_PATH,
+    SYMSPELL_MAX_EDIT,
+    TRIE_TYPE
+)
 from entities.trie import Trie
+from entities.array_trie import ArrayTrie
+from entities.bk_tree import BKTree
+from entities.dawg import Dawg
+from entities.engine_planner import EnginePlanner
+from entities.index_registry import IndexRegistry
+from entities.ngram_index import NGramIndex
+from entities.phonetic_index import PhoneticIndex
+from entities.radix_trie import RadixTrie
+from entities.search_pool import SearchPool
+from entities.symspell_index import SymSpellIndex
+from repositories.corrections_repository import CorrectionsRepository, corrections_repository
+from repositories.query_log_repository import query_log_repository
 from repositories.wordlist_repository import wordlist_repository
-from services.distance_service import calculate_dl_distance
+from repositories.snapshot_repository import snapshot_repository
+from services.distance_service import(
+    calculate_dl_distance,
+    calculate_dl_distance_bounded
+)
+from services.distance_service_automaton import calculate_dl_distance_automaton
+from services.distance_service_best_first import calculate_suggestions
+from services.distance_service_bit_parallel import(
+    calculate_char_masks,
+    calculate_dl_distance_bit_parallel
+)
+from services.distance_service_buffered import calculate_dl_distance_buffered
+from services.distance_service_iterative import(
+    calculate_dl_distance_deepening,
+    calculate_dl_distance_iterative
+)
+from services.distance_service_parallel import calculate_dl_distance_parallel
+from services.distance_service_partition import calculate_dl_distance_partition
+from services.distance_service_numpy import(
+    NUMPY_AVAILABLE,
+    create_length_buckets,
+    calculate_dl_distances_numpy
+)
 from services.distance_service_recursive import calculate_dl_distance_recursive
+from services.distance_service_radix import calculate_dl_distance_radix
+
+INDEXED_SEARCHES = {
+    "symspell": ["symspell"],
+    "bk_tree": ["bk_tree"],
+    "phonetic": ["phonetic", "ngram"],
+    "partition": ["reversed_dictionary"],
+    "parallel": ["search_pool"]
+}
+
+SEARCH_MODES = {
+    "recursive": calculate_dl_distance_recursive,
+    "buffered": calculate_dl_distance_buffered,
+    "iterative": calculate_dl_distance_iterative,
+    "ordered": partial(calculate_dl_distance_iterative, ordered=True),
+    "parallel": calculate_dl_distance_parallel,
+    "deepening": calculate_dl_distance_deepening,
+    "automaton": calculate_dl_distance_automaton
+}
 
 
 class SpellcheckerService:
@@ -12,18 +74,66 @@ class SpellcheckerService:
     def __init__(self):
         """ The class constructor.
         """
-        self._dictionary = Trie()
+        self._dictionary = self._create_dictionary()
         self._latest_search_time = 0
+        self._indexes = self._create_index_registry()
+        self._planner = None
         self.load_wordlist()
 
     def load_wordlist(self):
         """ Loads a wordlist from file on disk and creates a trie dictionary.
+
+        If the double-array trie is used (TRIE_TYPE is "array") and a compiled
+        snapshot of the current wordlist exists, the snapshot is memory-mapped
+        and used as the dictionary instead. Other types of tries are always
+        built from the wordlist.
         """
 
+        self._indexes.clear()
+        self._planner = None
+        if TRIE_TYPE == "array":
+            snapshot = snapshot_repository.load(wordlist_repository.get_checksum())
+            if snapshot:
+                self._dictionary = snapshot
+                return
+
         wordlist = wordlist_repository.get_wordlist()
         for word in wordlist:
             self._dictionary.add(word)
 
+    def compile_corrections(self, min_count=2):
+        """ Compiles the table of known misspellings used by correct.
+
+        The table contains the misspellings in the list of common misspellings
+        (SPELLING_ERRORS_FILENAME) whose intended words are in the dictionary,
+        and the misspelled words logged at least min_count times in the query
+        log (if QUERY_LOG_FILENAME is set), corrected with the fastest engine.
+        The running program reads the new table on its next lookup.
+
+        Args:
+            min_count: How many times a word must have been logged to be added
+                       to the table, as an integer. Defaults to 2.
+
+        Returns:
+            The number of misspellings in the table as an integer.
+        """
+
+        corrections = {}
+        corpus = CorrectionsRepository(SPELLING_ERRORS_PATH).get_corrections()
+        for misspelling, intended in corpus.items():
+            words = [word for word in intended if self.find_word(word)]
+            if words and not self.find_word(misspelling):
+                corrections[misspelling] = words
+
+        for query, count in query_log_repository.get_counts().items():
+            if count >= min_count and query not in corrections and not self.find_word(query):
+                words = [candidate.split("(")[0] for candidate in self._correct(query)]
+                if words:
+                    corrections[query] = words
+
+        corrections_repository.save(corrections)
+        return len(corrections)
+
     def add_word(self, word: str):
         """ Adds a new word to the dictionary and the wordlist file.
 
@@ -39,9 +149,28 @@ class SpellcheckerService:
         if not self._dictionary.find(word):
             new_word = wordlist_repository.add(word)
             self._dictionary.add(new_word)
+            self._indexes.add(new_word)
             return new_word
         return None
 
+    def delete_word(self, word: str):
+        """ Deletes a word from the dictionary and the wordlist file.
+
+        Args:
+            word: The word to be deleted as a string.
+
+        Returns:
+            The deleted word if the operation was carried out, None if the word
+            was not found in the dictionary.
+        """
+
+        if self._dictionary.find(word):
+            deleted_word = wordlist_repository.delete(word)
+            self._dictionary.remove(deleted_word)
+            self._indexes.remove(deleted_word)
+            return deleted_word
+        return None
+
     def find_word(self, word: str):
         """ Checks if the word exists in the dictionary.
 
@@ -78,6 +207,13 @@ class SpellcheckerService:
     def find_closest_match(self, word:str, max_edit=None, neighbour_check=False):
         """ Finds closest matching words in the dictionary for the given word.
 
+        If BASELINE_BACKEND is set to numpy and NumPy is installed, the distances
+        to all words are calculated with NumPy (unless neighbouring keys are
+        prioritised). Otherwise, if BASELINE_PREFILTER is set to ngram and the
+        maximum edit distance is given, the words are first filtered with an
+        n-gram index, and the distances are only calculated for the words that
+        pass the filter.
+
         Args:
             word: The word to be matched.
             max_edit: An integer describing the maximum edit distance
@@ -98,29 +234,22 @@ class SpellcheckerService:
 
         start = perf_counter()
 
-        candidates = []
-        wordlist = self.get_all()
-        min_dist = max_edit if max_edit else max(len(word), len(wordlist[0]))
-        for dict_word in wordlist:
-            if abs(len(word)-len(dict_word)) > min_dist:
-                continue
-            dl_dist = calculate_dl_distance(word, dict_word, neighbour_check)
-            if dl_dist <= min_dist:
-                if dl_dist < min_dist:
-                    candidates.clear()
-                    min_dist = dl_dist
-                candidates.append(f"{dict_word}({dl_dist})")
+        if BASELINE_BACKEND == "numpy" and NUMPY_AVAILABLE and not neighbour_check:
+            candidates = self._find_closest_match_numpy(word, max_edit)
+        else:
+            candidates = self._find_closest_match_python(word, max_edit, neighbour_check)
 
         end = perf_counter()
         self._latest_search_time = end-start
 
         return candidates
 
-    def find_closest_match_recursively(self, word: str, max_edit=None, neighbour_check=False):
+    def find_closest_match_recursively(self, word: str, max_edit=None, neighbour_check=False,
+                                       mode="recursive"):
         """ Finds closest matching words in the dictionary for the given word.
 
         The search utilizes a recursive traversal of the trie for
-        faster perfomance.
+        faster perfomance. The results are cached (see get_cache_stats).
 
         Args:
             word: The word to be matched.
@@ -129,6 +258,9 @@ class SpellcheckerService:
             neighbour_check: A boolean indicating whether substitutions by
                              neighbouring characters on the keyboard should be
                              prioritised.
+            mode: The search implementation used as a string (one of the keys
+                  in SEARCH_MODES). Defaults to "recursive". A radix trie is
+                  searched with its own implementation in the recursive mode.
 
         Returns:
             Returns:
@@ -141,15 +273,201 @@ class SpellcheckerService:
         if self.find_word(word):
             return [word]
 
+        return self._search_with_cache(mode, partial(self._find_closest_match_trie, mode=mode),
+                                       word, max_edit, neighbour_check)
+
+    def find_closest_match_indexed(self, word: str, max_edit=None, neighbour_check=False,
+                                   index="symspell"):
+        """ Finds closest matching words in the dictionary for the given word.
+
+        The candidates are looked up in an index built from the dictionary and
+        ranked by their Damerau-Levenshtein distances. The index is built before
+        the first search using it (see build_index), and kept up to date when
+        words are added or deleted. The indexes are:
+        - "symspell": A symmetric delete index. Only words within
+          SYMSPELL_MAX_EDIT edits of the given word are found.
+        - "bk_tree": A BK-tree, which finds the closest words at any distance.
+        - "phonetic": A phonetic key index, combined with the n-gram index.
+          The words that sound like the given word and the words within one
+          edit of it are found, so phonetic misspellings are corrected without
+          searching the dictionary with a large maximum distance.
+
+        Args:
+            word: The word to be matched.
+            max_edit: An integer describing the maximum edit distance
+                      allowed. Defaults to None (for the symmetric delete
+                      index SYMSPELL_MAX_EDIT, larger values are capped to it).
+            neighbour_check: A boolean indicating whether substitutions by
+                             neighbouring characters on the keyboard should be
+                             prioritised.
+            index: The index used as a string ("symspell", "bk_tree" or
+                   "phonetic"). Defaults to "symspell".
+
+        Returns:
+            A list of candidate words with the lowest Damerau-Lewenshtein
+            distance to the given word. If the word itself was found in the
+            dictionary (i.e. was correctly spelled) the list contains
+            only the word itself.
+        """
+
+        if self.find_word(word):
+            return [word]
+
+        self.build_index(index)
+        searches = {
+            "symspell": self._find_closest_match_symspell,
+            "bk_tree": self._find_closest_match_bk_tree,
+            "phonetic": self._find_closest_match_phonetic
+        }
+        start = perf_counter()
+        candidates = searches[index](word, max_edit, neighbour_check)
+        end = perf_counter()
+        self._latest_search_time = end-start
+
+        return candidates
+
+    def find_closest_match_partition(self, word: str, max_edit=None, neighbour_check=False):
+        """ Finds closest matching words in the dictionary for the given word.
+
+        The word is split into two halves, and the dictionary is searched
+        both forwards and with the reversed word in a trie of reversed words,
+        which is built on the first search. Either half of a matching word
+        contains at most half of the edits, so branches can be pruned close
+        to the root whether the errors are at the beginning or at the end of
+        the word.
+
+        Args:
+            word: The word to be matched.
+            max_edit: An integer describing the maximum edit distance
+                      allowed. Defaults to None.
+            neighbour_check: A boolean indicating whether substitutions by
+                             neighbouring characters on the keyboard should be
+                             prioritised.
+
+        Returns:
+            A list of candidate words with the lowest Damerau-Lewenshtein
+            distance to the given word. If the word itself was found in the
+            dictionary (i.e. was correctly spelled) the list contains
+            only the word itself.
+        """
+
+        if self.find_word(word):
+            return [word]
+
+        self.build_index("partition")
         start = perf_counter()
 
-        candidates = calculate_dl_distance_recursive(word, self._dictionary,
-                                                     max_edit, neighbour_check)
+        candidates = calculate_dl_distance_partition(
+            word, self._dictionary, self._indexes.get("reversed_dictionary"),
+            max_edit, neighbour_check
+        )
         end = perf_counter()
         self._latest_search_time = end-start
 
         return candidates
 
+    def correct(self, word: str, max_edit=None, neighbour_check=False):
+        """ Finds closest matching words in the dictionary for the given word
+        with the search engine expected to be the fastest.
+
+        The engine is chosen by a planner (see EnginePlanner) based on the
+        search times of the engines for earlier queries of the same length,
+        maximum edit distance and neighbouring key priority. When a class of
+        queries is seen for the first time, the engines are timed with a few
+        misspellings created from the dictionary (see calibrate). Only the
+        engines returning the same results as the recursive search are used,
+        and the BK-tree is left out, as building it takes seconds. The results
+        are cached (see get_cache_stats).
+
+        Before any search, the word is looked up in the table of known
+        misspellings (see compile_corrections). If the table contains intended
+        words for it within the maximum edit distance, they are returned instead,
+        ordered by their distances. Misspelled words are written to the query
+        log, if QUERY_LOG_FILENAME is set.
+
+        Args:
+            word: The word to be matched.
+            max_edit: An integer describing the maximum edit distance
+                      allowed. Defaults to None.
+            neighbour_check: A boolean indicating whether substitutions by
+                             neighbouring characters on the keyboard should be
+                             prioritised.
+
+        Returns:
+            A list of candidate words with the lowest Damerau-Lewenshtein
+            distance to the given word. If the word itself was found in the
+            dictionary (i.e. was correctly spelled) the list contains
+            only the word itself.
+        """
+
+        if self.find_word(word):
+            return [word]
+
+        query_log_repository.add(word)
+        start = perf_counter()
+        candidates = self._find_known_corrections(word, max_edit, neighbour_check)
+        if candidates:
+            self._latest_search_time = perf_counter() - start
+            return candidates
+
+        return self._search_with_cache("correct", self._correct, word, max_edit,
+                                       neighbour_check)
+
+    def calibrate(self, sample_count=3):
+        """ Times the search engines used by correct with a few misspellings
+        created from the dictionary.
+
+        All classes of queries are calibrated: short, medium and long words,
+        without a maximum edit distance and with maximum edit distances 1-3,
+        with and without neighbouring key priority. This takes about 3.5 s on
+        the google-10000 wordlist, so the app does not calibrate in advance: a
+        class that has not been calibrated (e.g. because the dictionary has
+        changed a lot since) is calibrated when it is first seen, which delays
+        that query by about 0.15 s.
+
+        Args:
+            sample_count: The number of misspellings per class of queries
+                          as an integer. Defaults to 3.
+        """
+
+        planner = self._get_planner()
+        wordlist = self.get_all()
+        for length_class in range(3):
+            for max_edit in range(4):
+                for neighbour_check in [False, True]:
+                    self._calibrate_query_class(planner, (length_class, max_edit,
+                                                          neighbour_check),
+                                                wordlist, sample_count)
+
+    def suggest(self, word: str, suggestion_count=5, max_edit=None, neighbour_check=False):
+        """ Finds the words in the dictionary closest to the given word, ranked by
+        Damerau-Levenshtein distance.
+
+        Args:
+            word: The word to be matched.
+            suggestion_count: The maximum number of suggestions as an integer.
+                              Defaults to 5.
+            max_edit: An integer describing the maximum edit distance
+                      allowed. Defaults to None.
+            neighbour_check: A boolean indicating whether substitutions by
+                             neighbouring characters on the keyboard should be
+                             prioritised.
+
+        Returns:
+            A list of at most suggestion_count words with their Damerau-Lewenshtein
+            distances to the given word, closest first. Words with the same distance
+            are in alphabetical order.
+        """
+
+        start = perf_counter()
+
+        suggestions = calculate_suggestions(word, self._dictionary, suggestion_count,
+                                            max_edit, neighbour_check)
+        end = perf_counter()
+        self._latest_search_time = end-start
+
+        return [f"{dict_word}({dl_dist})" for dl_dist, dict_word in suggestions]
+
     def get_all(self):
         """ Returns all words in the dictionary as a list.
 
@@ -163,9 +481,41 @@ class SpellcheckerService:
         """ Clears the dictionary and deletes the content in the wordlist file.
         """
 
-        self._dictionary = Trie()
+        self._dictionary = self._create_dictionary()
+        self._indexes.clear()
+        self._planner = None
         wordlist_repository.delete_all()
 
+    def build_index(self, search: str):
+        """ Builds the indexes used by a search, unless they have already been
+        built, so that building them is not included in the search time.
+
+        Args:
+            search: The name of the search as a string (one of the keys in
+                    INDEXED_SEARCHES: the indexes of find_closest_match_indexed,
+                    "partition" for find_closest_match_partition, or "parallel"
+                    for the worker processes of the parallel search mode).
+        """
+
+        for name in INDEXED_SEARCHES[search]:
+            self._indexes.get(name)
+
+    def get_cache_stats(self):
+        """Returns the statistics of the cache of search results.
+
+        The results of find_closest_match_recursively and correct are cached
+        by the word, the maximum edit distance, the neighbouring key priority,
+        the search implementation and the version of the dictionary, which
+        changes whenever words are added or deleted.
+
+        Returns:
+            A dict with the number of cache hits, misses and evictions so far
+            and the number of cached results (under the keys "hits", "misses",
+            "evictions" and "size").
+        """
+
+        return self._indexes.get_cache_stats()
+
     def get_search_time(self):
         """Returns time spent for latest search
 
@@ -202,5 +552,234 @@ class SpellcheckerService:
             + f"\n({self.get_dictionary_size()} words in dictionary.)"
         )
 
+    def _find_closest_match_python(self, word: str, max_edit=None, neighbour_check=False):
+        candidates = []
+        if BASELINE_PREFILTER == "ngram" and max_edit:
+            # With neighbouring key priority, a distance within max_edit may
+            # correspond to up to twice as many edits.
+            wordlist = self._indexes.get("ngram").lookup(
+                word, 2*max_edit if neighbour_check else max_edit
+            )
+        else:
+            wordlist = self.get_all()
+        if not wordlist:
+            return candidates
+        min_dist = max_edit if max_edit else max(len(word), len(wordlist[0]))
+        char_masks = calculate_char_masks(word)
+        for dict_word in wordlist:
+            if abs(len(word)-len(dict_word)) > min_dist:
+                continue
+            if neighbour_check:
+                dl_dist = calculate_dl_distance_bounded(word, dict_word, min_dist,
+                                                        neighbour_check)
+            else:
+                dl_dist = calculate_dl_distance_bit_parallel(word, dict_word,
+                                                             char_masks, min_dist)
+            if dl_dist is not None and dl_dist <= min_dist:
+                if dl_dist < min_dist:
+                    candidates.clear()
+                    min_dist = dl_dist
+                candidates.append(f"{dict_word}({dl_dist})")
+
+        return candidates
+
+    def _find_closest_match_numpy(self, word: str, max_edit=None):
+        wordlist, buckets = self._indexes.get("length_buckets")
+        if not wordlist:
+            return []
+
+        max_dist = max_edit if max_edit else max(len(word), len(wordlist[0]))
+        distances = calculate_dl_distances_numpy(word, buckets, max_dist)
+        if not distances:
+            return []
+
+        min_dist = min(dl_dist for _, dl_dist in distances)
+        return [f"{wordlist[position]}({dl_dist})"
+                for position, dl_dist in distances if dl_dist == min_dist]
+
+    def _search_with_cache(self, engine: str, search, word: str, max_edit, neighbour_check):
+        start = perf_counter()
+        key = (word, max_edit, neighbour_check, engine)
+        candidates = self._indexes.get_cached(key)
+        if candidates is None:
+            candidates = search(word, max_edit, neighbour_check)
+            self._indexes.put_cached(key, candidates)
+        else:
+            self._latest_search_time = perf_counter() - start
+        return list(candidates)
+
+    def _find_closest_match_trie(self, word: str, max_edit=None, neighbour_check=False,
+                                 mode="recursive"):
+        if isinstance(self._dictionary, RadixTrie) and mode == "recursive":
+            search = calculate_dl_distance_radix
+        elif mode == "parallel":
+            search = partial(SEARCH_MODES[mode], pool=self._indexes.get("search_pool"))
+        else:
+            search = SEARCH_MODES[mode]
+
+        start = perf_counter()
+        candidates = search(word, self._dictionary, max_edit, neighbour_check)
+        end = perf_counter()
+        self._latest_search_time = end-start
+
+        return candidates
+
+    def _find_known_corrections(self, word: str, max_edit=None, neighbour_check=False):
+        corrections = []
+        for intended in corrections_repository.find(word):
+            if self.find_word(intended):
+                dl_dist = calculate_dl_distance(word, intended, neighbour_check)
+                if not max_edit or dl_dist <= max_edit:
+                    corrections.append((dl_dist, intended))
+        return [f"{intended}({dl_dist})" for dl_dist, intended in sorted(corrections)]
+
+    def _correct(self, word: str, max_edit=None, neighbour_check=False):
+        if not self.get_dictionary_size():
+            self._latest_search_time = 0
+            return []
+
+        planner = self._get_planner()
+        query_class = planner.get_query_class(word, max_edit, neighbour_check)
+        if not planner.is_calibrated(query_class):
+            self._calibrate_query_class(planner, query_class, self.get_all())
+
+        engine = planner.choose(query_class)
+        candidates = self._get_engines()[engine](word, max_edit, neighbour_check)
+        planner.record(query_class, engine, self._latest_search_time)
+
+        return candidates
+
+    def _get_engines(self):
+        return {
+            "baseline": self.find_closest_match,
+            "recursive": self._find_closest_match_trie,
+            "automaton": partial(self._find_closest_match_trie, mode="automaton"),
+            "partition": self.find_closest_match_partition
+        }
+
+    def _get_planner(self):
+        size = self.get_dictionary_size()
+        if self._planner is None or abs(size - self._planner.get_dictionary_size()) \
+                > self._planner.get_dictionary_size() // 2:
+            self._planner = EnginePlanner(list(self._get_engines()), size)
+        return self._planner
+
+    def _calibrate_query_class(self, planner, query_class: tuple, wordlist: list,
+                               sample_count=3):
+        length_class, max_edit, neighbour_check = query_class
+        samples = self._create_calibration_samples(length_class, wordlist, sample_count)
+        engines = self._get_engines()
+        if not samples:
+            for engine in engines:
+                planner.record(query_class, engine, 0.0)
+            return
+
+        self.build_index("partition")
+        if BASELINE_PREFILTER == "ngram":
+            self._indexes.get("ngram")
+
+        # Only the engines at most twice as slow as the fastest one with the
+        # first misspelling are timed with the rest of them.
+        first_times = {}
+        for engine, search in engines.items():
+            search(samples[0], max_edit or None, neighbour_check)
+            first_times[engine] = self._latest_search_time
+            planner.record(query_class, engine, self._latest_search_time)
+        for engine, search in engines.items():
+            if first_times[engine] <= 2 * min(first_times.values()):
+                for sample in samples[1:]:
+                    search(sample, max_edit or None, neighbour_check)
+                    planner.record(query_class, engine, self._latest_search_time)
+
+    def _create_calibration_samples(self, length_class: int, wordlist: list, sample_count: int):
+        min_length = 4 * length_class
+        max_length = min_length + 3 if length_class < 2 else float("inf")
+        wordlist = [dict_word for dict_word in wordlist
+                    if min_length <= len(dict_word) <= max_length]
+
+        samples = []
+        for dict_word in wordlist[::max(1, len(wordlist) // sample_count)]:
+            middle = len(dict_word) // 2
+            char = "x" if dict_word[middle] != "x" else "z"
+            sample = dict_word[:middle] + char + dict_word[middle+1:]
+            if not self.find_word(sample) and len(samples) < sample_count:
+                samples.append(sample)
+        return samples
+
+    def _find_closest_match_symspell(self, word: str, max_edit=None, neighbour_check=False):
+        candidates = []
+        min_dist = min(max_edit, SYMSPELL_MAX_EDIT) if max_edit else SYMSPELL_MAX_EDIT
+        for dict_word in self._indexes.get("symspell").lookup(word):
+            dl_dist = calculate_dl_distance(word, dict_word, neighbour_check)
+            if dl_dist <= min_dist:
+                if dl_dist < min_dist:
+                    candidates.clear()
+                    min_dist = dl_dist
+                candidates.append(f"{dict_word}({dl_dist})")
+        return candidates
+
+    def _find_closest_match_bk_tree(self, word: str, max_edit=None, neighbour_check=False):
+        # With neighbouring key priority, a distance is at least half of the
+        # distance without it, so the words within twice the smallest distance
+        # are looked up in the tree and their distances recalculated.
+        bk_tree = self._indexes.get("bk_tree")
+        if not neighbour_check:
+            min_dist, words = bk_tree.find_nearest(word, max_edit)
+            return [f"{dict_word}({min_dist})" for dict_word in words]
+
+        min_dist, _ = bk_tree.find_nearest(word)
+        candidates = []
+        if min_dist is None:
+            return candidates
+
+        max_dist = min(2*min_dist, 2*max_edit) if max_edit else 2*min_dist
+        min_dist = max_edit if max_edit else min_dist
+        for _, dict_word in bk_tree.search(word, max_dist):
+            dl_dist = calculate_dl_distance(word, dict_word, True)
+            if dl_dist <= min_dist:
+                if dl_dist < min_dist:
+                    candidates.clear()
+                    min_dist = dl_dist
+                candidates.append(f"{dict_word}({dl_dist})")
+        return candidates
+
+    def _find_closest_match_phonetic(self, word: str, max_edit=None, neighbour_check=False):
+        # With neighbouring key priority, a distance of 1 may correspond to two edits.
+        wordlist = set(self._indexes.get("phonetic").lookup(word))
+        wordlist.update(self._indexes.get("ngram").lookup(word, 2 if neighbour_check else 1))
+
+        candidates = []
+        min_dist = max_edit if max_edit else float("inf")
+        for dict_word in sorted(wordlist):
+            dl_dist = calculate_dl_distance(word, dict_word, neighbour_check)
+            if dl_dist <= min_dist:
+                if dl_dist < min_dist:
+                    candidates.clear()
+                    min_dist = dl_dist
+                candidates.append(f"{dict_word}({dl_dist})")
+        return candidates
+
+    def _create_index_registry(self):
+        indexes = IndexRegistry(self.get_all, CACHE_SIZE)
+        indexes.register("symspell", partial(SymSpellIndex, SYMSPELL_MAX_EDIT))
+        indexes.register("bk_tree", BKTree)
+        indexes.register("ngram", NGramIndex)
+        indexes.register("phonetic", PhoneticIndex)
+        indexes.register("reversed_dictionary", Trie, key=lambda word: word[::-1])
+        indexes.register("search_pool", SearchPool, incremental=False)
+        indexes.register("length_buckets",
+                         lambda wordlist: (wordlist, create_length_buckets(wordlist)),
+                         incremental=False)
+        return indexes
+
+    def _create_dictionary(self):
+        if TRIE_TYPE == "array":
+            return ArrayTrie()
+        if TRIE_TYPE == "dawg":
+            return Dawg()
+        if TRIE_TYPE == "radix":
+            return RadixTrie()
+        return Trie(TRIE_TYPE == "compact")
+
 
 spellchecker_service = SpellcheckerService()
@@ -0,0 +1,94 @@
+import unittest
+from entities.array_trie import ArrayTrie
+from entities.trie import Trie
+
+
+class TestArrayTrie(unittest.TestCase):
+    def setUp(self):
+        self.trie = ArrayTrie()
+
+    def test_adding_a_word_to_an_empty_trie_works_as_expected(self):
+        self.trie.add("foo")
+
+        word = self.trie.find("foo")
+        self.assertEqual(word, True)
+
+        words = self.trie.get_all()
+        self.assertEqual(len(words), 1)
+        self.assertIn("foo", words)
+
+    def test_adding_a_word_with_the_same_prefix_as_some_longer_word_works(self):
+        self.trie.add("carbon")
+        self.trie.add("car")
+
+        self.assertEqual(self.trie.find("carbon"), True)
+        self.assertEqual(self.trie.find("car"), True)
+        self.assertEqual(self.trie.find("carb"), False)
+        self.assertListEqual(self.trie.get_all(), ["car", "carbon"])
+
+    def test_finding_a_word_not_in_the_trie_returns_False(self):
+        self.trie.add("foo")
+
+        self.assertEqual(self.trie.find("bar"), False)
+        self.assertEqual(self.trie.find("fooo"), False)
+
+    def test_relocating_states_on_conflicts_keeps_all_keys(self):
+        words = ["zebra", "ab", "ba", "abc", "bz", "za", "azure", "bazaar",
+                 "zz", "abz", "baba", "zebu", "car", "cab", "ca"]
+        reference = Trie()
+        for word in words:
+            self.trie.add(word)
+            reference.add(word)
+
+        self.assertListEqual(self.trie.get_all(), reference.get_all())
+        for word in words:
+            self.assertEqual(self.trie.find(word), True)
+
+    def test_get_size_returns_correct_number_of_keys_in_the_trie(self):
+        words = ["art", "artist", "banana", "car", "carbon", "zebra", "car"]
+        for word in words:
+            self.trie.add(word)
+
+        self.assertEqual(self.trie.get_size(), len(set(words)))
+
+    def test_children_of_a_state_are_returned_in_alphabetical_order(self):
+        for word in ["z", "a", "m", "b"]:
+            self.trie.add(word)
+
+        children = self.trie.get_children(self.trie.get_root())
+        indices = [index for index, state in children]
+        self.assertListEqual(indices, [0, 1, 12, 25])
+        for _, state in children:
+            self.assertEqual(self.trie.is_valid_end(state), True)
+
+    def test_removing_words_frees_unused_states(self):
+        for word in ["car", "carbon", "cart", "zebra"]:
+            self.trie.add(word)
+
+        self.assertEqual(self.trie.remove("carbon"), True)
+        self.assertEqual(self.trie.remove("zebra"), True)
+        self.assertEqual(self.trie.remove("zebra"), False)
+
+        self.assertListEqual(self.trie.get_all(), ["car", "cart"])
+        self.assertEqual(self.trie.get_size(), 2)
+        self.assertEqual(self.trie.get_max_keylength(), 4)
+        self.assertEqual(len(self.trie.get_children(self.trie.get_root())), 1)
+
+        self.trie.add("carbon")
+        self.assertListEqual(self.trie.get_all(), ["car", "carbon", "cart"])
+
+    def test_length_bounds_of_states_are_kept_up_to_date(self):
+        for word in ["car", "carbon", "cart", "zebra"]:
+            self.trie.add(word)
+
+        root = self.trie.get_root()
+        car = dict(self.trie.get_children(
+            dict(self.trie.get_children(dict(self.trie.get_children(root))[2]))[0]
+        ))[17]
+        self.assertEqual(self.trie.get_length_bounds(root), (3, 6))
+        self.assertEqual(self.trie.get_length_bounds(car), (0, 3))
+
+        self.trie.remove("carbon")
+        self.trie.remove("car")
+        self.assertEqual(self.trie.get_length_bounds(root), (4, 5))
+        self.assertEqual(self.trie.get_length_bounds(car), (1, 1))
@@ -0,0 +1,462 @@
+"""Spellchecker Benchmarks
+
+A script for measuring the memory usage and speed of the data structures
+and search implementations of the Spellchecker app.
+
+"""
+
+
+import gc
+import os, sys
+import tempfile
+import tracemalloc
+from time import perf_counter
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import SPELLING_ERRORS_PATH, WORDLIST_FILENAME, WORDLIST_PATH
+from entities.trie import Trie
+from entities.array_trie import ArrayTrie
+from entities.search_pool import SearchPool
+from entities.bk_tree import BKTree
+from entities.dawg import Dawg
+from entities.ngram_index import NGramIndex
+from entities.phonetic_index import PhoneticIndex
+from entities.radix_trie import RadixTrie
+from entities.symspell_index import SymSpellIndex
+from repositories.wordlist_repository import WordlistRepository
+from repositories.snapshot_repository import SnapshotRepository
+from services.alphabet_utils import check_allowed_chars
+from services.distance_service import(
+    calculate_dl_distance,
+    calculate_dl_distance_bounded
+)
+from services.distance_service_automaton import calculate_dl_distance_automaton
+from services.distance_service_bit_parallel import(
+    calculate_char_masks,
+    calculate_dl_distance_bit_parallel
+)
+from services.distance_service_numpy import(
+    NUMPY_AVAILABLE,
+    create_length_buckets,
+    calculate_dl_distances_numpy
+)
+from services.distance_service_buffered import calculate_dl_distance_buffered
+from services.distance_service_iterative import(
+    calculate_dl_distance_deepening,
+    calculate_dl_distance_iterative
+)
+from services.distance_service_parallel import calculate_dl_distance_parallel
+from services.distance_service_partition import calculate_dl_distance_partition
+from services.distance_service_recursive import calculate_dl_distance_recursive
+from services.distance_service_radix import calculate_dl_distance_radix
+
+
+def measure_memory(build):
+    """Measures the memory allocated by a data structure.
+
+    Args:
+        build: A function without arguments returning the data structure.
+
+    Returns:
+        A tuple containing the data structure and the size of the memory
+        still allocated after building it, in bytes.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    structure = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return structure, size
+
+def measure_time(search, misspellings: list):
+    """Measures the total time used for searching for a list of misspellings.
+
+    Args:
+        search: A function taking a misspelled word as its only argument.
+        misspellings: A list of misspelled words as strings.
+
+    Returns:
+        The total search time in seconds as a float.
+    """
+
+    start = perf_counter()
+    for misspelling in misspellings:
+        search(misspelling)
+    return perf_counter() - start
+
+def load_misspellings(wordlist: list, count=20):
+    """Reads misspellings with intended spellings found in the wordlist.
+
+    Args:
+        wordlist: The dictionary used as a list of words.
+        count: The maximum number of misspellings to return. Defaults to 20.
+
+    Returns:
+        A list of misspelled words as strings.
+    """
+
+    words = set(wordlist)
+    misspellings = []
+    with open(SPELLING_ERRORS_PATH, encoding="utf-8") as file:
+        for row in file:
+            misspelling, intended = row.strip().split("->")
+            if (check_allowed_chars(misspelling) and misspelling not in words
+                    and all(word in words for word in intended.split(", "))):
+                misspellings.append(misspelling)
+    return misspellings[::max(1, len(misspellings) // count)][:count]
+
+def build_trie(wordlist: list, trie_class=Trie, *args):
+    trie = trie_class(*args)
+    for word in wordlist:
+        trie.add(word)
+    trie.get_root()
+    return trie
+
+def count_nodes(trie):
+    nodes = set()
+    stack = [trie.get_root()]
+    while stack:
+        node = stack.pop()
+        if node not in nodes:
+            nodes.add(node)
+            stack.extend(child for _, child in trie.get_children(node))
+    return len(nodes)
+
+class VisitCounter:
+    """Wraps a trie and counts the nodes visited by a search.
+
+    The recursive search checks each node it visits exactly once with
+    is_valid_end, so the number of calls equals the number of visited nodes.
+    """
+
+    def __init__(self, trie, length_bounds=True):
+        self.visits = 0
+        self._trie = trie
+        self._length_bounds = length_bounds
+
+    def get_root(self):
+        return self._trie.get_root()
+
+    def get_children(self, node):
+        return self._trie.get_children(node)
+
+    def get_max_keylength(self):
+        return self._trie.get_max_keylength()
+
+    def get_length_bounds(self, node):
+        if self._length_bounds:
+            return self._trie.get_length_bounds(node)
+        return 0, self._trie.get_max_keylength()
+
+    def is_valid_end(self, node):
+        self.visits += 1
+        return self._trie.is_valid_end(node)
+
+def count_radix_nodes(node):
+    return 1 + sum(count_radix_nodes(child) for child in node.children)
+
+def benchmark_trie_memory(wordlist: list):
+    print("Trie memory usage:")
+    _, dense_size = measure_memory(lambda: build_trie(wordlist))
+    _, compact_size = measure_memory(lambda: build_trie(wordlist, Trie, True))
+    _, array_size = measure_memory(lambda: build_trie(wordlist, ArrayTrie))
+    dawg, dawg_size = measure_memory(lambda: build_trie(sorted(wordlist), Dawg))
+    print(f"  Node:        {dense_size / 1024**2:8.2f} MiB")
+    print(f"  CompactNode: {compact_size / 1024**2:8.2f} MiB"
+          + f" ({100 * (1 - compact_size / dense_size):.0f} % less)")
+    print(f"  ArrayTrie:   {array_size / 1024**2:8.2f} MiB"
+          + f" ({100 * (1 - array_size / dense_size):.0f} % less)")
+    print(f"  Dawg:        {dawg_size / 1024**2:8.2f} MiB"
+          + f" ({100 * (1 - dawg_size / dense_size):.0f} % less)")
+    print()
+
+    nodes = count_nodes(build_trie(wordlist))
+    dawg_nodes = count_nodes(dawg)
+    radix_nodes = count_radix_nodes(build_trie(wordlist, RadixTrie).get_root())
+    print(f"Node count: {nodes} in a Trie, {dawg_nodes} in a Dawg"
+          + f" ({100 * (1 - dawg_nodes / nodes):.0f} % less),"
+          + f" {radix_nodes} in a RadixTrie ({100 * (1 - radix_nodes / nodes):.0f} % less)")
+    print()
+
+def benchmark_trie_search(wordlist: list, misspellings: list):
+    print(f"Recursive search time for {len(misspellings)} misspellings:")
+    for name, trie in [("Node", build_trie(wordlist)),
+                       ("CompactNode", build_trie(wordlist, Trie, True)),
+                       ("ArrayTrie", build_trie(wordlist, ArrayTrie)),
+                       ("Dawg", build_trie(wordlist, Dawg))]:
+        search_time = measure_time(
+            lambda word, trie=trie: calculate_dl_distance_recursive(word, trie),
+            misspellings
+        )
+        print(f"  {name + ':':13}{search_time:8.3f} s")
+
+    radix_trie = build_trie(wordlist, RadixTrie)
+    search_time = measure_time(
+        lambda word: calculate_dl_distance_radix(word, radix_trie),
+        misspellings
+    )
+    print(f"  {'RadixTrie:':13}{search_time:8.3f} s")
+    print()
+
+def benchmark_length_bounds(wordlist: list, misspellings: list):
+    print(f"Nodes visited by the recursive search for {len(misspellings)} misspellings:")
+    trie = build_trie(wordlist)
+    for name, length_bounds in [("Without length bounds", False),
+                                ("With length bounds", True)]:
+        counter = VisitCounter(trie, length_bounds)
+        search_time = measure_time(
+            lambda word, counter=counter: calculate_dl_distance_recursive(word, counter),
+            misspellings
+        )
+        print(f"  {name + ':':23}{counter.visits:10} nodes {search_time:8.3f} s")
+    print()
+
+def benchmark_child_ordering(wordlist: list, misspellings: list):
+    print(f"Nodes visited by the iterative search for {len(misspellings)} misspellings:")
+    trie = build_trie(wordlist)
+    for max_dist in [None, 2]:
+        for name, ordered in [("Alphabetical order", False), ("Ordered children", True)]:
+            counter = VisitCounter(trie)
+            search_time = measure_time(
+                lambda word, counter=counter, max_dist=max_dist, ordered=ordered:
+                    calculate_dl_distance_iterative(word, counter, max_dist, False, ordered),
+                misspellings
+            )
+            print(f"  {name + f' (max {max_dist}):':30}{counter.visits:10} nodes"
+                  + f"{search_time:8.3f} s")
+    print()
+
+def benchmark_distance_kernels(wordlist: list, misspellings: list, max_dist=2):
+    def matrix_kernel(word):
+        for dict_word in wordlist:
+            calculate_dl_distance(word, dict_word)
+
+    def banded_kernel(word):
+        for dict_word in wordlist:
+            calculate_dl_distance_bounded(word, dict_word, max_dist)
+
+    def bit_parallel_kernel(word):
+        char_masks = calculate_char_masks(word)
+        for dict_word in wordlist:
+            calculate_dl_distance_bit_parallel(word, dict_word, char_masks, max_dist)
+
+    kernels = [("Matrix", matrix_kernel), ("Banded", banded_kernel),
+               ("Bit-parallel", bit_parallel_kernel)]
+    if NUMPY_AVAILABLE:
+        buckets = create_length_buckets(wordlist)
+        kernels.append(("NumPy", lambda word: calculate_dl_distances_numpy(word, buckets,
+                                                                           max_dist)))
+
+    print(f"Distances to all words within {max_dist} edits for {len(misspellings)} misspellings:")
+    for name, kernel in kernels:
+        print(f"  {name + ':':23}{measure_time(kernel, misspellings):8.3f} s")
+    print()
+
+def benchmark_search_modes(wordlist: list, misspellings: list):
+    print(f"Search time with different search modes for {len(misspellings)} misspellings:")
+    trie = build_trie(wordlist)
+    pool = SearchPool(wordlist)
+    for name, search in [("Recursive", calculate_dl_distance_recursive),
+                         ("Buffered", calculate_dl_distance_buffered),
+                         ("Iterative", calculate_dl_distance_iterative),
+                         ("Parallel", lambda word, trie: calculate_dl_distance_parallel(
+                             word, trie, pool=pool)),
+                         ("Iterative deepening", calculate_dl_distance_deepening),
+                         ("Automaton", calculate_dl_distance_automaton)]:
+        search_time = measure_time(lambda word, search=search: search(word, trie), misspellings)
+        print(f"  {name + ':':23}{search_time:8.3f} s")
+    pool.close()
+    print()
+
+def benchmark_automaton(wordlist: list, misspellings: list):
+    print(f"Search time with a fixed maximum distance for {len(misspellings)} misspellings:")
+    trie = build_trie(wordlist)
+    for max_dist in [1, 2]:
+        for name, search in [("Recursive", calculate_dl_distance_recursive),
+                             ("Automaton", calculate_dl_distance_automaton)]:
+            search_time = measure_time(
+                lambda word, search=search, max_dist=max_dist: search(word, trie, max_dist),
+                misspellings
+            )
+            print(f"  {f'{name}, max distance {max_dist}:':30}{search_time:8.3f} s")
+    print()
+
+def benchmark_error_position(wordlist: list, count=20):
+    def misspell(word, position):
+        chars = list(word)
+        chars[position] = "x" if chars[position] != "x" else "z"
+        return "".join(chars)
+
+    words = set(wordlist)
+    long_words = [word for word in wordlist if len(word) >= 8]
+    long_words = long_words[::max(1, len(long_words) // count)][:count]
+    trie = build_trie(wordlist)
+    reversed_trie = build_trie([word[::-1] for word in wordlist])
+
+    print(f"Search time by the position of the error for {len(long_words)} misspellings:")
+    for place, position in [("first", 0), ("middle", None), ("last", -1)]:
+        misspellings = [misspell(word, len(word) // 2 if position is None else position)
+                        for word in long_words]
+        misspellings = [word for word in misspellings if word not in words]
+        for name, search in [("Recursive", calculate_dl_distance_recursive),
+                             ("Forward and reversed", lambda word, trie, max_dist:
+                                 calculate_dl_distance_partition(word, trie, reversed_trie,
+                                                                 max_dist))]:
+            search_time = measure_time(
+                lambda word, search=search: search(word, trie, 2), misspellings
+            )
+            print(f"  {f'{name}, {place} character:':40}{search_time:8.3f} s")
+    print()
+
+def benchmark_symspell(wordlist: list, misspellings: list):
+    def lookup(word, index):
+        for dict_word in index.lookup(word):
+            calculate_dl_distance(word, dict_word)
+
+    print(f"Symmetric delete index and search time for {len(misspellings)} misspellings:")
+    def build_index(max_edit):
+        index = SymSpellIndex(max_edit)
+        for word in wordlist:
+            index.add(word)
+        return index
+
+    trie = build_trie(wordlist)
+    for max_edit in [1, 2]:
+        start = perf_counter()
+        index = build_index(max_edit)
+        build_time = perf_counter() - start
+        _, size = measure_memory(lambda max_edit=max_edit: build_index(max_edit))
+        search_time = measure_time(lambda word, index=index: lookup(word, index), misspellings)
+        trie_time = measure_time(
+            lambda word, max_edit=max_edit: calculate_dl_distance_recursive(word, trie, max_edit),
+            misspellings
+        )
+        print(f"  Max edit {max_edit}: {index.get_entry_count():8} deletions"
+              + f"{size / 1024**2:8.1f} MiB, built in {build_time:6.3f} s")
+        print(f"    {'Index search:':21}{search_time:8.3f} s")
+        print(f"    {'Recursive search:':21}{trie_time:8.3f} s")
+    print()
+
+def benchmark_bk_tree(wordlist: list, misspellings: list):
+    calls = []
+    def distance(word_a, word_b):
+        calls.append(None)
+        return calculate_dl_distance(word_a, word_b)
+
+    tree = BKTree(distance)
+    start = perf_counter()
+    for word in wordlist:
+        tree.add(word)
+    build_time = perf_counter() - start
+
+    print(f"BK-tree search for {len(misspellings)} misspellings (built in {build_time:.3f} s):")
+    for max_dist in [None, 2]:
+        calls.clear()
+        search_time = measure_time(
+            lambda word, max_dist=max_dist: tree.find_nearest(word, max_dist), misspellings
+        )
+        share = len(calls) / len(misspellings) / len(wordlist)
+        print(f"  {f'Max distance {max_dist}:':23}{search_time:8.3f} s, "
+              + f"{len(calls) // len(misspellings)} distances per word ({share:.1%} of the wordlist)")
+    print()
+
+def benchmark_ngram_prefilter(wordlist: list, misspellings: list):
+    def search(word, words, max_dist):
+        char_masks = calculate_char_masks(word)
+        for dict_word in words:
+            calculate_dl_distance_bit_parallel(word, dict_word, char_masks, max_dist)
+
+    print(f"Baseline search with n-gram prefilter for {len(misspellings)} misspellings:")
+    for n in [2, 3]:
+        index = NGramIndex(n)
+        for word in wordlist:
+            index.add(word)
+        for max_dist in [1, 2]:
+            candidate_count = sum(len(index.lookup(word, max_dist)) for word in misspellings)
+            search_time = measure_time(
+                lambda word, index=index, max_dist=max_dist:
+                    search(word, index.lookup(word, max_dist), max_dist),
+                misspellings
+            )
+            share = candidate_count / len(misspellings) / len(wordlist)
+            print(f"  {f'{n}-grams, max distance {max_dist}:':30}{search_time:8.3f} s, "
+                  + f"{share:.2%} of the wordlist left")
+    for max_dist in [1, 2]:
+        search_time = measure_time(
+            lambda word, max_dist=max_dist: search(word, wordlist, max_dist), misspellings
+        )
+        print(f"  {f'No prefilter, max distance {max_dist}:':30}{search_time:8.3f} s")
+    print()
+
+def benchmark_phonetic_index(wordlist: list, misspellings: list):
+    def search(word):
+        min_dist = float("inf")
+        candidates = []
+        for dict_word in sorted(set(index.lookup(word)) | set(ngram_index.lookup(word, 1))):
+            dl_dist = calculate_dl_distance(word, dict_word)
+            if dl_dist <= min_dist:
+                if dl_dist < min_dist:
+                    candidates.clear()
+                    min_dist = dl_dist
+                candidates.append(f"{dict_word}({dl_dist})")
+        return candidates
+
+    index = PhoneticIndex()
+    ngram_index = NGramIndex()
+    start = perf_counter()
+    for word in wordlist:
+        index.add(word)
+        ngram_index.add(word)
+    build_time = perf_counter() - start
+    trie = build_trie(wordlist)
+
+    print(f"Phonetic index search for {len(misspellings)} misspellings "
+          + f"({index.get_code_count()} keys, built with the n-gram index in {build_time:.3f} s):")
+    search_time = measure_time(search, misspellings)
+    trie_time = measure_time(lambda word: calculate_dl_distance_recursive(word, trie), misspellings)
+    print(f"  {'Phonetic index:':23}{search_time:8.3f} s")
+    print(f"  {'Recursive:':23}{trie_time:8.3f} s")
+    same = sum(search(word) == calculate_dl_distance_recursive(word, trie) for word in misspellings)
+    print(f"  Same results as the recursive search for {same} of {len(misspellings)} misspellings")
+    print()
+
+def benchmark_startup(wordlist: list):
+    print("Startup time:")
+    start = perf_counter()
+    build_trie(WordlistRepository(WORDLIST_PATH).get_wordlist())
+    print(f"  Building a Trie from the wordlist: {perf_counter() - start:8.4f} s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        repository = SnapshotRepository(os.path.join(directory, "dictionary.snapshot"))
+        checksum = WordlistRepository(WORDLIST_PATH).get_checksum()
+        repository.save(build_trie(sorted(wordlist), ArrayTrie), checksum)
+
+        start = perf_counter()
+        snapshot = repository.load(WordlistRepository(WORDLIST_PATH).get_checksum())
+        print(f"  Loading a snapshot:                {perf_counter() - start:8.4f} s")
+        assert snapshot.get_size() == len(set(wordlist))
+        del snapshot
+    print()
+
+def main():
+    wordlist = WordlistRepository(WORDLIST_PATH).get_wordlist()
+    misspellings = load_misspellings(wordlist)
+    print(f"Dictionary used: {WORDLIST_FILENAME} ({len(wordlist)} words)\n")
+
+    benchmark_trie_memory(wordlist)
+    benchmark_startup(wordlist)
+    benchmark_distance_kernels(wordlist, misspellings)
+    benchmark_length_bounds(wordlist, misspellings)
+    benchmark_child_ordering(wordlist, misspellings)
+    benchmark_trie_search(wordlist, misspellings)
+    benchmark_search_modes(wordlist, misspellings)
+    benchmark_automaton(wordlist, misspellings)
+    benchmark_error_position(wordlist)
+    benchmark_symspell(wordlist, misspellings)
+    benchmark_bk_tree(wordlist, misspellings)
+    benchmark_ngram_prefilter(wordlist, misspellings)
+    benchmark_phonetic_index(wordlist, misspellings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import unittest
+from entities.bk_tree import BKTree
+from services.distance_service import calculate_dl_distance
+
+
+class TestBKTree(unittest.TestCase):
+    def setUp(self):
+        self.calls = 0
+        self.tree = BKTree(self.count_distance)
+        self.words = ["art", "artist", "bale", "ball", "balm", "bawl",
+                      "car", "carbon", "carbonate", "zebra"]
+        for word in self.words:
+            self.tree.add(word)
+
+    def count_distance(self, word_a, word_b):
+        self.calls += 1
+        return calculate_dl_distance(word_a, word_b)
+
+    def test_adding_words_works_as_expected(self):
+        for word in self.words:
+            self.assertEqual(self.tree.find(word), True)
+        for word in ["ar", "bal", "carbo", "zebras"]:
+            self.assertEqual(self.tree.find(word), False)
+
+        self.tree.add("ball")
+        self.assertListEqual(self.tree.get_all(), self.words)
+        self.assertEqual(self.tree.get_size(), len(self.words))
+
+    def test_range_search_returns_all_words_within_max_dist(self):
+        for misspelling in ["balw", "crabon", "carbonat", "atr", "zbera", "xyz"]:
+            for max_dist in [0, 1, 2, 3]:
+                expected = sorted((calculate_dl_distance(misspelling, word), word)
+                                  for word in self.words)
+                expected = [result for result in expected if result[0] <= max_dist]
+                self.assertListEqual(self.tree.search(misspelling, max_dist), expected)
+
+    def test_find_nearest_returns_all_closest_words(self):
+        self.assertEqual(self.tree.find_nearest("balw"), (1, ["bale", "ball", "balm", "bawl"]))
+        self.assertEqual(self.tree.find_nearest("carbonat"), (1, ["carbonate"]))
+        self.assertEqual(self.tree.find_nearest("crabone", 1), (None, []))
+        self.assertEqual(BKTree().find_nearest("balw"), (None, []))
+
+    def test_triangle_inequality_prunes_distance_calculations(self):
+        self.calls = 0
+        self.tree.find_nearest("carbonat", 1)
+        self.assertLess(self.calls, len(self.words))
+
+    def test_removed_words_are_not_found_but_words_below_them_are(self):
+        self.assertEqual(self.tree.remove("art"), True)
+        self.assertEqual(self.tree.remove("art"), False)
+        self.assertEqual(self.tree.remove("arts"), False)
+        self.assertEqual(self.tree.remove("bal"), False)
+
+        self.assertEqual(self.tree.find("art"), False)
+        self.assertEqual(self.tree.get_size(), len(self.words) - 1)
+        self.assertListEqual(self.tree.get_all(), self.words[1:])
+        self.assertEqual(self.tree.find_nearest("atr"), (2, ["car"]))
+        self.assertListEqual(self.tree.search("balw", 1),
+                             [(1, "bale"), (1, "ball"), (1, "balm"), (1, "bawl")])
+
+        self.tree.add("art")
+        self.assertEqual(self.tree.find_nearest("atr"), (1, ["art"]))
+        self.assertEqual(self.tree.get_size(), len(self.words))
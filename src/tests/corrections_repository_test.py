@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from repositories.corrections_repository import CorrectionsRepository
+
+
+class TestCorrectionsRepository(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "corrections.txt")
+        self.repository = CorrectionsRepository(self.file_path)
+        self.corrections = {"balw": ["ball", "bawl"], "crabon": ["carbon"]}
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_saved_corrections_are_loaded(self):
+        self.repository.save(self.corrections)
+
+        self.assertDictEqual(self.repository.get_corrections(), self.corrections)
+        self.assertListEqual(self.repository.find("balw"), ["ball", "bawl"])
+        self.assertListEqual(self.repository.find("atr"), [])
+        with open(self.file_path, encoding="utf-8") as file:
+            self.assertEqual(file.read(), "balw->ball, bawl\ncrabon->carbon\n")
+
+    def test_corrections_are_reloaded_when_the_file_is_modified(self):
+        with patch("repositories.corrections_repository.monotonic", return_value=0.0) as clock:
+            self.assertDictEqual(self.repository.get_corrections(), {})
+            self.repository.save(self.corrections)
+            self.assertListEqual(self.repository.find("crabon"), ["carbon"])
+
+            CorrectionsRepository(self.file_path).save({"atr": ["art"]})
+            os.utime(self.file_path, ns=(0, 0))
+            clock.return_value = 0.5
+            self.assertListEqual(self.repository.find("crabon"), ["carbon"])
+            clock.return_value = 1.0
+            self.assertListEqual(self.repository.find("crabon"), [])
+            self.assertListEqual(self.repository.find("atr"), ["art"])
+
+            self.repository.delete()
+            self.assertDictEqual(self.repository.get_corrections(), {})
+
+    def test_rows_with_characters_not_in_the_alphabet_are_skipped(self):
+        with open(self.file_path, "w", encoding="utf-8") as file:
+            file.write("balw->ball, b4wl\nbalw->bawl, ball\ncr4bon->carbon\nnot a row\n"
+                       + "atr->art's\n")
+
+        self.assertDictEqual(self.repository.get_corrections(), {"balw": ["ball", "bawl"]})
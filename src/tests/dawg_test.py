@@ -0,0 +1,84 @@
+import unittest
+from entities.dawg import Dawg
+from entities.trie import Trie
+from services.distance_service_recursive import calculate_dl_distance_recursive
+
+
+class TestDawg(unittest.TestCase):
+    def setUp(self):
+        self.dawg = Dawg()
+        self.words = ["bake", "baked", "baking", "make", "maked", "making",
+                      "take", "taken", "taking"]
+
+    def test_adding_sorted_words_works_as_expected(self):
+        for word in self.words:
+            self.dawg.add(word)
+
+        for word in self.words:
+            self.assertEqual(self.dawg.find(word), True)
+        self.assertEqual(self.dawg.find("bak"), False)
+        self.assertEqual(self.dawg.find("taked"), False)
+        self.assertListEqual(self.dawg.get_all(), self.words)
+        self.assertEqual(self.dawg.get_size(), len(self.words))
+
+    def test_adding_unsorted_and_duplicate_words_works_as_expected(self):
+        for word in reversed(self.words):
+            self.dawg.add(word)
+        self.dawg.add("make")
+
+        self.assertListEqual(self.dawg.get_all(), self.words)
+        self.assertEqual(self.dawg.get_size(), len(self.words))
+
+        self.dawg.add("aardvark")
+        self.assertEqual(self.dawg.find("aardvark"), True)
+        self.assertEqual(self.dawg.get_all()[0], "aardvark")
+
+    def test_common_suffixes_are_shared(self):
+        for word in self.words:
+            self.dawg.add(word)
+
+        # "b" and "m" share all nodes, "-ing" is shared by all three stems
+        # and all words end in the same final node.
+        self.assertEqual(self.dawg.get_node_count(), 12)
+
+    def test_get_max_keylength_returns_length_of_longest_key(self):
+        for word in self.words:
+            self.dawg.add(word)
+
+        self.assertEqual(self.dawg.get_max_keylength(), 6)
+
+    def test_recursive_search_returns_same_results_as_for_a_trie(self):
+        trie = Trie()
+        for word in self.words:
+            self.dawg.add(word)
+            trie.add(word)
+
+        for misspelling in ["bakeing", "mkae", "takne", "tkaing", "xyz"]:
+            self.assertListEqual(
+                calculate_dl_distance_recursive(misspelling, self.dawg),
+                calculate_dl_distance_recursive(misspelling, trie)
+            )
+
+    def test_removing_words_works_as_expected(self):
+        for word in self.words:
+            self.dawg.add(word)
+
+        self.assertEqual(self.dawg.remove("baking"), True)
+        self.assertEqual(self.dawg.remove("taking"), True)
+        self.assertEqual(self.dawg.remove("tak"), False)
+
+        self.assertEqual(self.dawg.find("baking"), False)
+        self.assertEqual(self.dawg.find("making"), True)
+        self.assertEqual(self.dawg.get_size(), len(self.words) - 2)
+
+        self.dawg.add("baking")
+        self.assertEqual(self.dawg.find("baking"), True)
+
+    def test_length_bounds_of_shared_nodes_are_correct(self):
+        for word in self.words:
+            self.dawg.add(word)
+
+        root = self.dawg.get_root()
+        bak = root.get_child(1).get_child(0).get_child(10)
+        self.assertEqual(self.dawg.get_length_bounds(root), (4, 6))
+        self.assertEqual(self.dawg.get_length_bounds(bak), (1, 3))
@@ -0,0 +1,44 @@
+import unittest
+from random import Random
+from services.distance_service import calculate_dl_distance
+from services.distance_service_bit_parallel import(
+    calculate_char_masks,
+    calculate_osa_distance,
+    calculate_dl_distance_bit_parallel
+)
+
+
+class TestDistanceServiceBitParallel(unittest.TestCase):
+    def test_char_masks_are_calculated_correctly(self):
+        char_masks = calculate_char_masks("abca")
+
+        self.assertDictEqual(char_masks, {"a": 0b1001, "b": 0b0010, "c": 0b0100})
+
+    def test_edits_return_correct_distance(self):
+        self.assertEqual(calculate_dl_distance_bit_parallel("definately", "definitely"), 1)
+        self.assertEqual(calculate_dl_distance_bit_parallel("glamourouse", "glamorous"), 2)
+        self.assertEqual(calculate_dl_distance_bit_parallel("car", "carbon"), 3)
+        self.assertEqual(calculate_dl_distance_bit_parallel("teh", "the"), 1)
+        self.assertEqual(calculate_dl_distance_bit_parallel("vbarrtndre", "bartender"), 4)
+        self.assertEqual(calculate_dl_distance_bit_parallel("", "car"), 3)
+        self.assertEqual(calculate_dl_distance_bit_parallel("car", ""), 3)
+
+    def test_edits_between_transposed_chars_are_handled_like_in_calculate_dl_distance(self):
+        self.assertEqual(calculate_osa_distance("ca", "abc"), 3)
+        self.assertEqual(calculate_dl_distance_bit_parallel("ca", "abc"), 2)
+
+    def test_distance_exceeding_max_dist_returns_None(self):
+        self.assertEqual(calculate_dl_distance_bit_parallel("teh", "the", None, 1), 1)
+        self.assertEqual(calculate_dl_distance_bit_parallel("car", "carbon", None, 2), None)
+        self.assertEqual(calculate_dl_distance_bit_parallel("vbarrtndre", "bartender",
+                                                            None, 3), None)
+
+    def test_results_are_the_same_as_for_calculate_dl_distance(self):
+        random = Random(0)
+        for _ in range(2000):
+            word_a = "".join(random.choice("abcd") for _ in range(random.randint(0, 7)))
+            word_b = "".join(random.choice("abcd") for _ in range(random.randint(0, 7)))
+            char_masks = calculate_char_masks(word_a)
+
+            self.assertEqual(calculate_dl_distance_bit_parallel(word_a, word_b, char_masks),
+                             calculate_dl_distance(word_a, word_b))
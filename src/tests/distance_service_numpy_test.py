@@ -0,0 +1,40 @@
+import unittest
+from random import Random
+from services.distance_service import calculate_dl_distance
+from services.distance_service_numpy import(
+    NUMPY_AVAILABLE,
+    create_length_buckets,
+    calculate_dl_distances_numpy
+)
+
+
+@unittest.skipIf(not NUMPY_AVAILABLE, "NumPy is not installed")
+class TestDistanceServiceNumpy(unittest.TestCase):
+    def setUp(self):
+        self.wordlist = ["the", "they", "then", "teh", "bartender", "car",
+                         "carbon", "aa", "abc", "ca", "tea"]
+        self.buckets = create_length_buckets(self.wordlist)
+
+    def test_words_are_grouped_by_length(self):
+        self.assertListEqual(sorted(self.buckets.keys()), [2, 3, 4, 6, 9])
+
+        positions, codes = self.buckets[4]
+        self.assertListEqual(positions.tolist(), [1, 2])
+        self.assertListEqual(codes.tolist(), [[19, 7, 4, 24], [19, 7, 4, 13]])
+        self.assertEqual(codes.itemsize, 1)
+
+    def test_distances_within_max_dist_are_returned_in_wordlist_order(self):
+        distances = calculate_dl_distances_numpy("teh", self.buckets, 1)
+
+        self.assertListEqual(distances, [(0, 1), (3, 0), (10, 1)])
+
+    def test_results_are_the_same_as_for_calculate_dl_distance(self):
+        random = Random(0)
+        wordlist = ["".join(random.choice("abcd") for _ in range(random.randint(0, 7)))
+                    for _ in range(200)]
+        buckets = create_length_buckets(wordlist)
+
+        for word in wordlist[:50]:
+            expected = [(position, calculate_dl_distance(word, dict_word))
+                        for position, dict_word in enumerate(wordlist)]
+            self.assertListEqual(calculate_dl_distances_numpy(word, buckets, 20), expected)
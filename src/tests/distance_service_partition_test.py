@@ -0,0 +1,44 @@
+import unittest
+from random import Random
+from entities.trie import Trie
+from services.distance_service import calculate_dl_distance
+from services.distance_service_partition import calculate_dl_distance_partition
+
+
+class TestDistanceServicePartition(unittest.TestCase):
+    def create_tries(self, words):
+        trie = Trie()
+        reversed_trie = Trie()
+        for word in words:
+            trie.add(word)
+            reversed_trie.add(word[::-1])
+        return trie, reversed_trie
+
+    def test_target_words_longer_than_all_keys_get_correct_distances(self):
+        trie, reversed_trie = self.create_tries(["b"])
+
+        self.assertListEqual(calculate_dl_distance_partition("abab", trie, reversed_trie, 3),
+                             ["b(3)"])
+        self.assertListEqual(calculate_dl_distance_partition("abab", trie, reversed_trie, 2),
+                             [])
+
+    def test_search_returns_same_results_as_brute_force_search(self):
+        random = Random(0)
+        for _ in range(300):
+            words = sorted({"".join(random.choice("abcs") for _ in range(random.randint(1, 4)))
+                            for _ in range(random.randint(1, 6))})
+            trie, reversed_trie = self.create_tries(words)
+            misspelling = "".join(random.choice("abcs") for _ in range(random.randint(1, 8)))
+
+            for max_dist in [1, 2, 3]:
+                for neighbour_check in [False, True]:
+                    distances = {word: calculate_dl_distance(word, misspelling, neighbour_check)
+                                 for word in words}
+                    min_dist = min(distances.values())
+                    expected = [f"{word}({dist})" for word, dist in distances.items()
+                                if dist == min_dist and dist <= max_dist]
+                    self.assertListEqual(
+                        calculate_dl_distance_partition(misspelling, trie, reversed_trie,
+                                                        max_dist, neighbour_check),
+                        expected
+                    )
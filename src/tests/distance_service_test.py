@@ -1,9 +1,20 @@
 import unittest
+from functools import partial
+from random import Random
 
+from entities.trie import Trie
 from services.distance_service import(
     calculate_dl_distance,
+    calculate_dl_distance_bounded,
     init_matrix
 )
+from services.distance_service_best_first import calculate_suggestions
+from services.distance_service_buffered import calculate_dl_distance_buffered
+from services.distance_service_iterative import(
+    calculate_dl_distance_deepening,
+    calculate_dl_distance_iterative
+)
+from services.distance_service_recursive import calculate_dl_distance_recursive
 
 class TestDistanceService(unittest.TestCase):
 
@@ -34,6 +45,31 @@ class TestDistanceService(unittest.TestCase):
         dl_distance = calculate_dl_distance("vbarrtndre", "bartender")
         self.assertEqual(dl_distance, 4)
 
+    def test_distance_is_never_smaller_than_length_difference(self):
+        dl_distance = calculate_dl_distance("aaaaa", "aa")
+        self.assertEqual(dl_distance, 3)
+
+    def test_bounded_distance_within_max_dist_returns_correct_result(self):
+        self.assertEqual(calculate_dl_distance_bounded("definately", "definitely", 1), 1)
+        self.assertEqual(calculate_dl_distance_bounded("glamourouse", "glamorous", 2), 2)
+        self.assertEqual(calculate_dl_distance_bounded("teh", "the", 3), 1)
+        self.assertEqual(calculate_dl_distance_bounded("sefinitely", "definitely", 1, True), 0.5)
+
+    def test_bounded_distance_exceeding_max_dist_returns_None(self):
+        self.assertEqual(calculate_dl_distance_bounded("car", "carbon", 2), None)
+        self.assertEqual(calculate_dl_distance_bounded("vbarrtndre", "bartender", 3), None)
+        self.assertEqual(calculate_dl_distance_bounded("sefinitely", "definitely", 0, True), None)
+
+    def test_bounded_distance_returns_same_results_as_unbounded_distance(self):
+        words = ["art", "artist", "tarts", "strat", "vbarrtndre", "bartender",
+                 "aaaaa", "aa", "abc", "ca", ""]
+        for word_a in words:
+            for word_b in words:
+                dl_distance = calculate_dl_distance(word_a, word_b)
+                for max_dist in range(6):
+                    self.assertEqual(calculate_dl_distance_bounded(word_a, word_b, max_dist),
+                                     dl_distance if dl_distance <= max_dist else None)
+
     def test_matrix_is_initialized_correctly(self):
         matrix = init_matrix(5, 6, 7)
  
@@ -86,3 +122,37 @@ class TestDistanceService(unittest.TestCase):
 
         for i, row in enumerate(rows):
             self.assertListEqual(matrix[i], row)
+
+    def test_trie_searches_return_same_results_as_brute_force_search(self):
+        searches = [calculate_dl_distance_recursive, calculate_dl_distance_buffered,
+                    calculate_dl_distance_iterative, calculate_dl_distance_deepening,
+                    partial(calculate_dl_distance_iterative, ordered=True)]
+        random = Random(0)
+        for _ in range(200):
+            words = sorted({"".join(random.choice("abcs") for _ in range(random.randint(1, 4)))
+                            for _ in range(random.randint(1, 6))})
+            trie = Trie()
+            for word in words:
+                trie.add(word)
+            misspelling = "".join(random.choice("abcs") for _ in range(random.randint(1, 8)))
+
+            for max_dist in [1, 2, 3]:
+                for neighbour_check in [False, True]:
+                    distances = {word: calculate_dl_distance(word, misspelling, neighbour_check)
+                                 for word in words}
+                    min_dist = min(distances.values())
+                    expected = [f"{word}({dist})" for word, dist in distances.items()
+                                if dist == min_dist and dist <= max_dist]
+                    for search in searches:
+                        self.assertListEqual(
+                            search(misspelling, trie, max_dist, neighbour_check), expected)
+                    suggestions = calculate_suggestions(misspelling, trie, 1, max_dist,
+                                                        neighbour_check)
+                    self.assertListEqual([f"{word}({dist})" for dist, word in suggestions],
+                                         expected[:1])
+
+        trie = Trie()
+        for word in ["ab", "b", "bc", "ca"]:
+            trie.add(word)
+        for search in searches:
+            self.assertListEqual(search("acsbc", trie, 3), ["ab(3)", "bc(3)"])
@@ -0,0 +1,42 @@
+import unittest
+from entities.dl_automaton import DLAutomaton
+from services.distance_service import calculate_dl_distance
+
+
+class TestDLAutomaton(unittest.TestCase):
+    def run_automaton(self, automaton, word):
+        state = automaton.get_start_state()
+        for char in word:
+            state = automaton.step(state, char)
+            if state is None:
+                return None
+        return automaton.get_distance(state)
+
+    def test_accepted_words_have_correct_distances(self):
+        words = ["", "a", "ab", "ba", "ca", "abc", "acb", "bca", "cab", "abcd",
+                 "badc", "carbon", "crabon", "carbonate", "bale", "balw"]
+        for word_a in words:
+            for max_dist in [0, 1, 2, 3]:
+                automaton = DLAutomaton(word_a, max_dist)
+                for word_b in words:
+                    dist = calculate_dl_distance(word_a, word_b)
+                    self.assertEqual(self.run_automaton(automaton, word_b),
+                                     dist if dist <= max_dist else None)
+
+    def test_transpositions_with_characters_between_are_accepted(self):
+        self.assertEqual(self.run_automaton(DLAutomaton("ca", 2), "abc"), 2)
+        self.assertEqual(self.run_automaton(DLAutomaton("ca", 1), "abc"), None)
+
+    def test_automaton_stops_when_no_word_can_be_accepted(self):
+        automaton = DLAutomaton("car", 1)
+        state = automaton.step(automaton.get_start_state(), "x")
+        self.assertIsNotNone(state)
+        self.assertIsNone(automaton.step(state, "y"))
+
+    def test_characters_not_in_the_word_share_transitions(self):
+        automaton = DLAutomaton("car", 2)
+        state = automaton.get_start_state()
+        self.assertEqual(automaton.step(state, "x"), automaton.step(state, "z"))
+        state_count = automaton.get_state_count()
+        automaton.step(state, "q")
+        self.assertEqual(automaton.get_state_count(), state_count)
@@ -0,0 +1,45 @@
+import unittest
+from entities.engine_planner import EnginePlanner
+
+
+class TestEnginePlanner(unittest.TestCase):
+    def setUp(self):
+        self.planner = EnginePlanner(["slow", "fast", "medium"], 100, 0.5, 10)
+        self.query_class = self.planner.get_query_class("carbon")
+
+    def test_query_classes_are_calculated_correctly(self):
+        self.assertEqual(self.planner.get_query_class("car"), (0, 0, False))
+        self.assertEqual(self.planner.get_query_class("carbon", 2), (1, 2, False))
+        self.assertEqual(self.planner.get_query_class("carbonated", 5, True), (2, 3, True))
+
+    def test_engines_without_search_times_are_chosen_first(self):
+        for engine in ["slow", "fast", "medium"]:
+            self.assertEqual(self.planner.is_calibrated(self.query_class), False)
+            self.assertEqual(self.planner.choose(self.query_class), engine)
+            self.planner.record(self.query_class, engine, 1.0)
+        self.assertEqual(self.planner.is_calibrated(self.query_class), True)
+        self.assertEqual(self.planner.is_calibrated((2, 0, False)), False)
+
+    def test_fastest_engine_is_chosen_and_averages_are_updated(self):
+        for engine, seconds in [("slow", 3.0), ("fast", 1.0), ("medium", 2.0)]:
+            self.planner.record(self.query_class, engine, seconds)
+        self.assertEqual(self.planner.choose(self.query_class), "fast")
+
+        self.planner.record(self.query_class, "fast", 4.0)
+        self.assertEqual(self.planner.get_latency(self.query_class, "fast"), 2.5)
+        self.assertEqual(self.planner.choose(self.query_class), "medium")
+        self.assertEqual(self.planner.get_latency(self.query_class, "unknown"), None)
+        self.assertEqual(self.planner.get_dictionary_size(), 100)
+
+    def test_engines_measured_least_recently_are_explored_if_not_too_slow(self):
+        for engine, seconds in [("slow", 9.0), ("fast", 1.0), ("medium", 2.0)]:
+            self.planner.record(self.query_class, engine, seconds)
+
+        chosen = []
+        for _ in range(20):
+            engine = self.planner.choose(self.query_class)
+            self.planner.record(self.query_class, engine, 1.0 if engine == "fast" else 2.0)
+            chosen.append(engine)
+        self.assertEqual(chosen.count("medium"), 2)
+        self.assertEqual(chosen.count("slow"), 0)
+        self.assertEqual(chosen[9], "medium")
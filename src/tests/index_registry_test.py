@@ -0,0 +1,75 @@
+import unittest
+from entities.index_registry import IndexRegistry
+from entities.ngram_index import NGramIndex
+from entities.trie import Trie
+
+
+class TestIndexRegistry(unittest.TestCase):
+    def setUp(self):
+        self.words = ["art", "bale", "ball", "car"]
+        self.builds = 0
+        self.registry = IndexRegistry(lambda: list(self.words), 10)
+        self.registry.register("ngram", NGramIndex)
+        self.registry.register("reversed", Trie, key=lambda word: word[::-1])
+        self.registry.register("lengths", self.count_lengths, incremental=False)
+
+    def count_lengths(self, words):
+        self.builds += 1
+        return {word: len(word) for word in words}
+
+    def test_indexes_are_built_from_the_words_when_first_requested(self):
+        self.assertListEqual(self.registry.get("reversed").get_all(),
+                             ["elab", "llab", "rac", "tra"])
+        self.assertEqual(self.registry.get("ngram").find("bale"), True)
+        self.assertDictEqual(self.registry.get("lengths"),
+                             {"art": 3, "bale": 4, "ball": 4, "car": 3})
+        self.registry.get("lengths")
+        self.assertEqual(self.builds, 1)
+
+    def test_incremental_indexes_are_updated_and_others_rebuilt(self):
+        reversed_trie = self.registry.get("reversed")
+        self.registry.get("lengths")
+
+        self.words.append("carbon")
+        self.registry.add("carbon")
+        self.words.remove("art")
+        self.registry.remove("art")
+
+        self.assertIs(self.registry.get("reversed"), reversed_trie)
+        self.assertListEqual(reversed_trie.get_all(), ["elab", "llab", "nobrac", "rac"])
+        self.assertEqual(self.registry.get("lengths")["carbon"], 6)
+        self.assertEqual(self.builds, 2)
+
+    def test_cached_results_are_only_returned_for_the_same_version(self):
+        self.registry.put_cached("balw", ["bale(1)"])
+        self.assertListEqual(self.registry.get_cached("balw"), ["bale(1)"])
+        self.assertEqual(self.registry.get_version(), 0)
+
+        self.registry.add("bawl")
+        self.assertEqual(self.registry.get_cached("balw"), None)
+        self.registry.put_cached("balw", ["bale(1)", "bawl(1)"])
+
+        self.registry.clear()
+        self.assertEqual(self.registry.get_cached("balw"), None)
+        self.assertEqual(self.registry.get_version(), 2)
+        self.assertDictEqual(self.registry.get_cache_stats(),
+                             {"hits": 1, "misses": 2, "evictions": 0, "size": 0})
+
+    def test_dropped_indexes_are_closed(self):
+        closed = []
+
+        class Resource:
+            def __init__(self, words):
+                self.words = words
+
+            def close(self):
+                closed.append(self.words)
+
+        self.registry.register("resource", Resource, incremental=False)
+        self.registry.get("resource")
+        self.registry.add("bawl")
+        self.assertListEqual(closed, [self.words])
+
+        self.registry.get("resource")
+        self.registry.clear()
+        self.assertEqual(len(closed), 2)
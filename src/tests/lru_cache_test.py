@@ -0,0 +1,37 @@
+import unittest
+from entities.lru_cache import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = LRUCache(2)
+
+    def test_cached_values_are_returned_and_counted_as_hits(self):
+        self.cache.put("balw", ["bawl(1)"])
+        self.assertListEqual(self.cache.get("balw"), ["bawl(1)"])
+        self.assertEqual(self.cache.get("crabon"), None)
+        self.assertDictEqual(self.cache.get_stats(),
+                             {"hits": 1, "misses": 1, "evictions": 0, "size": 1})
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.put("balw", ["bawl(1)"])
+        self.cache.put("crabon", ["carbon(1)"])
+        self.cache.get("balw")
+        self.cache.put("atr", ["art(1)"])
+
+        self.assertEqual(self.cache.get("crabon"), None)
+        self.assertListEqual(self.cache.get("balw"), ["bawl(1)"])
+        self.assertListEqual(self.cache.get("atr"), ["art(1)"])
+        self.assertEqual(self.cache.get_stats()["evictions"], 1)
+        self.assertEqual(self.cache.get_size(), 2)
+
+    def test_clearing_removes_entries_and_zero_capacity_caches_nothing(self):
+        self.cache.put("balw", ["bawl(1)"])
+        self.cache.clear()
+        self.assertEqual(self.cache.get("balw"), None)
+        self.assertEqual(self.cache.get_size(), 0)
+
+        cache = LRUCache(0)
+        cache.put("balw", ["bawl(1)"])
+        self.assertEqual(cache.get("balw"), None)
+        self.assertEqual(cache.get_stats()["evictions"], 0)
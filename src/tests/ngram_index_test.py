@@ -0,0 +1,43 @@
+import unittest
+from entities.ngram_index import NGramIndex
+from services.distance_service import calculate_dl_distance
+
+
+class TestNGramIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = NGramIndex()
+        self.words = ["a", "art", "artist", "bale", "ball", "balm", "bawl",
+                      "car", "carbon", "carbonate", "zebra"]
+        for word in self.words:
+            self.index.add(word)
+
+    def test_adding_and_removing_words_works_as_expected(self):
+        for word in self.words:
+            self.assertEqual(self.index.find(word), True)
+        self.assertEqual(self.index.find("carbo"), False)
+
+        self.index.add("ball")
+        self.assertEqual(self.index.get_size(), len(self.words))
+
+        self.assertEqual(self.index.remove("ball"), True)
+        self.assertEqual(self.index.remove("ball"), False)
+        self.assertEqual(self.index.find("ball"), False)
+        self.assertNotIn("ball", self.index.lookup("balll", 1))
+        self.assertEqual(self.index.get_size(), len(self.words) - 1)
+
+    def test_lookup_keeps_all_words_within_max_dist(self):
+        for n in [2, 3]:
+            index = NGramIndex(n)
+            for word in self.words:
+                index.add(word)
+            for misspelling in ["balw", "crabon", "carbonat", "atr", "zbera", "ratist", "b"]:
+                for max_dist in [1, 2, 3]:
+                    candidates = index.lookup(misspelling, max_dist)
+                    for word in self.words:
+                        if calculate_dl_distance(misspelling, word) <= max_dist:
+                            self.assertIn(word, candidates)
+
+    def test_lookup_discards_words_sharing_too_few_grams(self):
+        self.assertListEqual(self.index.lookup("carbonat", 1), ["carbonate"])
+        self.assertListEqual(self.index.lookup("balw", 1), ["bale", "ball", "balm", "bawl"])
+        self.assertListEqual(self.index.lookup("qqqqqq", 2), [])
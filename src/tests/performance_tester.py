@@ -68,6 +68,11 @@ class PerformanceTester:
         # Recursive:
         results = self._run_speed_test(error_list, "recursive", max_edit, neighbour_prio)
         self._write(results, f"_recursive{suffix}")
+
+        # BK-tree (built before the timed searches):
+        spellchecker_service.build_index("bk_tree")
+        results = self._run_speed_test(error_list, "bk_tree", max_edit, neighbour_prio)
+        self._write(results, f"_bk_tree{suffix}")
   
         print(f"\nSpelling errors used in tests: {' ' .join(error_list)}")
         print(f"Params: max_edit: {max_edit}, neighbour_prio: {neighbour_prio}")
@@ -134,6 +139,10 @@ class PerformanceTester:
             result = spellchecker_service.find_closest_match_recursively(
                 error, max_edit, neighbour_prio
             )
+        elif search_type == "bk_tree":
+            result = spellchecker_service.find_closest_match_indexed(
+                error, max_edit, neighbour_prio, "bk_tree"
+            )
         else: 
             result = spellchecker_service.find_closest_match(error, max_edit, neighbour_prio)
         search_time = spellchecker_service.get_search_time()
@@ -0,0 +1,40 @@
+import unittest
+from entities.phonetic_index import PhoneticIndex
+from services.phonetic_utils import calculate_phonetic_key
+
+
+class TestPhoneticIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = PhoneticIndex()
+        self.words = ["definitely", "government", "knowledge", "necessary",
+                      "physics", "receive", "separate", "their", "weird"]
+        for word in self.words:
+            self.index.add(word)
+
+    def test_adding_and_removing_words_works_as_expected(self):
+        for word in self.words:
+            self.assertEqual(self.index.find(word), True)
+        self.assertEqual(self.index.find("recieve"), False)
+
+        self.index.add("receive")
+        self.assertEqual(self.index.get_size(), len(self.words))
+
+        self.assertEqual(self.index.remove("receive"), True)
+        self.assertEqual(self.index.remove("receive"), False)
+        self.assertListEqual(self.index.lookup("recieve"), [])
+        self.assertEqual(self.index.get_size(), len(self.words) - 1)
+        self.assertEqual(self.index.get_code_count(), len(self.words) - 1)
+
+    def test_lookup_finds_words_that_sound_alike(self):
+        for misspelling, word in [("recieve", "receive"), ("definately", "definitely"),
+                                  ("seperate", "separate"), ("neccessary", "necessary"),
+                                  ("thier", "their"), ("wierd", "weird"),
+                                  ("knowlege", "knowledge"), ("fysics", "physics")]:
+            self.assertListEqual(self.index.lookup(misspelling), [word])
+        self.assertListEqual(self.index.lookup("zebra"), [])
+
+    def test_phonetic_keys_are_calculated_correctly(self):
+        for word, key in [("receive", "rsf"), ("knight", "nt"), ("nation", "nxn"),
+                          ("science", "sns"), ("thumb", "0m"), ("xenon", "sn"),
+                          ("whale", "wl"), ("judge", "j"), ("auction", "akxn"), ("", "")]:
+            self.assertEqual(calculate_phonetic_key(word), key)
@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+from repositories.query_log_repository import QueryLogRepository
+
+
+class TestQueryLogRepository(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.repository = QueryLogRepository(os.path.join(self.directory.name, "query_log.txt"))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_logged_words_are_counted(self):
+        self.assertDictEqual(self.repository.get_counts(), {})
+        for word in ["balw", "crabon", "balw"]:
+            self.repository.add(word)
+
+        self.assertDictEqual(self.repository.get_counts(), {"balw": 2, "crabon": 1})
+        self.repository.delete()
+        self.assertDictEqual(self.repository.get_counts(), {})
+
+    def test_logged_words_are_written_to_the_file_in_batches(self):
+        file_path = os.path.join(self.directory.name, "query_log.txt")
+        repository = QueryLogRepository(file_path, 3)
+        for word in ["balw", "crabon"]:
+            repository.add(word)
+        self.assertEqual(os.path.isfile(file_path), False)
+
+        repository.add("atr")
+        repository.add("balw")
+        with open(file_path, encoding="utf-8") as file:
+            self.assertEqual(file.read(), "balw\ncrabon\natr\n")
+
+        repository.flush()
+        with open(file_path, encoding="utf-8") as file:
+            self.assertEqual(file.read(), "balw\ncrabon\natr\nbalw\n")
+
+    def test_nothing_is_logged_without_a_file_path(self):
+        repository = QueryLogRepository(None)
+        repository.add("balw")
+
+        self.assertDictEqual(repository.get_counts(), {})
@@ -0,0 +1,150 @@
+import unittest
+from random import Random
+from entities.radix_trie import RadixTrie
+from entities.trie import Trie
+from services.alphabet_utils import calc_char
+from services.distance_service import calculate_dl_distance
+from services.distance_service_automaton import calculate_dl_distance_automaton
+from services.distance_service_best_first import calculate_suggestions
+from services.distance_service_radix import calculate_dl_distance_radix
+from services.distance_service_recursive import calculate_dl_distance_recursive
+
+
+class TestRadixTrie(unittest.TestCase):
+    def setUp(self):
+        self.trie = RadixTrie()
+        self.words = ["art", "artist", "artistic", "banana", "band", "bandana",
+                      "car", "carbon", "carbonate", "zebra"]
+
+    def test_adding_words_works_as_expected(self):
+        for word in reversed(self.words):
+            self.trie.add(word)
+
+        for word in self.words:
+            self.assertEqual(self.trie.find(word), True)
+        for word in ["ar", "artis", "ban", "carbo", "zebras", "x"]:
+            self.assertEqual(self.trie.find(word), False)
+
+        self.assertListEqual(self.trie.get_all(), self.words)
+        self.assertEqual(self.trie.get_size(), len(self.words))
+        self.assertEqual(self.trie.get_max_keylength(), 9)
+
+    def test_single_child_chains_are_merged_into_one_edge(self):
+        self.trie.add("carbonate")
+        self.trie.add("carbon")
+        self.trie.add("car")
+
+        root = self.trie.get_root()
+        self.assertEqual(len(root.children), 1)
+        car = root.children[0]
+        self.assertEqual(car.label, "car")
+        self.assertEqual(car.children[0].label, "bon")
+        self.assertEqual(car.children[0].children[0].label, "ate")
+
+    def test_adding_an_existing_word_does_not_change_the_size(self):
+        self.trie.add("band")
+        self.trie.add("band")
+
+        self.assertEqual(self.trie.get_size(), 1)
+
+    def test_search_returns_same_results_as_recursive_search_in_a_trie(self):
+        trie = Trie()
+        for word in self.words:
+            self.trie.add(word)
+            trie.add(word)
+
+        for misspelling in ["artsit", "bnad", "carbonte", "zebar", "qqqqqq"]:
+            for max_dist in [None, 1]:
+                for neighbour_check in [False, True]:
+                    self.assertListEqual(
+                        calculate_dl_distance_radix(misspelling, self.trie,
+                                                    max_dist, neighbour_check),
+                        calculate_dl_distance_recursive(misspelling, trie,
+                                                        max_dist, neighbour_check)
+                    )
+
+    def test_search_returns_same_results_as_brute_force_search(self):
+        random = Random(0)
+        for _ in range(300):
+            words = sorted({"".join(random.choice("abcs") for _ in range(random.randint(1, 4)))
+                            for _ in range(random.randint(1, 6))})
+            trie = RadixTrie()
+            for word in words:
+                trie.add(word)
+            misspelling = "".join(random.choice("abcs") for _ in range(random.randint(1, 8)))
+
+            for max_dist in [1, 2, 3]:
+                for neighbour_check in [False, True]:
+                    distances = {word: calculate_dl_distance(word, misspelling, neighbour_check)
+                                 for word in words}
+                    min_dist = min(distances.values())
+                    expected = [f"{word}({dist})" for word, dist in distances.items()
+                                if dist == min_dist and dist <= max_dist]
+                    self.assertListEqual(
+                        calculate_dl_distance_radix(misspelling, trie, max_dist, neighbour_check),
+                        expected
+                    )
+
+        trie = RadixTrie()
+        for word in ["bd", "cc"]:
+            trie.add(word)
+        self.assertListEqual(calculate_dl_distance_radix("cdbbcac", trie, 3), [])
+
+    def test_removing_words_keeps_the_tree_path_compressed(self):
+        for word in ["car", "carbon", "carbonate", "cart"]:
+            self.trie.add(word)
+
+        self.assertEqual(self.trie.remove("carbon"), True)
+        self.assertEqual(self.trie.remove("cart"), True)
+        self.assertEqual(self.trie.remove("carb"), False)
+
+        car = self.trie.get_root().children[0]
+        self.assertEqual(len(car.children), 1)
+        self.assertEqual(car.children[0].label, "bonate")
+        self.assertListEqual(self.trie.get_all(), ["car", "carbonate"])
+
+        self.trie.remove("carbonate")
+        self.assertEqual(self.trie.get_size(), 1)
+        self.assertEqual(self.trie.get_max_keylength(), 3)
+
+    def test_positions_are_expanded_one_character_at_a_time(self):
+        for word in ["car", "carbon", "cart"]:
+            self.trie.add(word)
+
+        position = self.trie.get_root()
+        for char in "carbo":
+            children = self.trie.get_children(position)
+            self.assertIn(char, [calc_char(index) for index, _ in children])
+            position = dict((calc_char(index), child) for index, child in children)[char]
+            self.assertEqual(self.trie.is_valid_end(position), char == "r")
+
+        self.assertTupleEqual(self.trie.get_length_bounds(position), (1, 1))
+        self.assertTupleEqual(self.trie.get_length_bounds(self.trie.get_root()), (3, 6))
+
+    def test_length_bounds_are_updated_when_words_are_removed(self):
+        for word in ["car", "carbon", "carbonate", "cart"]:
+            self.trie.add(word)
+
+        self.trie.remove("carbonate")
+        self.trie.remove("car")
+
+        car = self.trie.get_root().children[0]
+        self.assertTupleEqual(self.trie.get_length_bounds(self.trie.get_root()), (4, 6))
+        self.assertTupleEqual(self.trie.get_length_bounds(car), (1, 3))
+
+    def test_searches_using_positions_return_same_results_as_in_a_trie(self):
+        trie = Trie()
+        for word in self.words:
+            self.trie.add(word)
+            trie.add(word)
+
+        for misspelling in ["artsit", "bnad", "carbonte", "zebar", "qqqqqq"]:
+            for max_dist in [None, 1]:
+                self.assertListEqual(
+                    calculate_dl_distance_automaton(misspelling, self.trie, max_dist),
+                    calculate_dl_distance_automaton(misspelling, trie, max_dist)
+                )
+                self.assertListEqual(
+                    calculate_suggestions(misspelling, self.trie, 3, max_dist),
+                    calculate_suggestions(misspelling, trie, 3, max_dist)
+                )
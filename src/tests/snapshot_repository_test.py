@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+from entities.array_trie import ArrayTrie
+from repositories.snapshot_repository import SnapshotRepository
+
+
+class TestSnapshotRepository(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.repository = SnapshotRepository(
+            os.path.join(self.directory.name, "dictionary.snapshot")
+        )
+        self.words = ["art", "artist", "car", "carbon", "value", "zoo"]
+        self.trie = ArrayTrie()
+        for word in self.words:
+            self.trie.add(word)
+        self.checksum = bytes(range(32))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_loading_a_saved_snapshot_returns_the_same_trie(self):
+        self.repository.save(self.trie, self.checksum)
+
+        snapshot = self.repository.load(self.checksum)
+
+        self.assertListEqual(snapshot.get_all(), self.words)
+        self.assertEqual(snapshot.get_size(), len(self.words))
+        self.assertEqual(snapshot.get_max_keylength(), 6)
+        self.assertEqual(snapshot.find("carbon"), True)
+        self.assertEqual(snapshot.find("carb"), False)
+        self.assertEqual(snapshot.get_length_bounds(snapshot.get_root()), (3, 6))
+
+    def test_compiling_a_wordlist_saves_a_snapshot_of_the_sorted_words(self):
+        self.repository.compile(list(reversed(self.words)), self.checksum)
+
+        snapshot = self.repository.load(self.checksum)
+
+        self.assertListEqual(snapshot.get_all(), self.words)
+        self.assertEqual(snapshot.get_size(), len(self.words))
+
+    def test_loading_a_snapshot_with_another_checksum_returns_None(self):
+        self.repository.save(self.trie, self.checksum)
+
+        self.assertEqual(self.repository.load(bytes(32)), None)
+
+    def test_loading_a_missing_or_broken_snapshot_returns_None(self):
+        self.assertEqual(self.repository.load(self.checksum), None)
+
+        self.repository.save(self.trie, self.checksum)
+        file_path = os.path.join(self.directory.name, "dictionary.snapshot")
+        with open(file_path, "r+b") as file:
+            file.truncate(os.path.getsize(file_path) - 1)
+
+        self.assertEqual(self.repository.load(self.checksum), None)
+
+    def test_adding_to_a_loaded_snapshot_does_not_change_the_file(self):
+        self.repository.save(self.trie, self.checksum)
+        snapshot = self.repository.load(self.checksum)
+
+        snapshot.add("zebra")
+
+        self.assertEqual(snapshot.find("zebra"), True)
+        self.assertEqual(self.repository.load(self.checksum).find("zebra"), False)
@@ -1,6 +1,31 @@
+import os
+import tempfile
 import unittest
+from functools import partial
+from multiprocessing import Value
 from time import perf_counter
+from unittest.mock import patch
+from entities.trie import Trie
+from entities.array_trie import ArrayTrie
+from entities.search_pool import SearchPool
+from repositories.corrections_repository import corrections_repository
+from repositories.query_log_repository import QueryLogRepository
+from repositories.snapshot_repository import snapshot_repository
+from repositories.wordlist_repository import wordlist_repository
 from services.spellchecker_service import SpellcheckerService
+from services.alphabet_utils import calc_char, calc_index
+from services.distance_service_numpy import NUMPY_AVAILABLE
+from services.distance_service_iterative import(
+    calculate_dl_distance_iterative,
+    order_children,
+    search_deepening
+)
+from services.distance_service_parallel import(
+    calculate_dl_distance_parallel,
+    init_worker,
+    search_subtrie
+)
+from services.distance_service_recursive import calculate_dl_distance_recursive
 
 
 class TestSpellcheckerService(unittest.TestCase):
@@ -8,6 +33,10 @@ class TestSpellcheckerService(unittest.TestCase):
         self.sp_service = SpellcheckerService()
         self.sp_service.delete_all()
 
+    def tearDown(self):
+        snapshot_repository.delete()
+        corrections_repository.delete()
+
     def test_adding_the_first_word_works_correctly(self):
         self.sp_service.add_word("car")
 
@@ -26,6 +55,24 @@ class TestSpellcheckerService(unittest.TestCase):
         self.assertEqual(len(words_1), len(words_2))
         self.assertEqual(result, None)
 
+    def test_deleting_a_word_removes_it_from_dictionary_and_wordlist(self):
+        for word in ["car", "carbon", "zoo"]:
+            self.sp_service.add_word(word)
+
+        result = self.sp_service.delete_word("carbon")
+
+        self.assertEqual(result, "carbon")
+        self.assertEqual(self.sp_service.find_word("carbon"), False)
+        self.assertEqual(self.sp_service.get_dictionary_size(), 2)
+        self.sp_service.load_wordlist()
+        self.assertListEqual(self.sp_service.get_all(), ["car", "zoo"])
+
+    def test_deleting_a_word_not_in_dictionary_returns_None(self):
+        self.sp_service.add_word("car")
+
+        self.assertEqual(self.sp_service.delete_word("carbon"), None)
+        self.assertEqual(self.sp_service.get_dictionary_size(), 1)
+
     def test_searching_for_word_that_exists_in_dictionary_returns_True(self):
         self.sp_service.add_word("zoo")
 
@@ -101,6 +148,30 @@ class TestSpellcheckerService(unittest.TestCase):
 
         result = self.sp_service.find_closest_match("banf", None, True)
         self.assertEqual(result, ["band(0.5)"])
+
+    @unittest.skipIf(not NUMPY_AVAILABLE, "NumPy is not installed")
+    def test_baseline_search_with_numpy_backend_returns_same_candidates(self):
+        for word in ["art", "car", "carbon", "cart", "pass", "value", "valued"]:
+            self.sp_service.add_word(word)
+
+        for word, max_edit in [("cat", None), ("valeu", None), ("crabone", 2), ("xyz", 1)]:
+            expected = self.sp_service.find_closest_match(word, max_edit)
+            with patch("services.spellchecker_service.BASELINE_BACKEND", "numpy"):
+                result = self.sp_service.find_closest_match(word, max_edit)
+            self.assertListEqual(result, expected)
+
+    @unittest.skipIf(not NUMPY_AVAILABLE, "NumPy is not installed")
+    def test_baseline_search_with_numpy_backend_sees_changes_in_dictionary(self):
+        for word in ["art", "car", "carbon"]:
+            self.sp_service.add_word(word)
+
+        with patch("services.spellchecker_service.BASELINE_BACKEND", "numpy"):
+            self.assertListEqual(self.sp_service.find_closest_match("cabon"), ["carbon(1)"])
+            self.sp_service.add_word("capon")
+            self.assertListEqual(self.sp_service.find_closest_match("cabon"),
+                                 ["capon(1)", "carbon(1)"])
+            self.sp_service.delete_word("carbon")
+            self.assertListEqual(self.sp_service.find_closest_match("cabon"), ["capon(1)"])
     
     def test_recursive_search_for_closest_match_for_misspelled_word_works_as_expected(self):
         self.sp_service.add_word("art")
@@ -190,3 +261,367 @@ class TestSpellcheckerService(unittest.TestCase):
         ref_string = (f"\nSearch took {self.sp_service.get_search_time()} seconds."
                      + f"\n({len(wordlist)} words in dictionary.)")
         self.assertEqual(ref_string, self.sp_service.get_info())
+
+    def test_recursive_search_works_with_a_compact_trie(self):
+        wordlist = ["art", "bale", "ball", "balm", "bawl", "car", "carbon"]
+        compact_trie = Trie(True)
+        for word in wordlist:
+            compact_trie.add(word)
+
+        result = calculate_dl_distance_recursive("balw", compact_trie)
+        self.assertEqual(result, ["bale(1)", "ball(1)", "balm(1)", "bawl(1)"])
+
+        result = calculate_dl_distance_recursive("crabon", compact_trie)
+        self.assertEqual(result, ["carbon(1)"])
+
+    def test_recursive_search_works_with_an_array_trie(self):
+        wordlist = ["art", "bale", "ball", "balm", "bawl", "car", "carbon"]
+        array_trie = ArrayTrie()
+        for word in wordlist:
+            array_trie.add(word)
+
+        result = calculate_dl_distance_recursive("balw", array_trie)
+        self.assertEqual(result, ["bale(1)", "ball(1)", "balm(1)", "bawl(1)"])
+
+        result = calculate_dl_distance_recursive("balw", array_trie, None, True)
+        self.assertEqual(result, ["bale(0.5)"])
+
+    def test_other_search_modes_return_same_results_as_recursive_search(self):
+        for word in ["art", "bale", "ball", "balm", "bawl", "car", "carbon", "carbonate"]:
+            self.sp_service.add_word(word)
+
+        for word in ["balw", "crabone", "carbonat", "atr", "xyz"]:
+            for max_edit in [None, 1]:
+                for neighbour_check in [False, True]:
+                    expected = self.sp_service.find_closest_match_recursively(
+                        word, max_edit, neighbour_check
+                    )
+                    for mode in ["buffered", "iterative", "ordered", "parallel",
+                                 "deepening", "automaton"]:
+                        result = self.sp_service.find_closest_match_recursively(
+                            word, max_edit, neighbour_check, mode
+                        )
+                        self.assertListEqual(result, expected)
+
+    def test_deepening_search_stops_at_the_first_distance_with_candidates(self):
+        trie = Trie()
+        for word in ["art", "carbonate"]:
+            trie.add(word)
+
+        searched = []
+        def search(max_dist):
+            searched.append(max_dist)
+            return ["art(2)"] if max_dist >= 2 else []
+
+        self.assertListEqual(search_deepening(search, trie, 5), ["art(2)"])
+        self.assertListEqual(searched, [1, 2])
+        searched.clear()
+        self.assertListEqual(search_deepening(lambda dist: searched.append(dist) or [], trie),
+                             [])
+        self.assertListEqual(searched, list(range(1, 10)))
+
+    def test_ordered_search_visits_children_fitting_the_target_word_first(self):
+        children = [(calc_index(char), None) for char in "abcdefst"]
+        ordered = order_children(children, "cart", 1)
+        self.assertListEqual([calc_char(index) for index, _ in ordered],
+                             list("acsbdeft"))
+        self.assertListEqual(order_children(children, "cart", 4), children)
+
+    def test_parallel_search_combines_results_from_worker_processes(self):
+        words = ["art", "bale", "ball", "balm", "bawl", "car", "carbon", "carbonate"]
+        trie = Trie()
+        for word in words:
+            trie.add(word)
+
+        pool = SearchPool(words, 3)
+        try:
+            self.assertEqual(pool.get_process_count(), 3)
+            for word in ["balw", "crabone", "atr", "xyz"]:
+                for max_edit in [None, 1]:
+                    for neighbour_check in [False, True]:
+                        result = calculate_dl_distance_parallel(word, trie, max_edit,
+                                                                neighbour_check, pool)
+                        self.assertListEqual(result, calculate_dl_distance_recursive(
+                            word, trie, max_edit, neighbour_check
+                        ))
+        finally:
+            pool.close()
+        self.assertEqual(pool.get_process_count(), 0)
+
+    def test_subtrie_search_lowers_the_distance_shared_by_the_workers(self):
+        bound = Value("d", 3)
+        init_worker(["art", "bale", "ball", "balm", "car", "carbon"], bound)
+
+        self.assertTupleEqual(search_subtrie("b", "balw", False), (1, ["bale(1)", "ball(1)", "balm(1)"]))
+        self.assertEqual(bound.value, 1)
+        self.assertIsNone(search_subtrie("c", "balw", False))
+        self.assertTupleEqual(search_subtrie("a", "atr", False), (1, ["art(1)"]))
+        self.assertEqual(bound.value, 1)
+
+    def test_symspell_search_returns_same_results_as_recursive_search_within_max_edit(self):
+        for word in ["art", "bale", "ball", "balm", "bawl", "car", "carbon", "carbonate"]:
+            self.sp_service.add_word(word)
+
+        search = partial(self.sp_service.find_closest_match_indexed, index="symspell")
+        for word in ["balw", "crabon", "carbonat", "atr"]:
+            for max_edit in [None, 1]:
+                for neighbour_check in [False, True]:
+                    result = search(word, max_edit, neighbour_check)
+                    self.assertListEqual(result, self.sp_service.find_closest_match_recursively(
+                        word, max_edit or 2, neighbour_check
+                    ))
+
+        self.assertListEqual(search("xyz"), [])
+        self.assertListEqual(search("ball"), ["ball"])
+
+    def test_symspell_index_is_updated_when_words_are_added_and_deleted(self):
+        search = partial(self.sp_service.find_closest_match_indexed, index="symspell")
+        self.sp_service.add_word("car")
+        self.assertListEqual(search("carbo"), ["car(2)"])
+
+        self.sp_service.add_word("carbon")
+        self.assertListEqual(search("carbo"), ["carbon(1)"])
+
+        self.sp_service.delete_word("carbon")
+        self.assertListEqual(search("carbo"), ["car(2)"])
+
+        self.sp_service.delete_all()
+        self.assertListEqual(search("carbo"), [])
+
+    def test_bk_tree_search_returns_same_results_as_recursive_search(self):
+        for word in ["art", "bale", "ball", "balm", "bawl", "car", "carbon", "carbonate"]:
+            self.sp_service.add_word(word)
+
+        search = partial(self.sp_service.find_closest_match_indexed, index="bk_tree")
+        for word in ["balw", "crabone", "carbonat", "atr", "xyz"]:
+            for max_edit in [None, 1]:
+                for neighbour_check in [False, True]:
+                    result = search(word, max_edit, neighbour_check)
+                    self.assertListEqual(result, self.sp_service.find_closest_match_recursively(
+                        word, max_edit, neighbour_check
+                    ))
+
+        self.sp_service.delete_word("bale")
+        self.sp_service.add_word("bals")
+        self.assertListEqual(search("balw", None, True), ["bals(0.5)"])
+
+    def test_partition_search_returns_same_results_as_recursive_search(self):
+        for word in ["art", "bale", "ball", "balm", "bawl", "car", "carbon", "carbonate"]:
+            self.sp_service.add_word(word)
+
+        for word in ["balw", "crabone", "carbonat", "xarbonate", "carbonaet", "atr", "xyz"]:
+            for max_edit in [None, 1, 2]:
+                for neighbour_check in [False, True]:
+                    result = self.sp_service.find_closest_match_partition(
+                        word, max_edit, neighbour_check
+                    )
+                    self.assertListEqual(result, self.sp_service.find_closest_match_recursively(
+                        word, max_edit, neighbour_check
+                    ))
+
+        self.sp_service.delete_word("bale")
+        self.sp_service.add_word("bals")
+        self.assertListEqual(self.sp_service.find_closest_match_partition("balw", None, True),
+                             ["bals(0.5)"])
+        self.assertListEqual(self.sp_service.find_closest_match_partition("bbale", 1), [])
+
+    def test_phonetic_search_finds_words_that_sound_alike_or_within_one_edit(self):
+        for word in ["bale", "ball", "definitely", "receive", "recipe", "separate"]:
+            self.sp_service.add_word(word)
+
+        search = partial(self.sp_service.find_closest_match_indexed, index="phonetic")
+        self.assertListEqual(search("recieve"), ["receive(1)"])
+        self.assertListEqual(search("definately"), ["definitely(1)"])
+        self.assertListEqual(search("seperete"), ["separate(2)"])
+        self.assertListEqual(search("seperete", 1), [])
+        self.assertListEqual(search("balw"), ["bale(1)", "ball(1)"])
+        self.assertListEqual(search("balw", None, True), ["bale(0.5)"])
+        self.assertListEqual(search("ball"), ["ball"])
+        self.assertListEqual(search("xyz"), [])
+
+        self.sp_service.delete_word("separate")
+        self.sp_service.add_word("seperate")
+        self.assertListEqual(search("seperete"), ["seperate(1)"])
+        self.sp_service.delete_all()
+        self.assertListEqual(search("recieve"), [])
+
+    def test_correct_returns_same_results_as_recursive_search(self):
+        for word in ["art", "bale", "ball", "balm", "bawl", "car", "carbon", "carbonate"]:
+            self.sp_service.add_word(word)
+
+        for _ in range(2):
+            for word in ["balw", "crabone", "carbonat", "atr", "xyz"]:
+                for max_edit in [None, 1]:
+                    for neighbour_check in [False, True]:
+                        result = self.sp_service.correct(word, max_edit, neighbour_check)
+                        self.assertListEqual(result, self.sp_service.find_closest_match_recursively(
+                            word, max_edit, neighbour_check
+                        ))
+        self.assertListEqual(self.sp_service.correct("ball"), ["ball"])
+
+    def test_calibrate_measures_all_engines_for_all_word_lengths(self):
+        for word in ["art", "bale", "ball", "balm", "bawl", "car", "carbon", "carbonate"]:
+            self.sp_service.add_word(word)
+
+        self.sp_service.calibrate(2)
+        planner = self.sp_service._get_planner()
+        for length_class in range(3):
+            for max_edit in range(4):
+                for neighbour_check in [False, True]:
+                    self.assertEqual(planner.is_calibrated(
+                        (length_class, max_edit, neighbour_check)), True)
+
+        for word in ["carbonated", "carbonates", "carbonic", "carbons", "cars"]:
+            self.sp_service.add_word(word)
+        self.assertIsNot(self.sp_service._get_planner(), planner)
+
+    def test_correct_returns_empty_list_for_empty_dictionary(self):
+        self.assertListEqual(self.sp_service.correct("arx"), [])
+        self.assertListEqual(self.sp_service.find_closest_match("arx"), [])
+        self.sp_service.calibrate()
+
+        self.sp_service.add_word("art")
+        self.assertListEqual(self.sp_service.correct("arx"), ["art(1)"])
+
+    def test_search_results_are_cached_until_the_dictionary_changes(self):
+        for word in ["art", "bale", "ball", "balm", "car", "carbon"]:
+            self.sp_service.add_word(word)
+
+        self.assertListEqual(self.sp_service.find_closest_match_recursively("balw"),
+                             ["bale(1)", "ball(1)", "balm(1)"])
+        result = self.sp_service.find_closest_match_recursively("balw")
+        self.assertListEqual(result, ["bale(1)", "ball(1)", "balm(1)"])
+        result.clear()
+        self.assertListEqual(self.sp_service.find_closest_match_recursively("balw"),
+                             ["bale(1)", "ball(1)", "balm(1)"])
+        self.assertListEqual(self.sp_service.find_closest_match_recursively("balw", 1, True),
+                             ["bale(0.5)"])
+        stats = self.sp_service.get_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (2, 2, 2))
+
+        self.sp_service.add_word("bals")
+        self.assertListEqual(self.sp_service.find_closest_match_recursively("balw", 1, True),
+                             ["bale(0.5)", "bals(0.5)"])
+        self.sp_service.delete_word("bale")
+        self.assertListEqual(self.sp_service.correct("balw", 1, True), ["bals(0.5)"])
+        self.assertListEqual(self.sp_service.correct("balw", 1, True), ["bals(0.5)"])
+        self.sp_service.delete_all()
+        self.assertListEqual(self.sp_service.find_closest_match_recursively("balw"), [])
+        self.assertEqual(self.sp_service.get_cache_stats()["hits"], 3)
+
+    def test_correct_returns_known_corrections_without_searching(self):
+        for word in ["art", "bale", "ball", "bawl", "carbon", "carbonate"]:
+            self.sp_service.add_word(word)
+        corrections_repository.save({"balw": ["bawl", "ball", "bale"], "crabon": ["carbonate"],
+                                     "atr": ["arts"]})
+
+        self.assertListEqual(self.sp_service.correct("balw"), ["bale(1)", "ball(1)", "bawl(1)"])
+        self.assertListEqual(self.sp_service.correct("balw", None, True),
+                             ["bale(0.5)", "ball(1)", "bawl(1)"])
+        self.assertListEqual(self.sp_service.correct("crabon"), ["carbonate(4)"])
+        self.assertListEqual(self.sp_service.correct("crabon", 2), ["carbon(1)"])
+        self.assertListEqual(self.sp_service.correct("atr"), ["art(1)"])
+
+        self.sp_service.delete_word("carbonate")
+        self.assertListEqual(self.sp_service.correct("crabon"), ["carbon(1)"])
+
+    def test_compile_corrections_uses_misspelling_list_and_query_log(self):
+        for word in ["art", "ball", "bawl", "carbon"]:
+            self.sp_service.add_word(word)
+
+        with tempfile.TemporaryDirectory() as directory:
+            errors_path = os.path.join(directory, "errors.txt")
+            with open(errors_path, "w", encoding="utf-8") as file:
+                file.write("balw->bawl, ball\ncrabon->carbon\nzebar->zebra\nbal->ball\n")
+            query_log = QueryLogRepository(os.path.join(directory, "query_log.txt"))
+            for word in ["atr", "xyz", "atr", "crabon", "crabon", "ball"]:
+                query_log.add(word)
+
+            with patch("services.spellchecker_service.SPELLING_ERRORS_PATH", errors_path), \
+                    patch("services.spellchecker_service.query_log_repository", query_log):
+                self.assertEqual(self.sp_service.compile_corrections(), 4)
+                self.sp_service.correct("crabon")
+                self.assertEqual(query_log.get_counts()["crabon"], 3)
+
+        self.assertDictEqual(corrections_repository.get_corrections(),
+                             {"atr": ["art"], "bal": ["ball"], "balw": ["bawl", "ball"],
+                              "crabon": ["carbon"]})
+
+    def test_baseline_search_with_ngram_prefilter_returns_same_results(self):
+        for word in ["art", "bale", "ball", "balm", "bawl", "car", "carbon", "carbonate"]:
+            self.sp_service.add_word(word)
+
+        for word in ["balw", "crabone", "carbonat", "atr", "xyz"]:
+            for max_edit in [None, 1, 2]:
+                for neighbour_check in [False, True]:
+                    expected = self.sp_service.find_closest_match(word, max_edit,
+                                                                  neighbour_check)
+                    with patch("services.spellchecker_service.BASELINE_PREFILTER", "ngram"):
+                        result = self.sp_service.find_closest_match(word, max_edit,
+                                                                    neighbour_check)
+                    self.assertListEqual(result, expected)
+
+        with patch("services.spellchecker_service.BASELINE_PREFILTER", "ngram"):
+            self.sp_service.add_word("bals")
+            self.sp_service.delete_word("bale")
+            result = self.sp_service.find_closest_match("balw", 1, True)
+        self.assertListEqual(result, ["bals(0.5)"])
+
+    def test_suggest_returns_closest_words_ranked_by_distance(self):
+        for word in ["art", "bale", "ball", "balm", "bawl", "car", "carbon", "carbonate"]:
+            self.sp_service.add_word(word)
+
+        result = self.sp_service.suggest("balw", 6)
+        self.assertListEqual(result, ["bale(1)", "ball(1)", "balm(1)", "bawl(1)",
+                                      "art(3)", "car(3)"])
+
+        result = self.sp_service.suggest("carbonat", 2)
+        self.assertListEqual(result, ["carbonate(1)", "carbon(2)"])
+
+        result = self.sp_service.suggest("balw", 3, None, True)
+        self.assertListEqual(result, ["bale(0.5)", "ball(1)", "balm(1)"])
+
+    def test_suggest_includes_correctly_spelled_word_and_respects_max_edit(self):
+        for word in ["art", "car", "carbon", "cart"]:
+            self.sp_service.add_word(word)
+
+        self.assertListEqual(self.sp_service.suggest("car", 3), ["car(0)", "cart(1)", "art(2)"])
+        self.assertListEqual(self.sp_service.suggest("carbo", 5, 1), ["carbon(1)"])
+        self.assertListEqual(self.sp_service.suggest("xyzzy", 5, 1), [])
+
+    def test_iterative_search_handles_keys_longer_than_the_recursion_limit(self):
+        trie = Trie()
+        trie.add("ab" * 525)
+        trie.add("ba" * 525)
+
+        result = calculate_dl_distance_iterative("ab" * 524 + "b", trie, 2)
+        self.assertListEqual(result, ["ab" * 525 + "(1)"])
+
+    def test_compiled_dictionary_snapshot_is_used_until_wordlist_changes(self):
+        wordlist = ["art", "bale", "ball", "balm", "bawl", "car", "carbon"]
+        for word in wordlist:
+            self.sp_service.add_word(word)
+
+        snapshot_repository.compile(wordlist_repository.get_wordlist(),
+                                    wordlist_repository.get_checksum())
+        with patch("services.spellchecker_service.TRIE_TYPE", "array"):
+            sp_service = SpellcheckerService()
+
+            self.assertIsInstance(sp_service._dictionary.get_buffers()[0], memoryview)
+            self.assertListEqual(sp_service.get_all(), wordlist)
+            result = sp_service.find_closest_match_recursively("balw")
+            self.assertEqual(result, ["bale(1)", "ball(1)", "balm(1)", "bawl(1)"])
+
+            sp_service.add_word("bawls")
+            sp_service = SpellcheckerService()
+            self.assertNotIsInstance(sp_service._dictionary.get_buffers()[0], memoryview)
+            self.assertEqual(sp_service.find_word("bawls"), True)
+
+    def test_dictionary_snapshot_is_only_used_with_the_array_trie(self):
+        for word in ["art", "car", "carbon"]:
+            self.sp_service.add_word(word)
+        snapshot_repository.compile(wordlist_repository.get_wordlist(),
+                                    wordlist_repository.get_checksum())
+
+        with patch("services.spellchecker_service.TRIE_TYPE", "dense"):
+            self.assertNotIsInstance(SpellcheckerService()._dictionary, ArrayTrie)
@@ -0,0 +1,54 @@
+import unittest
+from entities.symspell_index import SymSpellIndex
+from services.distance_service import calculate_dl_distance
+
+
+class TestSymSpellIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = SymSpellIndex(2)
+        self.words = ["art", "artist", "bale", "ball", "balm", "bawl",
+                      "car", "carbon", "carbonate", "zebra"]
+        for word in self.words:
+            self.index.add(word)
+
+    def test_adding_words_works_as_expected(self):
+        for word in self.words:
+            self.assertEqual(self.index.find(word), True)
+        for word in ["ar", "bal", "carbo", "zebras"]:
+            self.assertEqual(self.index.find(word), False)
+
+        self.assertListEqual(self.index.get_all(), self.words)
+        self.assertEqual(self.index.get_size(), len(self.words))
+        self.assertEqual(self.index.get_max_edit(), 2)
+
+    def test_adding_an_existing_word_does_not_change_the_index(self):
+        entry_count = self.index.get_entry_count()
+        self.index.add("ball")
+
+        self.assertEqual(self.index.get_size(), len(self.words))
+        self.assertEqual(self.index.get_entry_count(), entry_count)
+        self.assertEqual(self.index.lookup("ball").count("ball"), 1)
+
+    def test_lookup_finds_all_words_within_max_edit(self):
+        for misspelling in ["balw", "crabon", "carbonat", "atr", "zbera", "ratist", "xyz"]:
+            candidates = self.index.lookup(misspelling)
+            expected = [word for word in self.words
+                        if calculate_dl_distance(misspelling, word) <= 2]
+            self.assertListEqual([word for word in candidates if word in expected], expected)
+
+    def test_lookup_finds_transpositions(self):
+        self.assertIn("ball", self.index.lookup("blal"))
+        self.assertIn("carbon", self.index.lookup("acrbno"))
+
+    def test_removing_words_removes_their_deletions(self):
+        index = SymSpellIndex(1)
+        index.add("car")
+        entry_count = index.get_entry_count()
+        index.add("cart")
+
+        self.assertEqual(index.remove("cart"), True)
+        self.assertEqual(index.remove("cart"), False)
+        self.assertEqual(index.find("cart"), False)
+        self.assertEqual(index.get_entry_count(), entry_count)
+        self.assertListEqual(index.lookup("carts"), [])
+        self.assertListEqual(index.lookup("cat"), ["car"])
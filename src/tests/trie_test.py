@@ -70,3 +70,97 @@ class TestTrie(unittest.TestCase):
             self.trie.add(word)
         count = self.trie.get_size()
         self.assertEqual(count, len(words))
+
+    def test_removing_a_word_keeps_words_sharing_its_prefix(self):
+        for word in ["car", "carbon", "cart"]:
+            self.trie.add(word)
+
+        self.assertEqual(self.trie.remove("carbon"), True)
+        self.assertEqual(self.trie.find("carbon"), False)
+        self.assertListEqual(self.trie.get_all(), ["car", "cart"])
+        self.assertEqual(self.trie.get_root().get_child(2).get_child(0)
+                         .get_child(17).get_child(1), None)
+
+    def test_removing_a_word_not_in_the_trie_returns_False(self):
+        self.trie.add("carbon")
+
+        self.assertEqual(self.trie.remove("car"), False)
+        self.assertEqual(self.trie.remove("bar"), False)
+        self.assertEqual(self.trie.get_size(), 1)
+
+    def test_size_and_max_keylength_are_updated_when_removing_words(self):
+        for word in ["art", "artist", "banana", "car", "carbon", "car"]:
+            self.trie.add(word)
+        self.assertEqual(self.trie.get_size(), 5)
+        self.assertEqual(self.trie.get_max_keylength(), 6)
+
+        self.trie.remove("artist")
+        self.assertEqual(self.trie.get_max_keylength(), 6)
+        self.trie.remove("banana")
+        self.trie.remove("carbon")
+        self.assertEqual(self.trie.get_size(), 2)
+        self.assertEqual(self.trie.get_max_keylength(), 3)
+
+    def test_length_bounds_are_kept_up_to_date(self):
+        for word in ["car", "carbon", "cart", "art"]:
+            self.trie.add(word)
+
+        root = self.trie.get_root()
+        car = root.get_child(2).get_child(0).get_child(17)
+        self.assertEqual(self.trie.get_length_bounds(root), (3, 6))
+        self.assertEqual(self.trie.get_length_bounds(car), (0, 3))
+
+        self.trie.remove("carbon")
+        self.assertEqual(self.trie.get_length_bounds(root), (3, 4))
+        self.assertEqual(self.trie.get_length_bounds(car), (0, 1))
+
+        self.trie.remove("car")
+        self.assertEqual(self.trie.get_length_bounds(car), (1, 1))
+
+
+class TestCompactTrie(unittest.TestCase):
+    def setUp(self):
+        self.trie = Trie(True)
+
+    def test_adding_words_to_a_compact_trie_works_as_expected(self):
+        words = ["zebra", "car", "art", "carbon", "artist", "banana"]
+        for word in words:
+            self.trie.add(word)
+
+        for word in words:
+            self.assertEqual(self.trie.find(word), True)
+        self.assertEqual(self.trie.find("ca"), False)
+        self.assertEqual(self.trie.find("bar"), False)
+
+        self.assertListEqual(self.trie.get_all(), sorted(words))
+        self.assertEqual(self.trie.get_size(), len(words))
+
+    def test_compact_node_children_are_returned_in_alphabetical_order(self):
+        for word in ["z", "a", "m", "b"]:
+            self.trie.add(word)
+
+        children = self.trie.get_root().get_children()
+        indices = [index for index, child in children]
+        self.assertListEqual(indices, [0, 1, 12, 25])
+
+    def test_removing_a_child_from_a_compact_node_works(self):
+        self.trie.add("a")
+        self.trie.add("b")
+        root = self.trie.get_root()
+
+        root.set_child(0, None)
+
+        self.assertEqual(root.get_child(0), None)
+        self.assertEqual(len(root.get_children()), 1)
+        self.assertEqual(self.trie.find("b"), True)
+
+    def test_removing_words_from_a_compact_trie_works(self):
+        for word in ["art", "artist", "banana"]:
+            self.trie.add(word)
+
+        self.trie.remove("artist")
+        self.trie.remove("banana")
+
+        self.assertListEqual(self.trie.get_all(), ["art"])
+        self.assertEqual(len(self.trie.get_root().get_children()), 1)
+        self.assertEqual(self.trie.get_max_keylength(), 3)
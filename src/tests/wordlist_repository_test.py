@@ -1,4 +1,5 @@
 import unittest
+from config import WORDLIST_PATH
 from repositories.wordlist_repository import wordlist_repository
 from services.alphabet_utils import get_allowed_chars
 
@@ -49,3 +50,24 @@ class TestWordlistRepository(unittest.TestCase):
         wordlist =  wordlist_repository.get_wordlist()
         self.assertEqual(len(wordlist), len(self.words))
         self.assertNotIn(non_letter_word, wordlist)
+
+    def test_deleting_a_word_from_wordlist_works(self):
+        for word in self.words:
+            wordlist_repository.add(word)
+
+        wordlist_repository.delete("carbon")
+
+        wordlist = wordlist_repository.get_wordlist()
+        self.assertEqual(len(wordlist), len(self.words) - 1)
+        self.assertNotIn("carbon", wordlist)
+        self.assertIn("car", wordlist)
+
+    def test_deleting_a_word_keeps_rows_with_characters_not_in_alphabet(self):
+        for word in ["Apple", "art", "x-ray", "carbon", "art"]:
+            wordlist_repository.add(word)
+
+        wordlist_repository.delete("art")
+
+        with open(WORDLIST_PATH, encoding="utf-8") as file:
+            self.assertEqual(file.read(), "Apple\nx-ray\ncarbon\n")
+        self.assertListEqual(wordlist_repository.get_wordlist(), ["carbon"])
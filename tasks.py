@@ -5,6 +5,14 @@ from invoke import task
 def start(ctx):
     ctx.run("python3 src/index.py", pty=True)
 
+@task
+def compile_dictionary(ctx):
+    ctx.run("python3 src/compile_dictionary.py", pty=True)
+
+@task
+def compile_corrections(ctx):
+    ctx.run("python3 src/compile_corrections.py", pty=True)
+
 @task
 def test(ctx):
     ctx.run("pytest src", pty=True)
@@ -24,3 +32,7 @@ def coverage_report(ctx):
 @task
 def performance_test(ctx):
   ctx.run("python3 src/tests/performance_tester.py")
+
+@task
+def benchmark(ctx):
+  ctx.run("python3 src/tests/benchmark.py")